@@ -9,8 +9,57 @@ demonstrate that the sun has not (yet) set over the BOT.
 """
 
 # Import sub-functions ...
+from .add_background import add_background
+from .build_sun_index import build_sun_index
+from .build_validity_index import build_validity_index
+from .calc_horizon_dip import calc_horizon_dip
+from .calc_sun_ephem import calc_sun_ephem
+from .calc_sun_numpy import calc_sun_numpy
+from .calc_sun_position import calc_sun_position
+from .calc_sun_terminator import calc_sun_terminator
+from .calc_sun_territories import calc_sun_territories
+from .calc_sun_times import calc_sun_times
+from .calc_sunless_gaps import calc_sunless_gaps
+from .calc_territory_fingerprint import calc_territory_fingerprint
+from .calc_territory_framing import calc_territory_framing
+from .calc_territory_framings import calc_territory_framings
+from .classify_polar_points import classify_polar_points
+from .convert_db import convert_db
+from .coverage_between import coverage_between
 from .create_db import create_db
 from .create_map import create_map
 from .create_maps import create_maps
+from .create_synthetic_shapefile import create_synthetic_shapefile
 from .create_timeline import create_timeline
+from .find_dem_peaks import find_dem_peaks
+from .find_start_date import find_start_date
+from .iter_sun_events import iter_sun_events
+from .load_country_polys import load_country_polys
+from .load_db import load_db
+from .load_dem import load_dem
+from .load_geometry_cache import load_geometry_cache
+from .load_sun_cache import load_sun_cache
+from .load_territory_coords import load_territory_coords
+from .next_sunset_gap import next_sunset_gap
+from .optimise_png import optimise_png
+from .prune_coords import prune_coords
+from .queue_optimisation import queue_optimisation
+from .record_count import record_count
 from .run import run
+from .run_benchmarks import run_benchmarks
+from .run_stages import run_stages
+from .sample_dem import sample_dem
+from .save_db import save_db
+from .save_geometry_cache import save_geometry_cache
+from .save_sun_cache import save_sun_cache
+from .save_sunless_gaps import save_sunless_gaps
+from .serve_sun_index import serve_sun_index
+from .simplify_country_polys import simplify_country_polys
+from .start_optimisations import start_optimisations
+from .start_report import start_report
+from .start_stage import start_stage
+from .stop_optimisations import stop_optimisations
+from .stop_report import stop_report
+from .stop_stage import stop_stage
+from .sunlit_at import sunlit_at
+from .write_sun_events import write_sun_events
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.12/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    # Import standard modules ...
+    import argparse
+
+    # Import my modules ...
+    from . import run
+
+    # Create argument parser and parse the arguments ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "Run BOTS (see \"bots.run()\").",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "dirOut",
+        help = "the path to save the database and PNGs in",
+    )
+    parser.add_argument(
+        "--debug",
+        action = "store_true",
+          help = "print debug messages",
+    )
+    parser.add_argument(
+        "--engine",
+        choices = ["ephem", "numpy", "terminator"],
+        default = "ephem",
+           help = "the engine used to calculate the sunrises and sunsets",
+    )
+    parser.add_argument(
+        "--horizon",
+         action = "append",
+           dest = "horizons",
+           help = "the altitude of the centre of the Sun at sunrise and sunset (in degrees) to also draw in the timeline, e.g., \"-6\" for civil twilight (may be given more than once, the default horizon is always drawn first)",
+        metavar = "ALT",
+           type = float,
+    )
+    parser.add_argument(
+        "--n",
+        default = 10,
+           help = "the number of days to survey",
+           type = int,
+    )
+    parser.add_argument(
+        "--only",
+         action = "append",
+           dest = "targets",
+           help = "the output to make (if it is out of date), out of: \"db\"; \"maps\", or \"maps/\" followed by the name of a territory; \"timeline\"; and \"gaps\" (may be given more than once, if not given then all of them are made, except that the database is only made if it does not exist)",
+        metavar = "TARGET",
+    )
+    parser.add_argument(
+        "--workers",
+        default = 1,
+           help = "the number of processes to use",
+           type = int,
+    )
+    args = parser.parse_args()
+
+    # Run BOTS ...
+    run(
+        args.dirOut,
+          debug = args.debug,
+         engine = args.engine,
+       horizons = None if args.horizons is None else [None] + args.horizons,
+              n = args.n,
+        targets = args.targets,
+        workers = args.workers,
+    )
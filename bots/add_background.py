@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+
+# Create cache ...
+# NOTE: This is a per-process cache, so that a process which creates many maps
+#       (see "create_maps()") only decodes each background image once.
+_images = {}
+
+# Define function ...
+def add_background(
+    ax,
+    /,
+    *,
+         debug = __debug__,
+          name = "natural-earth-1",
+    resolution = "large0512px",
+):
+    """Add an image of a map as a background to a Cartopy axis
+
+    This function adds a background image using
+    :func:`pyguymer3.geo.add_map_background`, but it keeps the decoded image
+    for the lifetime of the process rather than reading it again for every map.
+
+    Parameters
+    ----------
+    ax : cartopy.mpl.geoaxes.GeoAxesSubplot
+        the axis to add the background image to
+    debug : bool, optional
+        print debug messages
+    name : str, optional
+        the name of the image in "images.json"
+    resolution : str, optional
+        the resolution of the image in "images.json"
+
+    Notes
+    -----
+    :func:`pyguymer3.geo.add_map_background` draws either the user-requested
+    image (with :meth:`cartopy.mpl.geoaxes.GeoAxes.background_img`, without its
+    cache) or the stock image of cartopy (with
+    :meth:`cartopy.mpl.geoaxes.GeoAxes.stock_img`), which both decode the image
+    every time. Therefore, the function which cartopy uses to decode them is
+    swapped for one which keeps the decoded images whilst it is drawn.
+    """
+
+    # Import standard modules ...
+    import pathlib
+
+    # Import special modules ...
+    try:
+        import cartopy
+        cartopy.config.update(
+            {
+                "cache_dir" : pathlib.PosixPath("~/.local/share/cartopy").expanduser(),
+            }
+        )
+        import cartopy.mpl.geoaxes
+    except:
+        raise Exception("\"cartopy\" is not installed; run \"pip install --user Cartopy\"") from None
+    try:
+        import matplotlib
+        import matplotlib.image
+    except:
+        raise Exception("\"matplotlib\" is not installed; run \"pip install --user matplotlib\"") from None
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+        import pyguymer3.geo
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # Create short-hand function to decode an image (if needed) ...
+    def imread(fname, /, *args, **kwargs):
+        if str(fname) not in _images:
+            if debug:
+                print(f"INFO: Decoding \"{fname}\".")
+            _images[str(fname)] = matplotlib.image.imread(fname, *args, **kwargs)
+        return _images[str(fname)]
+
+    # Draw background image (using the decoded images of this process) ...
+    orig = cartopy.mpl.geoaxes.imread
+    cartopy.mpl.geoaxes.imread = imread
+    try:
+        pyguymer3.geo.add_map_background(
+            ax,
+                 debug = debug,
+                  name = name,
+            resolution = resolution,
+        )
+    finally:
+        cartopy.mpl.geoaxes.imread = orig
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def build_sun_index(
+    results,
+    d0,
+    n,
+    /,
+    *,
+    kind = "any",
+):
+    """Build an index of the sunlit intervals of all of the territories
+
+    This function merges the daily sunlit intervals of each territory into
+    sorted, disjoint intervals, and does the same for the union of all of the
+    territories, so that point-in-time and range queries only need a binary
+    search (see :func:`sunlit_at`, :func:`coverage_between` and
+    :func:`next_sunset_gap`).
+
+    Parameters
+    ----------
+    results : dict
+        the earliest sunrise, the latest sunrise, the earliest sunset and the
+        latest sunset of each day of each territory, as an (n, 4) array (in
+        seconds since the POSIX epoch), see :func:`calc_sun_territories`
+    d0 : datetime.datetime
+        the start of the survey (in UTC)
+    n : int
+        the number of days to survey
+    kind : str, optional
+        the kind of sunlight (either "any", where a territory is sunlit when any
+        of its points are, or "all", where a territory is only sunlit when all
+        of its points are)
+
+    Returns
+    -------
+    index : dict
+        the index
+
+    Notes
+    -----
+    The index holds the start and the end (in seconds since the POSIX epoch)
+    of the survey (which, like :func:`calc_sunless_gaps`, leaves out the first
+    day and the last day), and, for each territory and for their union
+    ("BOT"), the starts and the ends of the sunlit intervals along with the
+    cumulative sunlit time at the start of each interval. The union also has
+    the starts and the ends of the gaps between its intervals.
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Check kind ...
+    match kind:
+        case "any":
+            iLeft, iRight = 0, 3
+        case "all":
+            iLeft, iRight = 1, 2
+        case _:
+            raise Exception(f"\"kind\" is an unexpected value ({repr(kind)})") from None
+
+    # Create short-hand function to merge some intervals into sorted, disjoint
+    # intervals ...
+    def merge_intervals(lefts, rights):
+        if lefts.size == 0:
+            return {
+                "starts" : lefts,
+                  "ends" : rights,
+                   "cum" : numpy.zeros(0, dtype = numpy.int64),
+            }
+        order = numpy.argsort(lefts, kind = "stable")
+        lefts = lefts[order]                                                    # [s]
+        rights = numpy.maximum.accumulate(rights[order])                        # [s]
+        starts = numpy.concatenate(([True], lefts[1:] > rights[:-1]))
+        inds = numpy.flatnonzero(starts)
+        ends = numpy.concatenate((rights[inds[1:] - 1], rights[-1:]))           # [s]
+        return {
+            "starts" : lefts[inds],
+              "ends" : ends,
+               "cum" : numpy.concatenate(([0], numpy.cumsum(ends - lefts[inds])[:-1])),
+        }
+
+    # Create index ...
+    index = {
+             "tStart" : int(d0.timestamp()) + 86400,
+              "tStop" : int(d0.timestamp()) + 86400 * (n - 1),
+        "territories" : {},
+    }
+
+    # Loop over territories ...
+    allLefts = []
+    allRights = []
+    for territory, arr in results.items():
+        # Find the sunlit intervals, clipped to the survey ...
+        # NOTE: The days on which no points are valid keep the initial values
+        #       of the counters (see "calc_sun_ephem()").
+        lefts = numpy.clip(arr[:, iLeft].astype(numpy.int64), index["tStart"], index["tStop"])     # [s]
+        rights = numpy.clip(arr[:, iRight].astype(numpy.int64), index["tStart"], index["tStop"])   # [s]
+        valid = (arr[:, 0] < pow(2, 62)) & (lefts < rights)
+        allLefts.append(lefts[valid])
+        allRights.append(rights[valid])
+
+        # Merge the sunlit intervals ...
+        index["territories"][territory] = merge_intervals(lefts[valid], rights[valid])
+
+    # Merge the sunlit intervals of all of the territories ...
+    index["BOT"] = merge_intervals(
+        numpy.concatenate([numpy.zeros(0, dtype = numpy.int64)] + allLefts),
+        numpy.concatenate([numpy.zeros(0, dtype = numpy.int64)] + allRights),
+    )
+
+    # Find the gaps between the sunlit intervals of all of the territories ...
+    edges = numpy.concatenate(([index["tStart"]], index["BOT"]["ends"]))        # [s]
+    nexts = numpy.concatenate((index["BOT"]["starts"], [index["tStop"]]))       # [s]
+    index["BOT"]["gapStarts"] = edges[edges < nexts]                            # [s]
+    index["BOT"]["gapEnds"] = nexts[edges < nexts]                              # [s]
+
+    # Return answer ...
+    return index
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def build_validity_index(
+    territories,
+    d0,
+    n,
+    /,
+):
+    """Build an index of which territories and groups of points are valid
+
+    This function splits a survey into runs of consecutive days on which the
+    same territories, and the same groups of points within each territory
+    (one group per country and per location, see :func:`create_db`), are
+    valid, so that the sunrises and sunsets of each run can be calculated
+    without checking the validity of anything on each day.
+
+    Parameters
+    ----------
+    territories : dict
+        the database
+    d0 : datetime.datetime
+        the start of the survey (in UTC)
+    n : int
+        the number of days to survey
+
+    Returns
+    -------
+    index : dict
+        the runs of each territory, as a list of (first day, last day + 1,
+        groups) tuples (where the days are counted from the start of the
+        survey and the groups are the entries of the "groups" of the territory
+        in the database), which omits the days on which the territory (or
+        every one of its groups) is not valid
+
+    Notes
+    -----
+    A "validity" is a list of [start, stop) intervals, each of which is a pair
+    of ISO 8601 dates (or None, for an interval which is open at that end),
+    which are assumed to be in UTC if they are naïve. A day is valid if its
+    start is within any of the intervals and anything without a "validity" is
+    always valid. A territory in a database which was made before there were
+    groups is treated as having a single group of all of its points.
+    """
+
+    # Import standard modules ...
+    import datetime
+    import math
+
+    # Create short-hand function to convert a date to the index of the first
+    # day which starts at or after it ...
+    def to_day(value, default):
+        if value is None:
+            return default
+        d = datetime.datetime.fromisoformat(value)
+        if d.tzinfo is None:
+            d = d.replace(tzinfo = datetime.UTC)
+        return min(max(math.ceil((d - d0).total_seconds() / 86400.0), 0), n)
+
+    # Create short-hand function to convert a validity to a list of runs of
+    # days ...
+    def to_runs(validity):
+        if validity is None:
+            return [(0, n)]
+        return [(to_day(start, 0), to_day(stop, n)) for start, stop in validity]
+
+    # Create short-hand function to check if a day is in a list of runs of
+    # days ...
+    def is_valid(runs, i):
+        return any(i0 <= i < i1 for i0, i1 in runs)
+
+    # Initialize index ...
+    index = {}
+
+    # Loop over territories ...
+    for territory, info in territories.items():
+        # Find the groups of the territory ...
+        if "groups" in info:
+            groups = info["groups"]
+        else:
+            groups = [
+                {
+                                "coords" : (0, len(info["coords"])),
+                    "extremalCoords" : (0, len(info.get("extremalCoords", info["coords"]))),
+                } | {key : info[key] for key in ["countries", "locations"] if key in info}
+            ]
+
+        # Find the runs of days of the territory and of each group ...
+        terrRuns = to_runs(info.get("validity"))
+        groupRuns = [to_runs(group.get("validity")) for group in groups]
+
+        # Find all of the days on which anything changes ...
+        edges = {0, n}
+        for runs in [terrRuns] + groupRuns:
+            for i0, i1 in runs:
+                edges |= {i0, i1}
+        edges = sorted(edges)
+
+        # Loop over the runs of days between the changes ...
+        index[territory] = []
+        for i0, i1 in zip(edges[:-1], edges[1:]):
+            if i0 >= i1 or not is_valid(terrRuns, i0):
+                continue
+
+            # Find the groups which are valid on this run of days ...
+            valid = [group for group, runs in zip(groups, groupRuns, strict = True) if is_valid(runs, i0)]
+            if len(valid) == 0:
+                continue
+
+            # Extend the previous run of days if it has the same groups, or
+            # start a new one ...
+            if len(index[territory]) > 0 and index[territory][-1][1] == i0 and index[territory][-1][2] == valid:
+                index[territory][-1] = (index[territory][-1][0], i1, valid)
+            else:
+                index[territory].append((i0, i1, valid))
+
+    # Return answer ...
+    return index
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def calc_horizon_dip(
+    elevs,
+    /,
+):
+    """Calculate the dip of the horizon of some observers
+
+    This function calculates how far below the astronomical horizon the
+    visible (sea) horizon is for observers at some elevations.
+
+    Parameters
+    ----------
+    elevs : numpy.ndarray
+        the elevations of the observers (in metres)
+
+    Returns
+    -------
+    dips : numpy.ndarray
+        the dips of the horizon (in degrees)
+
+    Notes
+    -----
+    The dip is "1.76 × √h" arcminutes (with "h" in metres), which allows for
+    the usual terrestrial refraction. Observers below sea level (and observers
+    whose elevation is unknown, i.e., NaN) have no dip. The dip is also
+    (approximately) the angular distance to the horizon, so the Sun rises at
+    an elevated observer when it rises at sea level that far towards it.
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Return answer ...
+    elevs = numpy.nan_to_num(numpy.asarray(elevs, dtype = numpy.float64), nan = 0.0)    # [m]
+    return 1.76 * numpy.sqrt(numpy.maximum(elevs, 0.0)) / 60.0                  # [°]
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def calc_sun_ephem(
+    coords,
+    d0,
+    n,
+    /,
+    *,
+    horizons = None,
+):
+    """Calculate the extreme sunrises and sunsets of some coordinates using
+    ephem
+
+    This function calculates the earliest and latest sunrises and sunsets of a
+    set of coordinates for each day in a survey by asking ephem to find the next
+    rising and setting of the Sun for every coordinate on every day, apart from
+    the coordinates which are certainly in polar day or polar night (see
+    :func:`classify_polar_points`).
+
+    Parameters
+    ----------
+    coords : list of tuples of floats
+        the (longitude, latitude) coordinates (in degrees), or the (longitude,
+        latitude, elevation) coordinates (in degrees, degrees and metres) if
+        the dip of the horizon should be allowed for (see
+        :func:`calc_horizon_dip`)
+    d0 : datetime.datetime
+        the start of the survey (in UTC)
+    n : int
+        the number of days to survey
+    horizons : list of floats, optional
+        the altitudes of the centre of the Sun at sunrise and sunset (in
+        degrees), where None means the default horizon (see
+        :func:`calc_sun_times`), which are all calculated for each coordinate
+        on each day before moving on to the next one (if None then just the
+        default horizon is calculated)
+
+    Returns
+    -------
+    risMins : numpy.ndarray
+        the earliest sunrise of each day (in seconds since the POSIX epoch)
+    risMaxs : numpy.ndarray
+        the latest sunrise of each day (in seconds since the POSIX epoch)
+    setMins : numpy.ndarray
+        the earliest sunset of each day (in seconds since the POSIX epoch)
+    setMaxs : numpy.ndarray
+        the latest sunset of each day (in seconds since the POSIX epoch)
+
+    Notes
+    -----
+    If "horizons" is not None then the returned arrays have one row per day and
+    one column per horizon. The default horizon uses ephem's default air
+    temperature and pressure, whilst the other horizons use the centre of the
+    Sun without any refraction (which is how ephem defines twilight). The
+    horizon of an elevated coordinate is lowered by its dip.
+
+    A coordinate which is in polar day on a day is treated as though the Sun
+    rises at the start of the day and sets at the end of the day, so that a
+    territory which is partly in polar day is sunlit all day, and a coordinate
+    where the Sun rises but does not set again (on the first day of polar day)
+    is treated as though the Sun sets at the end of the day. A coordinate
+    which is in polar night on a day is skipped for that day, as are
+    coordinates which ephem finds never see the Sun. The days on which every
+    coordinate is skipped keep the initial values of the counters. Polar day
+    and polar night are classified in the same way as in
+    :func:`calc_sun_numpy`, so that the two engines agree on them.
+    """
+
+    # Import standard modules ...
+    import datetime
+    import math
+
+    # Import special modules ...
+    try:
+        import ephem
+    except:
+        raise Exception("\"ephem\" is not installed; run \"pip install --user ephem\"") from None
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .calc_horizon_dip import calc_horizon_dip
+    from .classify_polar_points import classify_polar_points
+    from .record_count import record_count
+
+    # Create observer ...
+    obs = ephem.Observer()
+    pressure = obs.pressure                                                     # [mbar]
+
+    # Convert list of horizons ...
+    hs = [None] if horizons is None else list(horizons)
+
+    # Classify the coordinates on every day for every horizon ...
+    jd0 = d0.timestamp() / 86400.0 + 2440587.5                                  # [day]
+    lats = numpy.array([coord[1] for coord in coords], dtype = numpy.float64)   # [°]
+    dips = calc_horizon_dip([coord[2] if len(coord) > 2 else 0.0 for coord in coords])  # [°]
+    polarDay, polarNight = classify_polar_points(
+        numpy.tile(lats, len(hs)),
+        jd0 + numpy.arange(n, dtype = numpy.float64).reshape(-1, 1),
+            dip = numpy.tile(dips, len(hs)),
+        horizon = numpy.repeat(
+            numpy.array([numpy.nan if h is None else h for h in hs], dtype = numpy.float64),
+            lats.size,
+        ),
+    )
+    polarDay = polarDay.reshape(n, len(hs), lats.size)
+    polarNight = polarNight.reshape(n, len(hs), lats.size)
+
+    # Convert start date ...
+    t0 = d0.timestamp()                                                         # [s]
+    d0 = ephem.Date(d0)
+
+    # Create empty lists ...
+    risMins = numpy.zeros((n, len(hs)), dtype = numpy.int64)                    # [s]
+    risMaxs = numpy.zeros((n, len(hs)), dtype = numpy.int64)                    # [s]
+    setMins = numpy.zeros((n, len(hs)), dtype = numpy.int64)                    # [s]
+    setMaxs = numpy.zeros((n, len(hs)), dtype = numpy.int64)                    # [s]
+
+    # Initialize the counters of the report ...
+    nCoords = 0                                                                 # [#]
+    nCalls = 0                                                                  # [#]
+    nAlwaysUp = 0                                                               # [#]
+    nNeverUp = 0                                                                # [#]
+
+    # Loop over days ...
+    for i in range(n):
+        # Initialize counters ...
+        risMins[i, :] = pow(2, 62)                                              # [s]
+        setMins[i, :] = pow(2, 62)                                              # [s]
+
+        # Loop over coordinates ...
+        for j, coord in enumerate(coords):
+            # Skip coordinates which are in polar night for every horizon ...
+            if polarNight[i, :, j].all():
+                continue
+
+            # Update observer ...
+            # HACK: Must be a crude string otherwise it does not set it
+            #       correctly.
+            obs.long = str(coord[0])                                            # [°]
+            obs.lat = str(coord[1])                                             # [°]
+
+            # Loop over horizons ...
+            for k, h in enumerate(hs):
+                # Skip coordinates which are in polar night ...
+                if polarNight[i, k, j]:
+                    continue
+                nCoords += 1                                                    # [#]
+
+                # Treat coordinates which are in polar day as though the Sun
+                # rises at the start of the day and sets at the end of the day,
+                # otherwise find sunrise and sunset as 'naïve' datetime objects
+                # in UTC ...
+                # NOTE: A coordinate which is close to polar day (or polar
+                #       night) may still not see the Sun rise or set.
+                t1 = t0 + 86400.0 * i                                           # [s]
+                t2 = t0 + 86400.0 * (i + 1)                                     # [s]
+                if not polarDay[i, k, j]:
+                    # Update observer ...
+                    # NOTE: The dip of the horizon already allows for the
+                    #       terrestrial refraction, so an elevated coordinate
+                    #       uses the fixed atmospheric refraction at the horizon
+                    #       of "calc_sun_times()" rather than ephem's.
+                    if h is None and dips[j] > 0.0:
+                        obs.horizon = str(-(37.25 / 60.0 + dips[j]))            # [°]
+                        obs.pressure = 0.0                                      # [mbar]
+                    elif h is None:
+                        obs.horizon = "0"                                       # [°]
+                        obs.pressure = pressure                                 # [mbar]
+                    else:
+                        obs.horizon = str(h - dips[j])                          # [°]
+                        obs.pressure = 0.0                                      # [mbar]
+
+                    # NOTE: ephem decides whether the Sun is always (or never)
+                    #       up from its declination at the time which it is
+                    #       given, so on the last day of polar day (or on the
+                    #       day before the Sun rises once more, or not, around
+                    #       the start of polar night) it can raise an error
+                    #       even though the Sun rises on the next day, which is
+                    #       then the first sunrise after the start of the day
+                    #       (just as in "calc_sun_times()"). Therefore, ephem is
+                    #       asked again from the start of the next day.
+                    d1 = None
+                    neverUp = False
+                    for k2 in range(2):
+                        nCalls += 1                                             # [#]
+                        try:
+                            d1 = obs.next_rising(ephem.Sun(), ephem.Date(d0 + i + k2), use_center = h is not None).datetime()
+                            break
+                        except ephem.AlwaysUpError:
+                            nAlwaysUp += 1                                      # [#]
+                            neverUp = False
+                        except ephem.NeverUpError:
+                            nNeverUp += 1                                       # [#]
+                            neverUp = True
+                    if d1 is None and neverUp:
+                        continue
+                    if d1 is not None:
+                        # Convert sunrise to an 'aware' datetime object in
+                        # UTC ...
+                        d1 = d1.replace(tzinfo = datetime.UTC)
+
+                        # Convert sunrise to a float since the POSIX epoch ...
+                        # NOTE: There used to be many clunky ways of converting
+                        #       a datetime object into a number. The neatest way
+                        #       uses "strftime()" but this is bad for two
+                        #       reasons:
+                        #         1) it is not supported on Windows; and
+                        #         2) it ignores the "tzinfo" data.
+                        #       This last point took over an hour to identify.
+                        #       The following two threads put me out of my
+                        #       misery:
+                        #         1) https://stackoverflow.com/a/19801863; and
+                        #         2) https://bugs.python.org/issue12750#msg142245
+                        #       Then Python 3.3 came along and added the
+                        #       ".timestamp()" method.
+                        t1 = d1.timestamp()                                     # [s]
+
+                        # Find sunset as an 'aware' datetime object in UTC and
+                        # convert it to a float since the POSIX epoch ...
+                        nCalls += 1                                             # [#]
+                        try:
+                            d2 = obs.next_setting(ephem.Sun(), ephem.Date(d1), use_center = h is not None).datetime()
+                            t2 = d2.replace(tzinfo = datetime.UTC).timestamp()  # [s]
+                        except ephem.AlwaysUpError:
+                            nAlwaysUp += 1                                      # [#]
+                            t2 = max(t1, t2)                                    # [s]
+                        except ephem.NeverUpError:
+                            nNeverUp += 1                                       # [#]
+                            continue
+
+                # Overwrite counters if needed ...
+                # NOTE: The maximums are overwritten by the first valid
+                #       coordinate, as times before the POSIX epoch are
+                #       negative.
+                first = risMins[i, k] == pow(2, 62)
+                risMins[i, k] = min(math.floor(t1), risMins[i, k])              # [s]
+                risMaxs[i, k] = math.floor(t1) if first else max(math.floor(t1), risMaxs[i, k]) # [s]
+                setMins[i, k] = min(math.floor(t2), setMins[i, k])              # [s]
+                setMaxs[i, k] = math.floor(t2) if first else max(math.floor(t2), setMaxs[i, k]) # [s]
+
+    # Add to the counters of the report ...
+    record_count("coordinatesEvaluated", nCoords)
+    record_count("ephemCalls", nCalls)
+    record_count("ephemAlwaysUpErrors", nAlwaysUp)
+    record_count("ephemNeverUpErrors", nNeverUp)
+
+    # Return answers ...
+    if horizons is None:
+        return risMins[:, 0], risMaxs[:, 0], setMins[:, 0], setMaxs[:, 0]
+    return risMins, risMaxs, setMins, setMaxs
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def calc_sun_numpy(
+    coords,
+    d0,
+    n,
+    /,
+    *,
+       chunk = 1048576,
+    horizons = None,
+       nIter = 3,
+):
+    """Calculate the extreme sunrises and sunsets of some coordinates using
+    NumPy
+
+    This function calculates the earliest and latest sunrises and sunsets of a
+    set of coordinates for each day in a survey using the closed-form solar
+    declination, equation of time and hour angle. All of the coordinates and
+    all of the days are calculated at once as arrays.
+
+    Parameters
+    ----------
+    coords : list of tuples of floats
+        the (longitude, latitude) coordinates (in degrees), or the (longitude,
+        latitude, elevation) coordinates (in degrees, degrees and metres) if
+        the dip of the horizon should be allowed for (see
+        :func:`calc_horizon_dip`)
+    d0 : datetime.datetime
+        the start of the survey (in UTC)
+    n : int
+        the number of days to survey
+    chunk : int, optional
+        the maximum number of (day, coordinate, horizon) triplets to calculate
+        at once
+    horizons : list of floats, optional
+        the altitudes of the centre of the Sun at sunrise and sunset (in
+        degrees), where None means the default horizon (see
+        :func:`calc_sun_times`), which are all calculated at once (if None then
+        just the default horizon is calculated)
+    nIter : int, optional
+        the number of iterations used to refine the time of each sunrise and
+        sunset
+
+    Returns
+    -------
+    risMins : numpy.ndarray
+        the earliest sunrise of each day (in seconds since the POSIX epoch)
+    risMaxs : numpy.ndarray
+        the latest sunrise of each day (in seconds since the POSIX epoch)
+    setMins : numpy.ndarray
+        the earliest sunset of each day (in seconds since the POSIX epoch)
+    setMaxs : numpy.ndarray
+        the latest sunset of each day (in seconds since the POSIX epoch)
+
+    Notes
+    -----
+    If "horizons" is not None then the returned arrays have one row per day and
+    one column per horizon.
+
+    By default, the Sun is deemed to have risen (or set) when its upper limb is on the
+    horizon, allowing for 37.25 arcminutes of atmospheric refraction, which is
+    the same definition that ephem uses with its default air temperature and
+    pressure. Away from the polar circles the sunrises and sunsets agree with
+    the ones from :func:`calc_sun_ephem` to within 5 seconds; within the polar
+    circles, where the Sun skims the horizon and the time of a sunrise (or
+    sunset) becomes very sensitive to its altitude, they agree to within 5
+    minutes except on the days when the Sun only just rises (or sets) and the
+    two engines disagree on whether it rises (or sets) at all.
+
+    Like :func:`calc_sun_ephem`, a coordinate which is in polar day on a day
+    (see :func:`classify_polar_points`) is treated as though the Sun rises at
+    the start of the day and sets at the end of the day, a coordinate where the
+    Sun rises but does not set again (on the first day of polar day) is treated
+    as though the Sun sets at the end of the day, and any other coordinates
+    where the Sun does not rise or set on a day are skipped for that day.
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .calc_horizon_dip import calc_horizon_dip
+    from .calc_sun_times import calc_sun_times
+    from .classify_polar_points import classify_polar_points
+    from .record_count import record_count
+
+    # Convert list of coordinates to arrays ...
+    coords = numpy.array(coords, dtype = numpy.float64)                         # [°]
+    coords = coords.reshape(-1, coords.shape[1] if coords.ndim == 2 else 2)     # [°]
+
+    # Convert list of horizons to an array (using NaN for the default
+    # horizon) ...
+    hs = numpy.array(
+        [numpy.nan if horizon is None else horizon for horizon in ([None] if horizons is None else horizons)],
+        dtype = numpy.float64,
+    )                                                                           # [°]
+
+    # Repeat the coordinates for each horizon, so that all of the horizons are
+    # calculated at once ...
+    lons = numpy.tile(coords[:, 0], hs.size)                                    # [°]
+    lats = numpy.tile(coords[:, 1], hs.size)                                    # [°]
+    hcol = numpy.repeat(hs, coords.shape[0])                                    # [°]
+    if coords.shape[1] > 2:
+        dips = numpy.tile(calc_horizon_dip(coords[:, 2]), hs.size)              # [°]
+    else:
+        dips = 0.0                                                              # [°]
+
+    # Convert start date to a Julian Date ...
+    jd0 = d0.timestamp() / 86400.0 + 2440587.5                                  # [day]
+
+    # Create empty lists ...
+    risMins = numpy.zeros((n, hs.size), dtype = numpy.int64)                    # [s]
+    risMaxs = numpy.zeros((n, hs.size), dtype = numpy.int64)                    # [s]
+    setMins = numpy.zeros((n, hs.size), dtype = numpy.int64)                    # [s]
+    setMaxs = numpy.zeros((n, hs.size), dtype = numpy.int64)                    # [s]
+
+    # Initialize counters ...
+    risMins[:] = pow(2, 62)                                                     # [s]
+    setMins[:] = pow(2, 62)                                                     # [s]
+
+    # Check that there are some coordinates ...
+    if coords.shape[0] == 0:
+        if horizons is None:
+            return risMins[:, 0], risMaxs[:, 0], setMins[:, 0], setMaxs[:, 0]
+        return risMins, risMaxs, setMins, setMaxs
+
+    # Find out how many days to calculate at once ...
+    step = max(1, chunk // lons.size)                                           # [#]
+
+    # Loop over chunks of days ...
+    for i0 in range(0, n, step):
+        i1 = min(n, i0 + step)
+
+        # Find the first sunrise after the start of each day and the sunset
+        # which follows it ...
+        t0 = jd0 + numpy.arange(i0, i1, dtype = numpy.float64).reshape(-1, 1)  # [day]
+        ris, sets = calc_sun_times(
+            lons,
+            lats,
+            t0,
+                dip = dips,
+            horizon = hcol,
+              nIter = nIter,
+        )                                                                       # [day], [day]
+
+        # Treat coordinates where the Sun rises but does not set again (on the
+        # first day of polar day) as though the Sun sets at the end of the
+        # day, just like in "calc_sun_ephem()" ...
+        sets = numpy.where(numpy.isfinite(ris) & numpy.isnan(sets), t0 + 1.0, sets) # [day]
+
+        # Treat coordinates which are in polar day as though the Sun rises at
+        # the start of the day and sets at the end of the day ...
+        polarDay, _ = classify_polar_points(
+            lats,
+            t0,
+                dip = dips,
+            horizon = hcol,
+        )
+        ris = numpy.where(polarDay, t0, ris)                                    # [day]
+        sets = numpy.where(polarDay, t0 + 1.0, sets)                            # [day]
+
+        # Skip coordinates where the Sun does not rise or set ...
+        valid = numpy.isfinite(ris) & numpy.isfinite(sets)
+        valid = valid.reshape(i1 - i0, hs.size, coords.shape[0])
+
+        # Convert sunrise and sunset to floats since the POSIX epoch ...
+        t1 = (ris - 2440587.5).reshape(valid.shape) * 86400.0                   # [s]
+        t2 = (sets - 2440587.5).reshape(valid.shape) * 86400.0                  # [s]
+
+        # Overwrite counters if needed ...
+        # NOTE: The days on which no coordinates are valid keep the initial
+        #       values of the counters, just like in "calc_sun_ephem()".
+        anyValid = valid.any(axis = 2)
+        for arr, val, func, fill in [
+            (risMins, t1, numpy.min,  numpy.inf),
+            (risMaxs, t1, numpy.max, -numpy.inf),
+            (setMins, t2, numpy.min,  numpy.inf),
+            (setMaxs, t2, numpy.max, -numpy.inf),
+        ]:
+            tmp = func(numpy.where(valid, val, fill), axis = 2)                 # [s]
+            arr[i0:i1][anyValid] = numpy.floor(tmp[anyValid])                   # [s]
+
+    # Add to the counters of the report ...
+    record_count("coordinatesEvaluated", n * hs.size * coords.shape[0])
+
+    # Return answers ...
+    if horizons is None:
+        return risMins[:, 0], risMaxs[:, 0], setMins[:, 0], setMaxs[:, 0]
+    return risMins, risMaxs, setMins, setMaxs
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def calc_sun_position(
+    jd,
+    /,
+):
+    """Calculate the declination of the Sun, the equation of time and the
+    distance to the Sun
+
+    This function calculates the declination of the Sun, the equation of time
+    and the distance to the Sun for an array of Julian Dates using the
+    closed-form expressions from the NOAA Solar Calculator (which are themselves
+    based on "Astronomical Algorithms" by Jean Meeus).
+
+    Parameters
+    ----------
+    jd : numpy.ndarray
+        the Julian Dates
+
+    Returns
+    -------
+    decl : numpy.ndarray
+        the declination of the Sun (in radians)
+    eot : numpy.ndarray
+        the equation of time (in minutes)
+    dist : numpy.ndarray
+        the distance to the Sun (in astronomical units)
+
+    Notes
+    -----
+    See https://gml.noaa.gov/grad/solcalc/calcdetails.html
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Find the number of Julian centuries since J2000.0 ...
+    jc = (jd - 2451545.0) / 36525.0                                             # [cy]
+
+    # Find the geometric mean longitude and the geometric mean anomaly of the
+    # Sun, the eccentricity of the orbit of the Earth and the equation of the
+    # centre of the Sun ...
+    l0 = numpy.radians(numpy.mod(280.46646 + jc * (36000.76983 + jc * 0.0003032), 360.0))   # [rad]
+    m = numpy.radians(357.52911 + jc * (35999.05029 - jc * 0.0001537))         # [rad]
+    e = 0.016708634 - jc * (0.000042037 + jc * 0.0000001267)
+    c = numpy.radians(
+        numpy.sin(m) * (1.914602 - jc * (0.004817 + jc * 0.000014)) +
+        numpy.sin(2.0 * m) * (0.019993 - jc * 0.000101) +
+        numpy.sin(3.0 * m) * 0.000289
+    )                                                                           # [rad]
+
+    # Find the distance to the Sun ...
+    dist = 1.000001018 * (1.0 - e * e) / (1.0 + e * numpy.cos(m + c))           # [AU]
+
+    # Find the apparent longitude of the Sun ...
+    omega = numpy.radians(125.04 - jc * 1934.136)                               # [rad]
+    lam = l0 + c - numpy.radians(0.00569 + 0.00478 * numpy.sin(omega))         # [rad]
+
+    # Find the corrected obliquity of the ecliptic ...
+    eps = numpy.radians(
+        23.0 + (26.0 + (21.448 - jc * (46.815 + jc * (0.00059 - jc * 0.001813))) / 60.0) / 60.0 +
+        0.00256 * numpy.cos(omega)
+    )                                                                           # [rad]
+
+    # Find the declination of the Sun ...
+    decl = numpy.arcsin(numpy.sin(eps) * numpy.sin(lam))                        # [rad]
+
+    # Find the equation of time ...
+    y = numpy.tan(0.5 * eps) ** 2
+    eot = 4.0 * numpy.degrees(
+        y * numpy.sin(2.0 * l0) -
+        2.0 * e * numpy.sin(m) +
+        4.0 * e * y * numpy.sin(m) * numpy.cos(2.0 * l0) -
+        0.5 * y * y * numpy.sin(4.0 * l0) -
+        1.25 * e * e * numpy.sin(2.0 * m)
+    )                                                                           # [min]
+
+    # Return answers ...
+    return decl, eot, dist
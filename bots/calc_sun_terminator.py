@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def calc_sun_terminator(
+    info,
+    d0,
+    n,
+    /,
+    *,
+     cacheDir = None,
+     horizons = None,
+        nIter = 12,
+    onlyValid = False,
+       repair = False,
+         step = 900.0,
+):
+    """Calculate the extreme sunrises and sunsets of a territory using the
+    terminator
+
+    This function calculates the earliest and latest sunrises and sunsets of a
+    territory for each day in a survey by finding when the day/night terminator
+    touches and clears the Polygons of the territory, rather than by finding
+    the sunrise and sunset of every point along its coastline.
+
+    Parameters
+    ----------
+    info : dict
+        the definition of the territory (see :func:`create_db`)
+    d0 : datetime.datetime
+        the start of the survey (in UTC)
+    n : int
+        the number of days to survey
+    cacheDir : str, optional
+        the directory to keep a persistent geometry cache in (see
+        :func:`load_country_polys`)
+    horizons : list of floats, optional
+        the altitudes of the centre of the Sun at sunrise and sunset (in
+        degrees), where None means the default horizon (see
+        :func:`calc_sun_times`), which all share the same distances to the
+        territory (if None then just the default horizon is calculated)
+    nIter : int, optional
+        the number of bisections used to refine the time of each sunrise and
+        sunset
+    onlyValid : bool, optional
+        only return valid Polygons (checks for validity can take a while, if
+        being called often)
+    repair : bool, optional
+        attempt to repair invalid Polygons
+    step : float, optional
+        the time between the samples which are searched for sunrises and
+        sunsets before they are refined (in seconds), which is rounded so that
+        there are a whole number of samples in a day
+
+    Returns
+    -------
+    risMins : numpy.ndarray
+        the earliest sunrise of each day (in seconds since the POSIX epoch)
+    risMaxs : numpy.ndarray
+        the latest sunrise of each day (in seconds since the POSIX epoch)
+    setMins : numpy.ndarray
+        the earliest sunset of each day (in seconds since the POSIX epoch)
+    setMaxs : numpy.ndarray
+        the latest sunset of each day (in seconds since the POSIX epoch)
+
+    Notes
+    -----
+    If "horizons" is not None then the returned arrays have one row per day and
+    one column per horizon.
+
+    Some of the territory is sunlit when the great-circle distance from the
+    subsolar point to the nearest part of the territory is less than 90 degrees
+    less the altitude of the horizon (see :func:`calc_sun_times`), and all of
+    it is sunlit when the distance from the antisolar point to the nearest part
+    of the territory is more than 90 degrees plus the altitude of the horizon.
+    The distances are to the Polygons themselves (and to the locations), so
+    the extremes do not depend on how densely the coastline is sampled, and
+    each sample costs one pass over the edges rather than one sunrise/sunset
+    search per point.
+
+    The earliest sunrise is when some of the territory next becomes sunlit
+    after the start of the day (after it has first become wholly dark, if
+    some of it is sunlit at the start of the day) and the latest sunset is
+    when all of it next becomes dark. Likewise, the latest sunrise and the
+    earliest sunset bound when all of it is sunlit. If some (or all) of the
+    territory is sunlit all day then it is treated as though the Sun rises at
+    the start of the day and sets at the end of the day. If all of it is never
+    sunlit at once then the latest sunrise and the earliest sunset are both the
+    earliest sunrise. The days on which none of the territory is sunlit keep
+    the initial values of the counters.
+
+    Polygon edges are treated as great-circle arcs. A sunrise or sunset which
+    both starts and ends between two samples is missed.
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+    try:
+        import shapely
+        import shapely.geometry
+    except:
+        raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+        import pyguymer3.geo
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # Import sub-functions ...
+    from .calc_sun_position import calc_sun_position
+    from .load_country_polys import load_country_polys
+
+    # Load the Polygons (if there are any countries) and remove the parts which
+    # are not in the territory ...
+    # NOTE: A territory which is only made of locations does not need the
+    #       shapefile at all (which may not be downloadable).
+    polys = []
+    if len(info.get("countries", [])) > 0:
+        polys = load_country_polys(
+            info["countries"],
+             cacheDir = cacheDir,
+            onlyValid = onlyValid,
+               repair = repair,
+        )
+    if "lonRange" in info:
+        box = shapely.geometry.box(info["lonRange"][0], -90.0, info["lonRange"][1], 90.0)
+        polys = [
+            part
+            for poly in polys
+            for part in pyguymer3.geo.extract_polys(
+                poly.intersection(box),
+                onlyValid = onlyValid,
+                   repair = repair,
+            )
+        ]
+
+    # Create short-hand function to convert longitudes and latitudes to unit
+    # vectors ...
+    def to_xyz(lons, lats):
+        lons = numpy.radians(lons)                                              # [rad]
+        lats = numpy.radians(lats)                                              # [rad]
+        return numpy.stack(
+            (
+                numpy.cos(lats) * numpy.cos(lons),
+                numpy.cos(lats) * numpy.sin(lons),
+                numpy.sin(lats),
+            ),
+            axis = -1,
+        )
+
+    # Create arrays of the vertices and the (non-degenerate) edges of the
+    # Polygons, along with the vectors needed to check if the nearest point on
+    # the great circle through an edge is within the edge ...
+    verts = [to_xyz(*numpy.array(info.get("locations", []), dtype = numpy.float64).reshape(-1, 2).T)]
+    edgeA = []
+    edgeB = []
+    for poly in polys:
+        for ring in [poly.exterior] + list(poly.interiors):
+            xyz = to_xyz(*numpy.array(ring.coords, dtype = numpy.float64)[:, :2].T)
+            verts.append(xyz)
+            edgeA.append(xyz[:-1, :])
+            edgeB.append(xyz[1:, :])
+    verts = numpy.concatenate(verts)
+    edgeA = numpy.concatenate([numpy.zeros((0, 3), dtype = numpy.float64)] + edgeA)
+    edgeB = numpy.concatenate([numpy.zeros((0, 3), dtype = numpy.float64)] + edgeB)
+    normals = numpy.cross(edgeA, edgeB)
+    lengths = numpy.linalg.norm(normals, axis = 1)
+    keep = lengths > 1.0e-12
+    normals = normals[keep, :] / lengths[keep].reshape(-1, 1)
+    edgeU = numpy.cross(normals, edgeA[keep, :])
+    edgeW = numpy.cross(edgeB[keep, :], normals)
+
+    # Create short-hand function to find the great-circle distance from some
+    # points to the nearest part of the territory, in chunks to bound the
+    # memory ...
+    def find_min_dist(xyz, lons, lats):
+        ans = numpy.full(xyz.shape[0], numpy.pi, dtype = numpy.float64)         # [rad]
+        nChunk = max(1, 1048576 // max(1, verts.shape[0], normals.shape[0]))
+        for i0 in range(0, xyz.shape[0], nChunk):
+            p = xyz[i0:i0 + nChunk, :]
+            if verts.shape[0] > 0:
+                ans[i0:i0 + nChunk] = numpy.arccos(numpy.clip(p @ verts.T, -1.0, 1.0)).min(axis = 1)    # [rad]
+            if normals.shape[0] > 0:
+                s = p @ normals.T
+                within = (p @ edgeU.T >= 0.0) & (p @ edgeW.T >= 0.0)
+                ans[i0:i0 + nChunk] = numpy.minimum(
+                    ans[i0:i0 + nChunk],
+                    numpy.where(within, numpy.arcsin(numpy.clip(numpy.abs(s), 0.0, 1.0)), numpy.pi).min(axis = 1),
+                )                                                               # [rad]
+        for poly in polys:
+            ans[shapely.contains_xy(poly, lons, lats)] = 0.0                    # [rad]
+        return numpy.degrees(ans)                                               # [°]
+
+    # Convert list of horizons to a column vector (using NaN for the default
+    # horizon) ...
+    hs = numpy.array(
+        [numpy.nan if horizon is None else horizon for horizon in ([None] if horizons is None else horizons)],
+        dtype = numpy.float64,
+    ).reshape(-1, 1)                                                            # [°]
+
+    # Create short-hand function to find how far some of the territory is
+    # into the day ("f") and how far all of it is into the day ("g") at some
+    # times, for each horizon ...
+    def find_margins(jd):
+        decl, eot, dist = calc_sun_position(jd)                                 # [rad], [min], [AU]
+        h0 = numpy.where(numpy.isnan(hs), -(37.25 / 60.0 + 959.63 / 3600.0 / dist), hs) # [°]
+        lat = numpy.degrees(decl)                                               # [°]
+        lon = numpy.mod((720.0 - numpy.mod(jd - 0.5, 1.0) * 1440.0 - eot) / 4.0 + 180.0, 360.0) - 180.0 # [°]
+        f = (90.0 - h0) - find_min_dist(to_xyz(lon, lat), lon, lat)             # [°]
+        antiLon = numpy.mod(lon, 360.0) - 180.0                                 # [°]
+        g = find_min_dist(to_xyz(antiLon, -lat), antiLon, -lat) - (90.0 + h0)   # [°]
+        return f, g
+
+    # Create short-hand function to refine the times when some margins change
+    # sign, between some pairs of samples ...
+    def refine(lo, hi, k, l, rising):
+        for _ in range(nIter):
+            mid = 0.5 * (lo + hi)                                               # [day]
+            pos = find_margins(mid)[k][l, :] > 0.0
+            up = pos == rising
+            hi = numpy.where(up, mid, hi)                                       # [day]
+            lo = numpy.where(up, lo, mid)                                       # [day]
+        return (hi - 2440587.5) * 86400.0                                       # [s]
+
+    # Sample the margins from the start of the survey until two days after
+    # the end of it ...
+    nPerDay = max(1, round(86400.0 / step))                                     # [#]
+    jd0 = d0.timestamp() / 86400.0 + 2440587.5                                  # [day]
+    jd = jd0 + numpy.arange((n + 2) * nPerDay + 1, dtype = numpy.float64) / nPerDay # [day]
+    margins = find_margins(jd)                                                  # [°], [°]
+
+    # Find and refine the times when the margins change sign ...
+    ups = {}
+    downs = {}
+    for k in range(2):
+        for l in range(hs.size):
+            pos = margins[k][l, :] > 0.0
+            inds = numpy.flatnonzero(~pos[:-1] & pos[1:])
+            ups[k, l] = refine(jd[inds], jd[inds + 1], k, l, True)              # [s]
+            inds = numpy.flatnonzero(pos[:-1] & ~pos[1:])
+            downs[k, l] = refine(jd[inds], jd[inds + 1], k, l, False)           # [s]
+
+    # Create short-hand function to find the first time in a sorted array
+    # which is at or after a time (or None) ...
+    def first_after(arr, t):
+        if t is None:
+            return None
+        i = numpy.searchsorted(arr, t)
+        return None if i >= arr.size else float(arr[i])
+
+    # Create empty lists ...
+    risMins = numpy.zeros((n, hs.size), dtype = numpy.int64)                    # [s]
+    risMaxs = numpy.zeros((n, hs.size), dtype = numpy.int64)                    # [s]
+    setMins = numpy.zeros((n, hs.size), dtype = numpy.int64)                    # [s]
+    setMaxs = numpy.zeros((n, hs.size), dtype = numpy.int64)                    # [s]
+
+    # Initialize counters ...
+    risMins[:] = pow(2, 62)                                                     # [s]
+    setMins[:] = pow(2, 62)                                                     # [s]
+
+    # Loop over days ...
+    for i in range(n):
+        t0 = d0.timestamp() + 86400.0 * i                                       # [s]
+        t1 = t0 + 86400.0                                                       # [s]
+
+        # Loop over horizons ...
+        for l in range(hs.size):
+            # Loop over margins ...
+            spans = []
+            for k in range(2):
+                # Find the first time that the margin becomes positive after the
+                # start of the day (after first becoming negative, if it is
+                # positive at the start of the day) and the first time that it
+                # becomes negative after that ...
+                if margins[k][l, i * nPerDay] > 0.0:
+                    down = first_after(downs[k, l], t0)
+                    if down is None or down >= t1:
+                        spans.append((t0, t1 if down is None else down))
+                        continue
+                    rise = first_after(ups[k, l], down)
+                else:
+                    rise = first_after(ups[k, l], t0)
+                if rise is None or rise >= t1:
+                    spans.append(None)
+                    continue
+                down = first_after(downs[k, l], rise)
+                spans.append((rise, max(rise, t1) if down is None else down))
+
+            # Skip days on which none of the territory is sunlit ...
+            if spans[0] is None:
+                continue
+            if spans[1] is None:
+                spans[1] = (spans[0][0], spans[0][0])
+
+            # Overwrite counters ...
+            risMins[i, l] = numpy.floor(spans[0][0])                            # [s]
+            setMaxs[i, l] = numpy.floor(spans[0][1])                            # [s]
+            risMaxs[i, l] = numpy.floor(spans[1][0])                            # [s]
+            setMins[i, l] = numpy.floor(spans[1][1])                            # [s]
+
+    # Return answers ...
+    if horizons is None:
+        return risMins[:, 0], risMaxs[:, 0], setMins[:, 0], setMaxs[:, 0]
+    return risMins, risMaxs, setMins, setMaxs
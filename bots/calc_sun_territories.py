@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def calc_sun_territories(
+    territories,
+    d0,
+    n,
+    /,
+    *,
+     cacheDir = None,
+    cacheSize = 67108864,
+    chunkDays = None,
+          dip = True,
+       engine = "ephem",
+     horizons = None,
+         pool = None,
+        prune = True,
+      workers = 1,
+):
+    """Calculate the extreme sunrises and sunsets of all of the territories
+
+    This function calculates the earliest and latest sunrises and sunsets of
+    each day in a survey for all of the territories, using a persistent
+    sunrise/sunset cache and a process pool (if requested).
+
+    Parameters
+    ----------
+    territories : dict
+        the database
+    d0 : datetime.datetime
+        the start of the survey (in UTC)
+    n : int
+        the number of days to survey
+    cacheDir : str, optional
+        the directory to keep a persistent sunrise/sunset cache in (if None then
+        every day is calculated from scratch)
+    cacheSize : int, optional
+        the maximum total size of the sunrise/sunset cache (in bytes)
+    chunkDays : int, optional
+        the number of days in each task given to the process pool (the default
+        is one task per territory)
+    dip : bool, optional
+        allow for the dip of the horizon of each point (if the database
+        contains their elevations, see :func:`create_db`)
+    engine : str, optional
+        the engine used to calculate the sunrises and sunsets (either "ephem",
+        which asks ephem about every coordinate on every day, "numpy", which
+        uses closed-form expressions on arrays of all of the coordinates and all
+        of the days at once, see :func:`calc_sun_numpy` for its accuracy, or
+        "terminator", which finds when the terminator touches and clears the
+        Polygons of the territory, see :func:`calc_sun_terminator`, and which
+        suits territories with long coastlines)
+    horizons : list of floats, optional
+        the altitudes of the centre of the Sun at sunrise and sunset (in
+        degrees), where None means the default horizon (see
+        :func:`calc_sun_times`), e.g., "[None, -6.0, -12.0, -18.0]" for sunrise
+        and sunset along with civil, nautical and astronomical twilight, which
+        are all calculated in the same pass (if None then just the default
+        horizon is calculated)
+    pool : concurrent.futures.ProcessPoolExecutor, optional
+        the process pool to find the sunrises and sunsets in (if None then one
+        is made, if "workers" is more than one)
+    prune : bool, optional
+        only survey the points which can set the extreme sunrises and sunsets
+        (if the database contains them and if they are exact for every
+        horizon)
+    workers : int, optional
+        the number of processes to use to find the sunrises and sunsets (if
+        "pool" is None) (the results are identical to those found in serial)
+
+    Returns
+    -------
+    results : dict
+        the earliest sunrise, the latest sunrise, the earliest sunset and the
+        latest sunset of each day of each territory, as an (n, 4) array (or as
+        an (n, 4, H) array for H horizons, if "horizons" is not None) (in
+        seconds since the POSIX epoch), where the days on which a territory is
+        not valid have no sunrises and no sunsets
+
+    Notes
+    -----
+    The sunrise/sunset cache holds the earliest and latest sunrises and sunsets
+    of every day which has been calculated, keyed by the engine, by the version
+    of the sunrises and sunsets (which is incremented whenever the engines
+    change what they find, e.g., on the days of polar day or polar night), by a
+    hash of the points which were surveyed (and of their elevations and the
+    horizons) and by the start of the day (see :func:`load_sun_cache` and
+    :func:`save_sun_cache`), so only the days which are not in the cache are
+    calculated.
+
+    Only the groups of points which are valid on each day are surveyed (see
+    :func:`build_validity_index`), as one unit of work per run of days on which
+    the same groups are valid, so the set of points is never rebuilt each day.
+    """
+
+    # Import standard modules ...
+    import concurrent.futures
+    import contextlib
+    import datetime
+    import functools
+    import hashlib
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .build_validity_index import build_validity_index
+    from .calc_sun_ephem import calc_sun_ephem
+    from .calc_sun_numpy import calc_sun_numpy
+    from .calc_sun_terminator import calc_sun_terminator
+    from .load_sun_cache import load_sun_cache
+    from .save_sun_cache import save_sun_cache
+    from .start_stage import start_stage
+    from .stop_stage import stop_stage
+
+    # Check engine ...
+    match engine:
+        case "ephem":
+            calc_sun = calc_sun_ephem
+        case "numpy":
+            calc_sun = calc_sun_numpy
+        case "terminator":
+            calc_sun = functools.partial(calc_sun_terminator, cacheDir = cacheDir)
+        case _:
+            raise Exception(f"\"engine\" is an unexpected value ({repr(engine)})") from None
+    if horizons is not None:
+        calc_sun = functools.partial(calc_sun, horizons = list(horizons))
+
+    # Set the version of the sunrises and sunsets ...
+    # NOTE: This must be incremented whenever the sunrises and sunsets which
+    #       the engines find change, so that the caches of older versions are
+    #       not used.
+    version = 3
+
+    # Find out how many values there are for each day ...
+    shape = (4,) if horizons is None else (4, len(horizons))
+    nVals = 4 if horizons is None else 4 * len(horizons)                        # [#]
+
+    # Find out how many days to calculate in each task ...
+    if chunkDays is None:
+        chunkDays = n                                                           # [#]
+    chunkDays = max(1, chunkDays)                                               # [#]
+
+    # Find the start of each day ...
+    t0s = int(d0.timestamp()) + 86400 * numpy.arange(n, dtype = numpy.int64)   # [s]
+
+    # Find the runs of days on which the same groups of points of each
+    # territory are valid ...
+    index = build_validity_index(territories, d0, n)
+
+    # Create dictionaries of the points to survey, of what to give the engine,
+    # of the path to the cache and of the chunks of days which need
+    # calculating, for each run of days of each territory, and of the earliest
+    # and latest sunrises and sunsets of each day of each territory ...
+    coords = {}
+    inputs = {}
+    cpaths = {}
+    tasks = {}
+    results = {}
+
+    # Loop over territories ...
+    for territory in territories.keys():
+        # Initialize the results (so that the days on which the territory is
+        # not valid look as if the Sun never rose or set) ...
+        results[territory] = numpy.zeros((n,) + shape, dtype = numpy.int64)     # [s]
+        results[territory][:, 0, ...] = pow(2, 62)                              # [s]
+        results[territory][:, 2, ...] = pow(2, 62)                              # [s]
+
+        # Find which points to survey ...
+        # NOTE: The points which can set the extreme sunrises and sunsets (see
+        #       "prune_coords()") keep every point poleward of 65°, but below a
+        #       twilight horizon the Sun may not rise or set on some days at
+        #       much lower latitudes (poleward of about 66.5° plus the
+        #       horizon), where the pruned points are not exact. Therefore, all
+        #       of the points are surveyed for such horizons.
+        maxLat = min(
+            65.0,
+            float(numpy.abs(numpy.array(territories[territory]["coords"], dtype = numpy.float64).reshape(-1, 2)[:, 1]).max(initial = 0.0)),
+        )                                                                       # [°]
+        safe = horizons is None or all(horizon is None or maxLat < 66.5 + horizon for horizon in horizons)
+        if prune and safe and "extremalCoords" in territories[territory]:
+            coordKey = "extremalCoords"
+            elevKey = "extremalElevations"
+        else:
+            coordKey = "coords"
+            elevKey = "elevations"
+
+        # Loop over runs of days ...
+        for k, (j0, j1, groups) in enumerate(index[territory]):
+            # Find the points to survey (along with their elevations, if
+            # needed) ...
+            inds = numpy.concatenate(
+                [numpy.zeros(0, dtype = numpy.int64)] +
+                [numpy.arange(*group[coordKey]) for group in groups]
+            )
+            unit = (territory, k)
+            coords[unit] = numpy.array(territories[territory][coordKey], dtype = numpy.float64).reshape(-1, 2)[inds, :]   # [°]
+            if dip and elevKey in territories[territory]:
+                coords[unit] = numpy.column_stack(
+                    (
+                        coords[unit],
+                        numpy.array(territories[territory][elevKey], dtype = numpy.float64)[inds],
+                    )
+                )                                                               # [°], [°], [m]
+
+            # Find what to give the engine ...
+            # NOTE: The "terminator" engine uses the Polygons of the valid
+            #       countries rather than the points (so it does not allow for
+            #       the dip of the horizon), but the points are still used to
+            #       key the cache.
+            if engine == "terminator":
+                inputs[unit] = {
+                    "countries" : [country for group in groups for country in group.get("countries", [])],
+                    "locations" : [location for group in groups for location in group.get("locations", [])],
+                }
+                if "lonRange" in territories[territory]:
+                    inputs[unit]["lonRange"] = territories[territory]["lonRange"]
+            else:
+                inputs[unit] = coords[unit]
+
+            # Load the days which are in the cache (if there is one) ...
+            if cacheDir is not None:
+                sha = hashlib.sha256(numpy.array(coords[unit], dtype = "<f8").tobytes())
+                if horizons is not None:
+                    sha.update(repr(list(horizons)).encode("utf-8"))
+                cpaths[unit] = f"{cacheDir}/sun-cache/{engine}_v{version:d}_{sha.hexdigest()}.npy"
+                hits, vals = load_sun_cache(
+                    cpaths[unit],
+                    t0s[j0:j1],
+                    nVals = nVals,
+                )                                                               # [s]
+                results[territory][j0:j1, ...] = vals.reshape((j1 - j0,) + shape)   # [s]
+            else:
+                hits = numpy.zeros(j1 - j0, dtype = bool)
+
+            # Split the days which are not in the cache into runs of
+            # consecutive days and split each run into chunks ...
+            tasks[unit] = []
+            misses = j0 + numpy.flatnonzero(~hits)
+            for run in numpy.split(misses, numpy.flatnonzero(numpy.diff(misses) != 1) + 1):
+                if run.size == 0:
+                    continue
+                for i0 in range(int(run[0]), int(run[-1]) + 1, chunkDays):
+                    tasks[unit].append((i0, min(int(run[-1]) + 1, i0 + chunkDays)))
+
+    # Create short-hand function to list the runs of days of a territory which
+    # need calculating ...
+    def find_units(territory):
+        return [(territory, k) for k in range(len(index[territory])) if len(tasks[(territory, k)]) > 0]
+
+    # Check if a process pool is required ...
+    if pool is not None or workers > 1:
+        # Create process pool (if one was not given) ...
+        # NOTE: A process pool which was given is not shut down.
+        if pool is None:
+            ctx = concurrent.futures.ProcessPoolExecutor(max_workers = workers)
+        else:
+            ctx = contextlib.nullcontext(pool)
+        with ctx as pool:
+            # Loop over territories ...
+            futures = {}
+            for territory in territories.keys():
+                if len(find_units(territory)) == 0:
+                    continue
+                print(f"Finding sunrises and sunsets for \"{territory}\" ...")
+
+                # Loop over runs of days ...
+                for unit in find_units(territory):
+                    # Submit a task for each chunk of days ...
+                    futures[unit] = [
+                        pool.submit(
+                            calc_sun,
+                            inputs[unit],
+                            d0 + datetime.timedelta(days = i0),
+                            i1 - i0,
+                        )
+                        for i0, i1 in tasks[unit]
+                    ]
+
+            # Loop over runs of days ...
+            for unit, chunks in futures.items():
+                # Wait for the tasks and put the chunks of days in place ...
+                for (i0, i1), future in zip(tasks[unit], chunks, strict = True):
+                    results[unit[0]][i0:i1, ...] = numpy.stack(future.result(), axis = 1)  # [s]
+    else:
+        # Loop over territories ...
+        for territory in territories.keys():
+            if len(find_units(territory)) == 0:
+                continue
+            print(f"Finding sunrises and sunsets for \"{territory}\" ...")
+            stage = start_stage(f"calc_sun_territories/{territory}")
+
+            # Loop over runs of days and chunks of days ...
+            for unit in find_units(territory):
+                for i0, i1 in tasks[unit]:
+                    # Find the earliest and latest sunrises and sunsets of
+                    # each day ...
+                    results[territory][i0:i1, ...] = numpy.stack(
+                        calc_sun(
+                            inputs[unit],
+                            d0 + datetime.timedelta(days = i0),
+                            i1 - i0,
+                        ),
+                        axis = 1,
+                    )                                                           # [s]
+            stop_stage(stage)
+
+    # Save the days which were calculated to the cache (if there is one) ...
+    if cacheDir is not None:
+        for unit, chunks in tasks.items():
+            if len(chunks) == 0:
+                continue
+            inds = numpy.concatenate([numpy.arange(i0, i1) for i0, i1 in chunks])
+            save_sun_cache(
+                cpaths[unit],
+                t0s[inds],
+                results[unit[0]][inds, ...].reshape(inds.size, nVals),
+                maxSize = cacheSize,
+            )
+
+    # Return answer ...
+    return results
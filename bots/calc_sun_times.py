@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def calc_sun_times(
+    lons,
+    lats,
+    t0,
+    /,
+    *,
+        dip = 0.0,
+    horizon = None,
+      nIter = 3,
+):
+    """Calculate the sunrises and sunsets of some coordinates using NumPy
+
+    This function calculates the first sunrise after the start of each day, and
+    the sunset which follows it, for each coordinate using the closed-form solar
+    declination, equation of time and hour angle.
+
+    Parameters
+    ----------
+    lons : numpy.ndarray
+        the longitudes (in degrees)
+    lats : numpy.ndarray
+        the latitudes (in degrees)
+    t0 : numpy.ndarray
+        the start of each day as a column vector (in Julian Dates)
+    dip : float or numpy.ndarray, optional
+        the dip of the horizon (in degrees), either for all of the coordinates
+        or for each coordinate (see :func:`calc_horizon_dip`), which lowers the
+        horizon
+    horizon : float or numpy.ndarray, optional
+        the altitude of the centre of the Sun at sunrise and sunset (in
+        degrees), either for all of the coordinates or for each coordinate,
+        where None (or NaN) means the default horizon (see below)
+    nIter : int, optional
+        the number of iterations used to refine the time of each sunrise and
+        sunset
+
+    Returns
+    -------
+    ris : numpy.ndarray
+        the sunrise of each coordinate on each day (in Julian Dates)
+    sets : numpy.ndarray
+        the sunset of each coordinate on each day (in Julian Dates)
+
+    Notes
+    -----
+    The returned arrays have one row per day and one column per coordinate. The
+    sunrises and sunsets of coordinates where the Sun does not rise or set on a
+    day are either NaN or infinite.
+
+    By default, the Sun is deemed to have risen (or set) when its upper limb is
+    on the horizon, allowing for 37.25 arcminutes of atmospheric refraction,
+    which is the same definition that ephem uses with its default air
+    temperature and pressure. Any other horizon is the altitude of the centre
+    of the Sun without any refraction (e.g., -6 degrees for civil twilight),
+    which is the definition that ephem uses for twilight.
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .calc_sun_position import calc_sun_position
+
+    # Convert latitudes ...
+    lats = numpy.radians(lats)                                                  # [rad]
+
+    # Set the atmospheric refraction at the horizon ...
+    refr = 37.25 / 60.0                                                         # [°]
+
+    # Convert horizons (using NaN for the default horizon) ...
+    horizon = numpy.array(numpy.nan if horizon is None else horizon, dtype = numpy.float64) # [°]
+
+    # Create short-hand function to find the time of the sunrise (or sunset) on
+    # the solar day which is centred on the UTC day which starts at "base",
+    # refining the position of the Sun at the time of the event each
+    # iteration ...
+    def find_event(base, sign):
+        t = base + (720.0 - 4.0 * lons) / 1440.0                                # [day]
+        for _ in range(nIter):
+            decl, eot, dist = calc_sun_position(t)                              # [rad], [min], [AU]
+            sinH0 = numpy.sin(numpy.radians(numpy.where(numpy.isnan(horizon), -(refr + 959.63 / 3600.0 / dist), horizon) - dip))
+            cosHA = (sinH0 - numpy.sin(lats) * numpy.sin(decl)) / (numpy.cos(lats) * numpy.cos(decl))
+            ha = numpy.degrees(numpy.arccos(numpy.clip(cosHA, -1.0, 1.0)))      # [°]
+            t = base + (720.0 - 4.0 * (lons + sign * ha) - eot) / 1440.0        # [day]
+        return numpy.where(numpy.abs(cosHA) <= 1.0, t, numpy.nan)
+
+    # Find the first sunrise after the start of each day, which must lie on the
+    # solar day centred on either the previous, the current or the next UTC
+    # day, and the sunset which follows it ...
+    ris = numpy.full((t0.size, lons.size), numpy.inf, dtype = numpy.float64)    # [day]
+    sets = numpy.full((t0.size, lons.size), numpy.nan, dtype = numpy.float64)   # [day]
+    for k in [-1.0, 0.0, 1.0]:
+        tmp = find_event(t0 + k, 1.0)                                           # [day]
+        upd = (tmp >= t0) & (tmp < ris)
+        if not upd.any():
+            continue
+        ris = numpy.where(upd, tmp, ris)                                        # [day]
+        sets = numpy.where(upd, find_event(t0 + k, -1.0), sets)                 # [day]
+
+    # Return answers ...
+    return ris, sets
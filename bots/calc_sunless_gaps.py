@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def calc_sunless_gaps(
+    results,
+    d0,
+    n,
+    /,
+    *,
+           bat = "British Antarctic Territory",
+     chunkDays = 366,
+          kind = "any",
+    resolution = 60,
+):
+    """Calculate the gaps when the Sun has set on the BOT
+
+    This function finds every gap in a survey when none of the territories have
+    sunlight, both with and without the BAT, by building a packed bitset of the
+    sunlit bins of each territory and ORing them together.
+
+    Parameters
+    ----------
+    results : dict
+        the earliest sunrise, the latest sunrise, the earliest sunset and the
+        latest sunset of each day of each territory, as an (n, 4) array (in
+        seconds since the POSIX epoch), see :func:`calc_sun_territories`
+    d0 : datetime.datetime
+        the start of the survey (in UTC)
+    n : int
+        the number of days to survey
+    bat : str, optional
+        the name of the territory to leave out of the second set of gaps
+    chunkDays : int, optional
+        the number of days to scan at once (which bounds the memory)
+    kind : str, optional
+        the kind of sunlight (either "any", where a territory is sunlit when any
+        of its points are, or "all", where a territory is only sunlit when all
+        of its points are)
+    resolution : int, optional
+        the width of each bin (in seconds)
+
+    Returns
+    -------
+    gaps : dict
+        the (start, end) of each gap (in seconds since the POSIX epoch), with
+        ("withBAT") and without ("withoutBAT") the BAT
+
+    Notes
+    -----
+    A territory is sunlit with "any" points between the earliest sunrise and
+    the latest sunset of each day, and with "all" points between the latest
+    sunrise and the earliest sunset of each day. A bin is only sunlit if it is
+    wholly within one of these intervals, so gaps are rounded outwards to the
+    nearest bin.
+
+    The first day and the last day of the survey are not scanned, because the
+    sunlight before the first sunrise of the first day (and after the last
+    sunset of the last day) is unknown. A point which is in polar day on a day
+    rises at the start of the day and sets at the end of the day (see
+    :func:`calc_sun_numpy`), so the BAT during the polar day is counted as
+    sunlit all day. The days on which the Sun neither rises nor sets for any of
+    the points of a territory (e.g., during the polar night) are treated as
+    dark.
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Check kind ...
+    match kind:
+        case "any":
+            iLeft, iRight = 0, 3
+        case "all":
+            iLeft, iRight = 1, 2
+        case _:
+            raise Exception(f"\"kind\" is an unexpected value ({repr(kind)})") from None
+
+    # Create short-hands ...
+    tStart = int(d0.timestamp()) + 86400                                        # [s]
+    tStop = int(d0.timestamp()) + 86400 * (n - 1)                               # [s]
+
+    # Create dictionary of gaps ...
+    gaps = {
+           "withBAT" : [],
+        "withoutBAT" : [],
+    }
+
+    # Find the width of each chunk of days, which must be a whole number of
+    # bins so that the bins of consecutive chunks line up ...
+    step = resolution * max(1, 86400 * chunkDays // resolution)                 # [s]
+
+    # Loop over chunks of days ...
+    for w0 in range(tStart, tStop, step):
+        w1 = min(tStop, w0 + step)                                              # [s]
+        nBins = (w1 - w0) // resolution                                         # [#]
+        if nBins == 0:
+            continue
+
+        # Create packed bitsets ...
+        withBAT = numpy.zeros((nBins + 7) // 8, dtype = numpy.uint8)
+        withoutBAT = numpy.zeros((nBins + 7) // 8, dtype = numpy.uint8)
+
+        # Find the days whose sunlight may overlap this chunk of days ...
+        i0 = max(0, (w0 - int(d0.timestamp())) // 86400 - 1)
+        i1 = min(n, (w1 - int(d0.timestamp())) // 86400 + 1)
+
+        # Loop over territories ...
+        for territory, arr in results.items():
+            # Find the bins which are wholly sunlit ...
+            # NOTE: The days on which no points are valid keep the initial
+            #       values of the counters (see "calc_sun_ephem()").
+            lefts = arr[i0:i1, iLeft].astype(numpy.int64)                       # [s]
+            rights = arr[i0:i1, iRight].astype(numpy.int64)                     # [s]
+            valid = (arr[i0:i1, 0] < pow(2, 62)) & (lefts < rights)
+            lo = numpy.clip(-((w0 - lefts[valid]) // resolution), 0, nBins)     # [#]
+            hi = numpy.clip((rights[valid] - w0) // resolution, 0, nBins)       # [#]
+            edges = numpy.zeros(nBins + 1, dtype = numpy.int32)
+            numpy.add.at(edges, lo[lo < hi], 1)
+            numpy.add.at(edges, hi[lo < hi], -1)
+            bits = numpy.packbits(numpy.cumsum(edges[:-1]) > 0)
+
+            # OR the bitsets together ...
+            withBAT |= bits
+            if territory != bat:
+                withoutBAT |= bits
+
+        # Loop over bitsets ...
+        for key, bits in [("withBAT", withBAT), ("withoutBAT", withoutBAT)]:
+            # Skip this chunk of days if every bin is sunlit ...
+            dark = numpy.unpackbits(bits, count = nBins) == 0
+            if not dark.any():
+                continue
+
+            # Find the runs of dark bins ...
+            dark = numpy.concatenate(([False], dark, [False]))
+            starts = numpy.flatnonzero(~dark[:-1] & dark[1:])
+            stops = numpy.flatnonzero(dark[:-1] & ~dark[1:])
+
+            # Loop over runs ...
+            for start, stop in zip(starts, stops, strict = True):
+                gap = (w0 + int(start) * resolution, w0 + int(stop) * resolution)   # [s], [s]
+
+                # Join this gap to the last one if they touch (across the
+                # boundary between chunks of days) ...
+                if len(gaps[key]) > 0 and gaps[key][-1][1] == gap[0]:
+                    gaps[key][-1] = (gaps[key][-1][0], gap[1])
+                    continue
+                gaps[key].append(gap)
+
+    # Return answer ...
+    return gaps
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+
+# Create cache ...
+# NOTE: This is a per-process cache, so that the shapefile is only hashed once
+#       no matter how many territories ask for it.
+_hashes = {}
+
+# Define function ...
+def calc_territory_fingerprint(
+    info,
+    /,
+    *,
+             dem = None,
+    minElevation = 100.0,
+       onlyValid = False,
+          repair = False,
+):
+    """Calculate the fingerprint of a territory
+
+    This function calculates a hash of everything which the entry of a
+    territory in the database depends on, so that the entry (and the PNG map of
+    the territory) only needs to be re-made if the fingerprint changes.
+
+    Parameters
+    ----------
+    info : dict
+        the definition of the territory
+    dem : str, optional
+        the path to the Digital Elevation Model (if any, see :func:`load_dem`)
+    minElevation : float, optional
+        the minimum elevation of a peak (in metres, see
+        :func:`find_dem_peaks`)
+    onlyValid : bool, optional
+        only return valid Polygons (checks for validity can take a while, if
+        being called often)
+    repair : bool, optional
+        attempt to repair invalid Polygons
+
+    Returns
+    -------
+    fingerprint : str
+        the SHA-256 hash (as hexadecimal)
+
+    Notes
+    -----
+    The fingerprint covers the countries, the locations and the longitude range
+    of the territory, the "onlyValid" and "repair" flags and the SHA-256 hash of
+    the contents of the Natural Earth shapefile (so that a new release of
+    Natural Earth is picked up too). If there is a DEM then the fingerprint
+    also covers "minElevation" and the path, the size and the modification time
+    of the DEM (which is not hashed as it may be very large). The validities of
+    the territory, of its countries and of its locations are covered too, if
+    there are any (see :func:`build_validity_index`).
+    """
+
+    # Import standard modules ...
+    import hashlib
+    import json
+    import os
+    import pathlib
+
+    # Import special modules ...
+    try:
+        import cartopy
+        cartopy.config.update(
+            {
+                "cache_dir" : pathlib.PosixPath("~/.local/share/cartopy").expanduser(),
+            }
+        )
+    except:
+        raise Exception("\"cartopy\" is not installed; run \"pip install --user Cartopy\"") from None
+
+    # Find file containing all the country shapes ...
+    sfile = cartopy.io.shapereader.natural_earth(
+          category = "cultural",
+              name = "admin_0_countries",
+        resolution = "10m",
+    )
+
+    # Hash the shapefile and its attributes (if needed) ...
+    stat = os.stat(sfile)
+    if (sfile, stat.st_size, stat.st_mtime_ns) not in _hashes:
+        sha = hashlib.sha256()
+        for ext in [".shp", ".dbf"]:
+            fpath = f"{os.path.splitext(sfile)[0]}{ext}"
+            if not os.path.exists(fpath):
+                continue
+            with open(fpath, mode = "rb") as fObj:
+                while chunk := fObj.read(1048576):
+                    sha.update(chunk)
+        _hashes[(sfile, stat.st_size, stat.st_mtime_ns)] = sha.hexdigest()
+
+    # Create description of the territory ...
+    desc = {
+        "countries" : info.get("countries", []),
+        "locations" : info.get("locations", []),
+         "lonRange" : info.get("lonRange"),
+        "onlyValid" : onlyValid,
+           "repair" : repair,
+        "shapefile" : _hashes[(sfile, stat.st_size, stat.st_mtime_ns)],
+    }
+    if dem is not None:
+        demStat = os.stat(dem)
+        desc["dem"] = f"{os.path.abspath(dem)}:{demStat.st_size:d}:{demStat.st_mtime_ns:d}"
+        desc["minElevation"] = minElevation                                     # [m]
+    for key in ["countryValidity", "locationValidity", "validity"]:
+        if key in info:
+            desc[key] = info[key]
+
+    # Return answer ...
+    return hashlib.sha256(json.dumps(desc, sort_keys = True).encode("utf-8")).hexdigest()
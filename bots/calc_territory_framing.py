@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def calc_territory_framing(
+    coords,
+    /,
+    *,
+      debug = __debug__,
+    framing = None,
+      nIter = 100,
+):
+    """Calculate the framing of the map of a territory
+
+    This function finds the middle of the points of a territory and the
+    maximum distance from the middle to any of the points, which frame the map
+    of the territory (see :func:`create_map`). The existing framing is returned
+    unchanged if it was calculated from the same points.
+
+    Parameters
+    ----------
+    coords : numpy.ndarray
+        the (longitude, latitude) coordinates (in degrees) as a (N, 2) array
+        (see :func:`load_territory_coords`)
+    debug : bool, optional
+        print debug messages
+    framing : dict, optional
+        the existing framing (if any)
+    nIter : int, optional
+        the maximum number of iterations (particularly the Vincenty formula)
+
+    Returns
+    -------
+    framing : dict
+        the longitude and latitude of the middle ("midLon" and "midLat", in
+        degrees), the maximum distance ("maxDist", in metres) and the SHA-256
+        hash of the points and "nIter" ("coordsHash", as hexadecimal)
+
+    Notes
+    -----
+    Finding the middle uses the iterative "GeodesicCircle" method of
+    :func:`pyguymer3.geo.find_middle_of_locs`, refined down to 156.25 m, which
+    is far slower than re-using the framing stored in the database (see
+    :func:`calc_territory_framings`).
+    """
+
+    # Import standard modules ...
+    import hashlib
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+        import pyguymer3.geo
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # Hash the points and the number of iterations ...
+    sha = hashlib.sha256(numpy.ascontiguousarray(coords, dtype = "<f8").tobytes())
+    sha.update(f"nIter={nIter:d}".encode("utf-8"))
+
+    # Re-use the existing framing if it is up to date ...
+    if framing is not None and framing.get("coordsHash") == sha.hexdigest():
+        return framing
+
+    # Find the middle of the points ...
+    midLon, midLat, maxDist = pyguymer3.geo.find_middle_of_locs(
+        coords[:, 0],
+        coords[:, 1],
+         angConv = 0.1,
+            conv = 10000.0,                                                     # 10 km
+           debug = debug,
+          method = "GeodesicCircle",
+            nAng = 9,
+           nIter = nIter,
+         nRefine = 6,                                                           # 156.25 m
+             pad = 12.0 * 1852.0,
+        useSciPy = False,
+    )                                                                           # [°], [°], [m]
+
+    # Return answer ...
+    return {
+        "coordsHash" : sha.hexdigest(),
+           "maxDist" : float(maxDist),                                          # [m]
+            "midLat" : float(midLat),                                           # [°]
+            "midLon" : float(midLon),                                           # [°]
+    }
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def calc_territory_framings(
+    territories,
+    /,
+    *,
+     cacheDir = None,
+        nIter = 100,
+    onlyValid = False,
+         pool = None,
+       repair = False,
+      workers = 1,
+):
+    """Calculate the framings of the maps of all of the territories
+
+    This function calculates the framing of the map of each territory (see
+    :func:`calc_territory_framing`) which is missing or out of date, using a
+    process pool (if requested), and stores it in the database as "framing".
+
+    Parameters
+    ----------
+    territories : dict
+        the database (which is updated in place)
+    cacheDir : str, optional
+        the directory to keep a persistent geometry cache in (see
+        :func:`load_country_polys`)
+    nIter : int, optional
+        the maximum number of iterations (particularly the Vincenty formula)
+    onlyValid : bool, optional
+        only return valid Polygons (checks for validity can take a while, if
+        being called often)
+    pool : concurrent.futures.ProcessPoolExecutor, optional
+        the process pool to find the framings in (if None then one is made, if
+        "workers" is more than one)
+    repair : bool, optional
+        attempt to repair invalid Polygons
+    workers : int, optional
+        the number of processes to use to find the framings (if "pool" is None)
+
+    Returns
+    -------
+    nChanged : int
+        the number of framings which were calculated
+    """
+
+    # Import standard modules ...
+    import concurrent.futures
+    import contextlib
+
+    # Import sub-functions ...
+    from .calc_territory_framing import calc_territory_framing
+    from .load_territory_coords import load_territory_coords
+
+    # Create dictionary of the points of each territory ...
+    # NOTE: The map shows all of the points of each country, so this is not
+    #       the same as the "coords" in the database (see "create_map()").
+    coords = {}
+    for territory, info in territories.items():
+        coords[territory] = load_territory_coords(
+            info,
+             cacheDir = cacheDir,
+            onlyValid = onlyValid,
+               repair = repair,
+        )                                                                       # [°]
+
+    # Check if a process pool is required ...
+    framings = {}
+    if pool is not None or workers > 1:
+        # Create process pool (if one was not given) ...
+        # NOTE: A process pool which was given is not shut down.
+        if pool is None:
+            ctx = concurrent.futures.ProcessPoolExecutor(max_workers = workers)
+        else:
+            ctx = contextlib.nullcontext(pool)
+        with ctx as pool:
+            # Submit a task for each territory ...
+            futures = {}
+            for territory, info in territories.items():
+                if coords[territory].shape[0] == 0:
+                    continue
+                futures[territory] = pool.submit(
+                    calc_territory_framing,
+                    coords[territory],
+                      debug = False,
+                    framing = info.get("framing"),
+                      nIter = nIter,
+                )
+
+            # Wait for the tasks ...
+            for territory, future in futures.items():
+                framings[territory] = future.result()
+    else:
+        # Loop over territories ...
+        for territory, info in territories.items():
+            if coords[territory].shape[0] == 0:
+                continue
+            framings[territory] = calc_territory_framing(
+                coords[territory],
+                  debug = False,
+                framing = info.get("framing"),
+                  nIter = nIter,
+            )
+
+    # Store the framings which have changed ...
+    nChanged = 0                                                                # [#]
+    for territory, framing in framings.items():
+        if framing != territories[territory].get("framing"):
+            print(f"Found the framing of the map of \"{territory}\".")
+            territories[territory]["framing"] = framing
+            nChanged += 1                                                       # [#]
+
+    # Return answer ...
+    return nChanged
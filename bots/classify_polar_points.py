@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def classify_polar_points(
+    lats,
+    t0,
+    /,
+    *,
+        dip = 0.0,
+    horizon = None,
+     margin = 0.0,
+):
+    """Classify some coordinates as being in polar day or polar night
+
+    This function uses the range of the solar declination over each day to find
+    which coordinates certainly have the Sun above the horizon all day (polar
+    day) and which certainly have it below the horizon all day (polar night),
+    without finding any sunrises or sunsets.
+
+    Parameters
+    ----------
+    lats : numpy.ndarray
+        the latitudes (in degrees)
+    t0 : numpy.ndarray
+        the start of each day as a column vector (in Julian Dates)
+    dip : float or numpy.ndarray, optional
+        the dip of the horizon (in degrees), either for all of the coordinates
+        or for each coordinate (see :func:`calc_horizon_dip`), which lowers the
+        horizon
+    horizon : float or numpy.ndarray, optional
+        the altitude of the centre of the Sun at sunrise and sunset (in
+        degrees), either for all of the coordinates or for each coordinate,
+        where None (or NaN) means the default horizon (see
+        :func:`calc_sun_times`)
+    margin : float, optional
+        the margin between the altitude of the Sun and the horizon which is
+        required to classify a coordinate (in degrees) (every engine uses the
+        default, so that they all agree on which coordinates are in polar day
+        and polar night)
+
+    Returns
+    -------
+    polarDay : numpy.ndarray
+        whether each coordinate is in polar day on each day
+    polarNight : numpy.ndarray
+        whether each coordinate is in polar night on each day
+
+    Notes
+    -----
+    The returned arrays have one row per day and one column per coordinate.
+    The lowest altitude of the Sun during a day is "|lat + decl| - 90" and the
+    highest is "90 - |lat - decl|", which are both evaluated for the lowest and
+    highest declination of the day (the declination is monotonic over a day).
+    The horizon is the one used by :func:`calc_sun_times` (by default, the upper
+    limb of the Sun with 37.25 arcminutes of atmospheric refraction).
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .calc_sun_position import calc_sun_position
+
+    # Find the range of the declination over each day ...
+    decl1, _, _ = calc_sun_position(t0)                                         # [rad]
+    decl2, _, dist = calc_sun_position(t0 + 1.0)                                # [rad], [AU]
+    declMin = numpy.degrees(numpy.minimum(decl1, decl2))                        # [°]
+    declMax = numpy.degrees(numpy.maximum(decl1, decl2))                        # [°]
+
+    # Find the altitude of the horizon ...
+    horizon = numpy.array(numpy.nan if horizon is None else horizon, dtype = numpy.float64) # [°]
+    h0 = numpy.where(numpy.isnan(horizon), -(37.25 / 60.0 + 959.63 / 3600.0 / dist), horizon) - dip # [°]
+
+    # Find the smallest value of "|lat + decl|" and of "|lat - decl|" over each
+    # day ...
+    lo = lats + declMin                                                         # [°]
+    hi = lats + declMax                                                         # [°]
+    sumMin = numpy.where(lo * hi <= 0.0, 0.0, numpy.minimum(numpy.abs(lo), numpy.abs(hi)))  # [°]
+    lo = lats - declMax                                                         # [°]
+    hi = lats - declMin                                                         # [°]
+    difMin = numpy.where(lo * hi <= 0.0, 0.0, numpy.minimum(numpy.abs(lo), numpy.abs(hi)))  # [°]
+
+    # Return answers ...
+    return sumMin - 90.0 > h0 + margin, 90.0 - difMin < h0 - margin
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def convert_db(
+    dbpathIn,
+    dbpathOut,
+    /,
+):
+    """Convert the database of points between formats
+
+    This function loads a database of points in either format and saves it in
+    the format implied by the output path (see :func:`save_db`), for example to
+    convert an existing "db.json" into a "db.bin".
+
+    Parameters
+    ----------
+    dbpathIn : str
+        the path to the existing database
+    dbpathOut : str
+        the path to save the converted database
+    """
+
+    # Import sub-functions ...
+    from .load_db import load_db
+    from .save_db import save_db
+
+    # Load database ...
+    territories = load_db(dbpathIn)
+
+    # Save database ...
+    save_db(dbpathOut, territories)
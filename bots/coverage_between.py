@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def coverage_between(
+    index,
+    t1,
+    t2,
+    /,
+):
+    """Find how long each territory is sunlit for between two times
+
+    This function uses an index (see :func:`build_sun_index`) to find how long
+    each territory, and the BOT as a whole, is sunlit for between two times,
+    with two binary searches for each territory.
+
+    Parameters
+    ----------
+    index : dict
+        the index
+    t1 : float
+        the start time (in seconds since the POSIX epoch)
+    t2 : float
+        the end time (in seconds since the POSIX epoch)
+
+    Returns
+    -------
+    coverage : dict
+        the sunlit time of each territory and of the BOT as a whole ("BOT")
+        (in seconds)
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Create short-hand function to find the total sunlit time before a
+    # time ...
+    def sunlit_before(intervals, t):
+        i = numpy.searchsorted(intervals["starts"], t, side = "right") - 1
+        if i < 0:
+            return 0.0
+        return float(intervals["cum"][i]) + float(min(t, intervals["ends"][i]) - intervals["starts"][i])
+
+    # Create dictionary of coverage ...
+    coverage = {}
+
+    # Loop over territories (and the BOT as a whole) ...
+    for territory, intervals in list(index["territories"].items()) + [("BOT", index["BOT"])]:
+        coverage[territory] = max(0.0, sunlit_before(intervals, t2) - sunlit_before(intervals, t1))    # [s]
+
+    # Return answer ...
+    return coverage
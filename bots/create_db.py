@@ -5,155 +5,302 @@ def create_db(
     dbpath,
     /,
     *,
-    onlyValid = False,
-       repair = False,
+        cacheDir = None,
+             dem = None,
+    minElevation = 100.0,
+           nIter = 100,
+       onlyValid = False,
+            pool = None,
+          repair = False,
+     territories = None,
+         workers = 1,
 ):
     """Create the database of points
 
     This function creates a database of all of the points along the coastline(s)
-    of each country in each territory.
+    of each country in each territory, along with the subset of those points
+    which can set the extreme sunrises and sunsets of the territory (see
+    :func:`prune_coords`). If the database already exists then only the
+    territories whose fingerprint has changed (see
+    :func:`calc_territory_fingerprint`) are re-made, and it is only saved again
+    if something has changed. If a Digital Elevation Model is given then the
+    elevation of each point is stored too, along with the peaks which can see
+    past the coastline (see :func:`find_dem_peaks`).
+
+    The points of each territory are stored as groups, one for each country and
+    one for each location, each of which is pruned on its own and records the
+    slices of "coords" and "extremalCoords" which it covers. A territory may
+    have a "validity" and its countries and locations may have their own
+    validities too ("countryValidity" and "locationValidity"), so that only the
+    groups which were valid on each day are surveyed (see
+    :func:`build_validity_index`).
+
+    The framing of the map of each territory is stored too (see
+    :func:`calc_territory_framings`), so that :func:`create_map` does not have
+    to find the middle of the points every time that a map is re-made.
 
     Parameters
     ----------
     dbpath : str
-        the path to save the database
+        the path to save the database (see :func:`save_db` for the formats)
+    cacheDir : str, optional
+        the directory to keep a persistent geometry cache in (see
+        :func:`load_country_polys`), and the DEM cache in (see
+        :func:`load_dem`)
+    dem : str, optional
+        the path to a Digital Elevation Model (see :func:`load_dem`)
+    minElevation : float, optional
+        the minimum elevation of a peak (in metres, see
+        :func:`find_dem_peaks`)
+    nIter : int, optional
+        the maximum number of iterations (particularly the Vincenty formula)
+        when finding the framing of the map of each territory
     onlyValid : bool, optional
         only return valid Polygons (checks for validity can take a while, if
         being called often)
+    pool : concurrent.futures.ProcessPoolExecutor, optional
+        the process pool to find the framings of the maps in (if None then one
+        is made, if "workers" is more than one)
     repair : bool, optional
         attempt to repair invalid Polygons
+    territories : dict, optional
+        the definitions of the territories (the default is the BOT, see
+        :func:`create_synthetic_shapefile` for another example)
+    workers : int, optional
+        the number of processes to use to find the framings of the maps (if
+        "pool" is None)
     """
 
     # Import standard modules ...
-    import json
-    import pathlib
+    import os
 
     # Import special modules ...
     try:
-        import cartopy
-        cartopy.config.update(
-            {
-                "cache_dir" : pathlib.PosixPath("~/.local/share/cartopy").expanduser(),
-            }
-        )
+        import numpy
     except:
-        raise Exception("\"cartopy\" is not installed; run \"pip install --user Cartopy\"") from None
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
 
-    # Import my modules ...
-    try:
-        import pyguymer3
-        import pyguymer3.geo
-    except:
-        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
-
-    # Create dictionary of countries ...
-    territories = {
-        "United Kingdom" : {
-            "countries" : ["United Kingdom"],
-            "locations" : [(-0.000500, 51.476852)],
-        },
-        "Akrotiri & Dhekelia" : {
-            "countries" : ["Akrotiri", "Dhekelia"],
-        },
-        "Anguilla" : {
-            "countries" : ["Anguilla"],
-        },
-        "British Antarctic Territory" : {
-            "countries" : ["Antarctica"],
-            "locations" : [(-50.0, -90.0)],
-        },
-        "Bermuda" : {
-            "countries" : ["Bermuda"],
-        },
-        "Cayman Islands" : {
-            "countries" : ["Cayman Is."],
-        },
-        "Falkland Islands" : {
-            "countries" : ["Falkland Is."],
-        },
-        "Gibraltar" : {
-            "countries" : ["Gibraltar"],
-        },
-        "South Georgia & the South Sandwich Islands" : {
-            "countries" : ["S. Geo. and the Is."],
-        },
-        "British Indian Ocean Territory" : {
-            "countries" : ["Br. Indian Ocean Ter."],
-        },
-        "Montserrat" : {
-            "countries" : ["Montserrat"],
-        },
-        "Pitcairn Islands" : {
-            "countries" : ["Pitcairn Is."],
-        },
-        "Saint Helena, Ascension & Tristan da Cunha" : {
-            "countries" : ["Saint Helena"],
-            "locations" : [(-14.3559158, -7.9467166), (-12.2776838, -37.1052489)],
-        },
-        "Turks and Caicos Islands" : {
-            "countries" : ["Turks and Caicos Is."],
-        },
-        "British Virgin Islands" : {
-            "countries" : ["British Virgin Is."],
-        },
-    }
-
-    # Find file containing all the country shapes ...
-    sfile = cartopy.io.shapereader.natural_earth(
-          category = "cultural",
-              name = "admin_0_countries",
-        resolution = "10m",
-    )
+    # Import sub-functions ...
+    from .calc_horizon_dip import calc_horizon_dip
+    from .calc_territory_fingerprint import calc_territory_fingerprint
+    from .calc_territory_framings import calc_territory_framings
+    from .find_dem_peaks import find_dem_peaks
+    from .load_country_polys import load_country_polys
+    from .load_db import load_db
+    from .load_dem import load_dem
+    from .load_territory_coords import load_territory_coords
+    from .prune_coords import prune_coords
+    from .sample_dem import sample_dem
+    from .save_db import save_db
+    from .start_stage import start_stage
+    from .stop_stage import stop_stage
+
+    # Create dictionary of countries (if needed) ...
+    if territories is None:
+        territories = {
+            "United Kingdom" : {
+                "countries" : ["United Kingdom"],
+                "locations" : [(-0.000500, 51.476852)],
+            },
+            "Akrotiri & Dhekelia" : {
+                "countries" : ["Akrotiri", "Dhekelia"],
+            },
+            "Anguilla" : {
+                "countries" : ["Anguilla"],
+            },
+            "British Antarctic Territory" : {
+                "countries" : ["Antarctica"],
+                "locations" : [(-50.0, -90.0)],
+                 "lonRange" : (-80.0, -20.0),
+                 "validity" : [("1962-03-03", None)],
+            },
+            "Bermuda" : {
+                "countries" : ["Bermuda"],
+            },
+            "Cayman Islands" : {
+                "countries" : ["Cayman Is."],
+            },
+            "Falkland Islands" : {
+                "countries" : ["Falkland Is."],
+            },
+            "Gibraltar" : {
+                "countries" : ["Gibraltar"],
+            },
+            "South Georgia & the South Sandwich Islands" : {
+                "countries" : ["S. Geo. and the Is."],
+            },
+            "British Indian Ocean Territory" : {
+                "countries" : ["Br. Indian Ocean Ter."],
+                 "validity" : [("1965-11-08", None)],
+            },
+            "Montserrat" : {
+                "countries" : ["Montserrat"],
+            },
+            "Pitcairn Islands" : {
+                "countries" : ["Pitcairn Is."],
+            },
+            "Saint Helena, Ascension & Tristan da Cunha" : {
+                "countries" : ["Saint Helena"],
+                "locations" : [(-14.3559158, -7.9467166), (-12.2776838, -37.1052489)],
+            },
+            "Turks and Caicos Islands" : {
+                "countries" : ["Turks and Caicos Is."],
+            },
+            "British Virgin Islands" : {
+                "countries" : ["British Virgin Is."],
+            },
+        }
+    else:
+        territories = {territory : dict(info) for territory, info in territories.items()}
+
+    # Load the existing database (if there is one) ...
+    oldTerritories = {}
+    if os.path.exists(dbpath):
+        oldTerritories = load_db(dbpath)
+
+    # Initialize the DEM (it is only loaded if a territory needs re-making) ...
+    demData = None
+
+    # Initialize counter ...
+    nRemade = 0                                                                 # [#]
 
     # Loop over territories ...
     for territory in sorted(list(territories.keys())):
+        # Find the fingerprint of the territory ...
+        fingerprint = calc_territory_fingerprint(
+            territories[territory],
+                     dem = dem,
+            minElevation = minElevation,
+               onlyValid = onlyValid,
+                  repair = repair,
+        )
+
+        # Re-use the existing entry if it is up to date ...
+        if oldTerritories.get(territory, {}).get("fingerprint") == fingerprint:
+            territories[territory] = oldTerritories[territory]
+            continue
+
         print(f"Finding locations for \"{territory}\" ...")
+        stage = start_stage(f"create_db/{territory}")
+        nRemade += 1                                                            # [#]
+
+        # Create short-hand ...
+        info = territories[territory]
 
-        # Create empty list ...
-        territories[territory]["coords"] = []
-
-        # Check if countries are defined ...
-        if "countries" in territories[territory]:
-            # Loop over records ...
-            for record in cartopy.io.shapereader.Reader(sfile).records():
-                # Create short-hand ...
-                neName = pyguymer3.geo.getRecordAttribute(record, "NAME")
-
-                # Skip this country if it is not for a country in the list ...
-                if neName not in territories[territory]["countries"]:
-                    continue
-
-                # Loop over Polygons ...
-                for poly in pyguymer3.geo.extract_polys(
-                    record.geometry,
-                    onlyValid = onlyValid,
-                       repair = repair,
-                ):
-                    # Loop over coordinates in exterior ring ...
-                    for coord in poly.exterior.coords:
-                        # Extract coordinate and add to list ...
-                        # NOTE: The BAT is a special case as not all of the
-                        #       shape is a BOT.
-                        lon, lat = coord                                        # [°], [°]
-                        if territory == "British Antarctic Territory":
-                            if -80.0 <= lon <= -20.0:
-                                territories[territory]["coords"].append((lon, lat))
-                        else:
-                            territories[territory]["coords"].append((lon, lat))
-
-        # Check if locations are defined ...
-        if "locations" in territories[territory]:
-            # Loop over locations ...
-            for loc in territories[territory]["locations"]:
-                # Add to the list ...
-                territories[territory]["coords"].append((loc[0], loc[1]))
+        # Split the territory into groups of points, one for each country and
+        # one for each location, so that each group can have its own validity
+        # (see :func:`build_validity_index`) ...
+        groups = []
+        for country in info.get("countries", []):
+            groups.append({"countries" : [country]})
+            if country in info.get("countryValidity", {}):
+                groups[-1]["validity"] = info["countryValidity"][country]
+        for iLoc, location in enumerate(info.get("locations", [])):
+            groups.append({"locations" : [location]})
+            if "locationValidity" in info and info["locationValidity"][iLoc] is not None:
+                groups[-1]["validity"] = info["locationValidity"][iLoc]
+
+        # Initialize lists ...
+        info["coords"] = []
+        info["extremalCoords"] = []
+        if dem is not None:
+            info["elevations"] = []                                             # [m]
+            info["extremalElevations"] = []                                     # [m]
+
+        # Loop over groups ...
+        for group in groups:
+            # Load the coordinates ...
+            coords = load_territory_coords(
+                group,
+                 cacheDir = cacheDir,
+                onlyValid = onlyValid,
+                   repair = repair,
+            )                                                                   # [°]
+
+            # Remove the coordinates which are not in the territory ...
+            # NOTE: Not all of the shape of some territories (such as the BAT)
+            #       is a BOT (the locations are always kept).
+            if "lonRange" in info and "countries" in group:
+                lonMin, lonMax = info["lonRange"]                               # [°], [°]
+                keep = (coords[:, 0] >= lonMin) & (coords[:, 0] <= lonMax)
+                coords = coords[keep, :]                                        # [°]
+
+            # Check if there is a DEM ...
+            if dem is not None:
+                # Load the DEM (if needed) ...
+                if demData is None:
+                    demData = load_dem(dem, cacheDir = cacheDir)
+
+                # Find the elevation of each point (assuming that points
+                # outside of the DEM are at sea level) ...
+                elevs = numpy.nan_to_num(sample_dem(demData, coords[:, 0], coords[:, 1]), nan = 0.0) # [m]
+
+                # Add the peaks which can see past the coastline ...
+                if "countries" in group:
+                    peaks = find_dem_peaks(
+                        demData,
+                        load_country_polys(
+                            group["countries"],
+                             cacheDir = cacheDir,
+                            onlyValid = onlyValid,
+                               repair = repair,
+                        ),
+                            lonRange = info.get("lonRange"),
+                        minElevation = minElevation,
+                    )                                                           # [°], [°], [m]
+                    coords = numpy.concatenate((coords, peaks[:, :2]))          # [°]
+                    elevs = numpy.concatenate((elevs, peaks[:, 2]))             # [m]
+            coords = [(lon, lat) for lon, lat in coords.tolist()]
+
+            # Find the points which can set the extreme sunrises and sunsets
+            # of the group ...
+            # NOTE: The extreme sunrises and sunsets of any combination of
+            #       groups are set by the points which set the extreme sunrises
+            #       and sunsets of one of the groups.
+            group["coords"] = [len(info["coords"]), len(info["coords"]) + len(coords)]
+            group["extremalCoords"] = [len(info["extremalCoords"]), len(info["extremalCoords"])]
+            info["coords"] += coords
+            if dem is not None:
+                info["elevations"] += elevs.tolist()                            # [m]
+                extremalCoords = set(
+                    prune_coords(
+                        coords,
+                        dips = calc_horizon_dip(elevs),
+                    )
+                )
+                for coord, elev in zip(coords, elevs.tolist(), strict = True):
+                    if coord in extremalCoords:
+                        info["extremalCoords"].append(coord)
+                        info["extremalElevations"].append(elev)                 # [m]
+            else:
+                info["extremalCoords"] += prune_coords(coords)
+            group["extremalCoords"][1] = len(info["extremalCoords"])
+
+        # Store the groups ...
+        info["groups"] = groups
+
+        # Store the fingerprint ...
+        territories[territory]["fingerprint"] = fingerprint
+        stop_stage(stage)
+
+    # Find the framing of the map of each territory which is missing or out of
+    # date ...
+    nRemade += calc_territory_framings(
+        territories,
+         cacheDir = cacheDir,
+            nIter = nIter,
+        onlyValid = onlyValid,
+             pool = pool,
+           repair = repair,
+          workers = workers,
+    )
+
+    # Check if the existing database is up to date ...
+    # NOTE: The database is not saved again if nothing in it has changed, so
+    #       that its modification time (and anything which is checked against
+    #       it) is left alone.
+    if len(oldTerritories) > 0 and nRemade == 0 and territories.keys() == oldTerritories.keys():
+        return
 
     # Save database ...
-    with open(dbpath, mode = "wt", encoding = "utf-8") as fObj:
-        json.dump(
-            territories,
-            fObj,
-            ensure_ascii = False,
-                  indent = 4,
-               sort_keys = True,
-        )
+    save_db(dbpath, territories)
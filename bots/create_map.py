@@ -1,5 +1,11 @@
 #!/usr/bin/env python3
 
+# Create cache ...
+# NOTE: This is a per-process cache, so that a process which creates many maps
+#       (see "create_maps()") re-uses one figure rather than creating (and
+#       allocating the canvas of) a new figure for each map.
+_figures = {}
+
 # Define function ...
 def create_map(
     name,
@@ -7,15 +13,20 @@ def create_map(
     fpath,
     /,
     *,
+     cacheDir = None,
         debug = __debug__,
         nIter = 100,
     onlyValid = False,
+     optimise = True,
        repair = False,
+        reuse = False,
       timeout = 60.0,
 ):
     """Create a map of a territory
 
-    This function creates a PNG map of all of the countries in a territory.
+    This function creates a PNG map of all of the countries in a territory,
+    framed by the framing in the database (if it is up to date, see
+    :func:`calc_territory_framings`).
 
     Parameters
     ----------
@@ -25,6 +36,9 @@ def create_map(
         the database entry for the territory
     fpath : str
         the path to save the PNG
+    cacheDir : str, optional
+        the directory to keep the persistent geometry caches in (see
+        :func:`load_country_polys` and :func:`simplify_country_polys`)
     debug : bool, optional
         print debug messages
     nIter : int, optional
@@ -32,14 +46,43 @@ def create_map(
     onlyValid : bool, optional
         only return valid Polygons (checks for validity can take a while, if
         being called often)
+    optimise : bool, optional
+        optimise the PNG (see :func:`queue_optimisation`)
     repair : bool, optional
         attempt to repair invalid Polygons
+    reuse : bool, optional
+        re-use the figure of this process (see :func:`create_maps`) rather than
+        creating a new figure
     timeout : float, optional
         the timeout for any requests/subprocess calls
+
+    Returns
+    -------
+    stats : dict
+        the time taken to create the map ("time", in seconds) and the peak
+        memory of this process so far ("peakMemory", in bytes)
+
+    Notes
+    -----
+    The axes of both halves of the map are centred on the territory, so they
+    (and the backgrounds which are projected onto them) are made for each map,
+    unless the figure of this process is re-used and the previous map of it had
+    the same framing, in which case only the artists of the territory are
+    removed from (and added to) the axes. The decoded background images are
+    kept for the lifetime of the process (see :func:`add_background`), so a
+    process which creates many maps only decodes them once.
+
+    The Polygons are drawn at the level of detail of each half of the map (see
+    :func:`simplify_country_polys`), so the overview of the whole globe does not
+    draw the full detail of the Natural Earth 10m shapefile.
     """
 
     # Import standard modules ...
+    import math
     import pathlib
+    import resource
+    import sys
+    import time
 
     # Import special modules ...
     try:
@@ -68,160 +111,156 @@ def create_map(
         import matplotlib.pyplot
     except:
         raise Exception("\"matplotlib\" is not installed; run \"pip install --user matplotlib\"") from None
-    try:
-        import numpy
-    except:
-        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
 
     # Import my modules ...
     try:
         import pyguymer3
         import pyguymer3.geo
-        import pyguymer3.image
     except:
         raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
 
-    # Find file containing all the country shapes ...
-    sfile = cartopy.io.shapereader.natural_earth(
-          category = "cultural",
-              name = "admin_0_countries",
-        resolution = "10m",
-    )
+    # Import sub-functions ...
+    from .add_background import add_background
+    from .calc_territory_framing import calc_territory_framing
+    from .load_country_polys import load_country_polys
+    from .load_territory_coords import load_territory_coords
+    from .queue_optimisation import queue_optimisation
+    from .simplify_country_polys import simplify_country_polys
 
     print(f"Creating map for \"{name}\" ...")
 
-    # Create empty lists ...
-    lons = numpy.empty((0), dtype = numpy.float64)                              # [°]
-    lats = numpy.empty((0), dtype = numpy.float64)                              # [°]
-
-    # Check if countries are defined ...
-    if "countries" in territory:
-        # Loop over records ...
-        for record in cartopy.io.shapereader.Reader(sfile).records():
-            # Create short-hand ...
-            neName = pyguymer3.geo.getRecordAttribute(record, "NAME")
-
-            # Skip this country if it is not for a country in the list ...
-            if neName not in territory["countries"]:
-                continue
-
-            # Loop over Polygons ...
-            for poly in pyguymer3.geo.extract_polys(
-                record.geometry,
-                onlyValid = onlyValid,
-                   repair = repair,
-            ):
-                # Convert the CoordinateSequence of the exterior LinearRing to a
-                # NumPy array ...
-                points = numpy.array(poly.exterior.coords)                      # [°]
+    # Start timer ...
+    tic = time.perf_counter()                                                   # [s]
 
-                # Add points to lists ...
-                lons = numpy.concatenate((lons, points[:, 0]))                  # [°]
-                lats = numpy.concatenate((lats, points[:, 1]))                  # [°]
-
-    # Check if locations are defined ...
-    if "locations" in territory:
-        # Loop over locations ...
-        for loc in territory["locations"]:
-            # Add points to lists ...
-            lons = numpy.append(lons, loc[0])                                   # [°]
-            lats = numpy.append(lats, loc[1])                                   # [°]
+    # Load the coordinates ...
+    coords = load_territory_coords(
+        territory,
+         cacheDir = cacheDir,
+        onlyValid = onlyValid,
+           repair = repair,
+    )                                                                           # [°]
+    lons = coords[:, 0]                                                         # [°]
+    lats = coords[:, 1]                                                         # [°]
 
     # Check that some points were found ...
     if lons.size == 0 or lats.size == 0:
         raise Exception(f"no points were found for \"{name}\"") from None
 
-    # Find the middle of the points ...
-    midLon, midLat, maxDist = pyguymer3.geo.find_middle_of_locs(
-        lons,
-        lats,
-         angConv = 0.1,
-            conv = 10000.0,                                                     # 10 km
-           debug = debug,
-          method = "GeodesicCircle",
-            nAng = 9,
-           nIter = nIter,
-         nRefine = 6,                                                           # 156.25 m
-             pad = 12.0 * 1852.0,
-        useSciPy = False,
-    )                                                                           # [°], [°], [m]
+    # Find the middle of the points (re-using the framing in the database, if
+    # it is up to date) ...
+    framing = calc_territory_framing(
+        coords,
+          debug = debug,
+        framing = territory.get("framing"),
+          nIter = nIter,
+    )
+    midLon = framing["midLon"]                                                  # [°]
+    midLat = framing["midLat"]                                                  # [°]
+    maxDist = framing["maxDist"]                                                # [m]
+
+    # Create plot (or re-use the plot of this process) ...
+    # NOTE: The axes (along with their backgrounds and coastlines) are only
+    #       re-used if the previous map of this process had the same framing,
+    #       as they are centred on the territory.
+    key = (midLon, midLat, maxDist)
+    if reuse:
+        if "map" not in _figures:
+            _figures["map"] = {
+                  "fg" : matplotlib.pyplot.figure(figsize = (12.8, 7.2)),
+                "axes" : None,
+                 "key" : None,
+            }
+        fg = _figures["map"]["fg"]
+        if _figures["map"]["key"] == key:
+            ax1, ax2 = _figures["map"]["axes"]
+    else:
+        fg = matplotlib.pyplot.figure(figsize = (12.8, 7.2))
+
+    # Check if the axes need creating ...
+    if not reuse or _figures["map"]["key"] != key:
+        # Clear the plot of the previous map (if there is one) ...
+        fg.clf()
 
-    # Create plot ...
-    fg = matplotlib.pyplot.figure(figsize = (12.8, 7.2))
+        # Create axes ...
+        ax1 = pyguymer3.geo.add_axis(
+            fg,
+            add_coastlines = True,
+             add_gridlines = True,
+                     debug = debug,
+                     index = 1,
+                       lat = midLat,
+                       lon = midLon,
+                     ncols = 2,
+                     nIter = nIter,
+                     nrows = 1,
+                 onlyValid = onlyValid,
+                    repair = repair,
+        )
+        ax2 = pyguymer3.geo.add_axis(
+            fg,
+              add_coastlines = True,
+               add_gridlines = True,
+                       debug = debug,
+                        dist = maxDist,
+                       index = 2,
+                         lat = midLat,
+                         lon = midLon,
+                       ncols = 2,
+                       nIter = nIter,
+                       nrows = 1,
+                   onlyValid = onlyValid,
+                      repair = repair,
+            satellite_height = False,
+        )
 
-    # Create axes ...
-    ax1 = pyguymer3.geo.add_axis(
-        fg,
-        add_coastlines = True,
-         add_gridlines = True,
+        # Configure axes ...
+        add_background(
+            ax1,
                  debug = debug,
-                 index = 1,
-                   lat = midLat,
-                   lon = midLon,
-                 ncols = 2,
-                 nIter = nIter,
-                 nrows = 1,
-             onlyValid = onlyValid,
-                repair = repair,
-    )
-    ax2 = pyguymer3.geo.add_axis(
-        fg,
-          add_coastlines = True,
-           add_gridlines = True,
-                   debug = debug,
-                    dist = maxDist,
-                   index = 2,
-                     lat = midLat,
-                     lon = midLon,
-                   ncols = 2,
-                   nIter = nIter,
-                   nrows = 1,
-               onlyValid = onlyValid,
-                  repair = repair,
-        satellite_height = False,
-    )
+            resolution = "large0512px",
+        )
+        add_background(
+            ax2,
+                 debug = debug,
+            resolution = "large8192px",
+        )
 
-    # Configure axes ...
-    pyguymer3.geo.add_map_background(
-        ax1,
-          debug = debug,
-        subName = "large0512px",
-    )
-    pyguymer3.geo.add_map_background(
-        ax2,
-          debug = debug,
-        subName = "large8192px",
-    )
+        # Save the axes (if the plot is re-used) ...
+        if reuse:
+            _figures["map"]["axes"] = (ax1, ax2)
+            _figures["map"]["key"] = key
+
+    # Create list of the artists of the territory ...
+    artists = []
 
     # Check if countries are defined ...
     if "countries" in territory:
-        # Loop over records ...
-        for record in cartopy.io.shapereader.Reader(sfile).records():
-            # Create short-hand ...
-            neName = pyguymer3.geo.getRecordAttribute(record, "NAME")
+        # Load the Polygons ...
+        polys = load_country_polys(
+            territory["countries"],
+             cacheDir = cacheDir,
+            onlyValid = onlyValid,
+               repair = repair,
+        )
 
-            # Skip this record if it is not for a country in the list ...
-            if neName not in territory["countries"]:
-                continue
+        # Loop over axes ...
+        for ax in [ax1, ax2]:
+            # Find the size of a pixel of the axis (assuming that the map
+            # projection is in metres) and simplify the Polygons to half of
+            # it ...
+            # NOTE: A degree of longitude is never longer than a degree of
+            #       latitude, so a tolerance in degrees which is correct for
+            #       latitude is also fine for longitude.
+            x0, x1 = ax.get_xlim()                                              # [m]
+            res = (x1 - x0) / ax.get_window_extent().width                      # [m/px]
+            tolerance = math.degrees(0.5 * res / 6371008.8)                     # [°]
 
-            # Add Polygons to axes ...
-            ax1.add_geometries(
-                pyguymer3.geo.extract_polys(
-                    record.geometry,
-                    onlyValid = onlyValid,
-                       repair = repair,
-                ),
-                cartopy.crs.PlateCarree(),
-                    alpha = 0.5,
-                    color = "red",
-                facecolor = "red",
-                linewidth = 0.1,
-            )
-            ax2.add_geometries(
-                pyguymer3.geo.extract_polys(
-                    record.geometry,
-                    onlyValid = onlyValid,
-                       repair = repair,
+            # Add Polygons to axis ...
+            artist = ax.add_geometries(
+                simplify_country_polys(
+                    polys,
+                    tolerance,
+                    cacheDir = cacheDir,
                 ),
                 cartopy.crs.PlateCarree(),
                     alpha = 0.5,
@@ -229,13 +268,14 @@ def create_map(
                 facecolor = "red",
                 linewidth = 0.1,
             )
+            artists.append(artist)
 
     # Check if locations are defined ...
     if "locations" in territory:
         # Loop over locations ...
         for loc in territory["locations"]:
             # Add location to axes ...
-            ax1.plot(
+            artists += ax1.plot(
                 loc[0],
                 loc[1],
                   transform = cartopy.crs.Geodetic(),
@@ -245,7 +285,7 @@ def create_map(
                       color = "red",
                 antialiased = True,
             )
-            ax2.plot(
+            artists += ax2.plot(
                 loc[0],
                 loc[1],
                   transform = cartopy.crs.Geodetic(),
@@ -261,13 +301,28 @@ def create_map(
     fg.tight_layout()
 
     # Save figure ...
-    fg.savefig(fpath)
-    matplotlib.pyplot.close(fg)
+    # NOTE: Only the artists of the territory are removed from a plot which is
+    #       re-used, so that the axes are ready for the next map.
+    try:
+        fg.savefig(fpath)
+    finally:
+        if reuse:
+            for artist in artists:
+                artist.remove()
+        else:
+            matplotlib.pyplot.close(fg)
 
-    # Optimize PNG ...
-    pyguymer3.image.optimise_image(
-        fpath,
-          debug = debug,
-          strip = True,
-        timeout = timeout,
-    )
+    # Optimize PNG (or queue it to be optimised in the background) ...
+    if optimise:
+        queue_optimisation(
+            fpath,
+              debug = debug,
+            timeout = timeout,
+        )
+
+    # Return answer ...
+    # NOTE: "ru_maxrss" is in bytes on MacOS and in kibibytes elsewhere.
+    return {
+        "peakMemory" : resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == "darwin" else 1024),   # [B]
+              "time" : time.perf_counter() - tic,                               # [s]
+    }
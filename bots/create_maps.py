@@ -6,16 +6,21 @@ def create_maps(
     territories,
     /,
     *,
+     cacheDir = None,
         debug = __debug__,
         nIter = 100,
     onlyValid = False,
+         pool = None,
        repair = False,
       timeout = 60.0,
+      workers = 1,
 ):
     """Create maps of all the territories
 
     This function creates PNG maps of all of the countries in all of the
-    territories.
+    territories. A PNG is only re-made if it is missing or if the fingerprint
+    of the territory (see :func:`calc_territory_fingerprint`) has changed since
+    it was made.
 
     Parameters
     ----------
@@ -23,6 +28,9 @@ def create_maps(
         the path to save the PNGs in
     territories : dict
         the database
+    cacheDir : str, optional
+        the directory to keep a persistent geometry cache in (see
+        :func:`load_country_polys`)
     debug : bool, optional
         print debug messages
     nIter : int, optional
@@ -30,28 +38,198 @@ def create_maps(
     onlyValid : bool, optional
         only return valid Polygons (checks for validity can take a while, if
         being called often)
+    pool : concurrent.futures.ProcessPoolExecutor, optional
+        the process pool to create the PNGs in (if None then one is made, if
+        "workers" is more than one)
     repair : bool, optional
         attempt to repair invalid Polygons
+    timeout : float, optional
+        the timeout for any requests/subprocess calls
+    workers : int, optional
+        the number of processes to use to create the PNGs (if "pool" is None)
+
+    Returns
+    -------
+    summary : dict
+        the paths of the PNGs which were made, the paths of the PNGs which were
+        skipped (because they are up to date) and the paths of the PNGs which
+        failed (along with the reason why), along with the time taken to make
+        each PNG and the peak memory of the process which made it so far (see
+        :func:`create_map`), which is not the memory used by that PNG alone
+
+    Notes
+    -----
+    A failure to create the PNG of one territory does not stop the PNGs of the
+    other territories from being created.
+
+    Each process (either this one or each worker of the process pool) re-uses
+    one figure, and the background images which it has already decoded (see
+    :func:`add_background`), for all of the PNGs that it makes.
+
+    If the optimisation queue of this process has been started (see
+    :func:`start_optimisations`) then the PNGs are optimised in the background
+    by this process, rather than by the workers of the process pool, so that
+    making the next PNG is never held up by optimising the last one. The
+    workers are forked when the first PNG is submitted to a new process pool,
+    so a process pool which was started before the queue (see :func:`run`)
+    should be given, as forking a process which has other threads running can
+    deadlock the workers.
+
+    The fingerprints of the territories that the PNGs were made from are kept
+    in "maps.json" in the output directory. If the database does not have any
+    fingerprints then a PNG is only re-made if it is missing.
     """
 
     # Import standard modules ...
+    import concurrent.futures
+    import contextlib
+    import json
     import os
 
+    # Import special modules ...
+    try:
+        import matplotlib
+        matplotlib.rcParams.update(
+            {
+                "backend" : "Agg",                                              # NOTE: See https://matplotlib.org/stable/gallery/user_interfaces/canvasagg.html
+            }
+        )
+        import matplotlib.pyplot
+    except:
+        raise Exception("\"matplotlib\" is not installed; run \"pip install --user matplotlib\"") from None
+
     # Import sub-functions ...
-    from .create_map import create_map
+    from .create_map import _figures, create_map
+    from .queue_optimisation import queue_optimisation
+    from .start_optimisations import _queue
+    from .start_stage import start_stage
+    from .stop_stage import stop_stage
+
+    # Create summary ...
+    summary = {
+           "made" : [],
+        "skipped" : [],
+         "failed" : {},
+          "stats" : {},
+    }
+
+    # Load the fingerprints of the territories that the existing PNGs were
+    # made from (if there are any) ...
+    mpath = f"{dirOut}/maps.json"
+    manifest = {}
+    if os.path.exists(mpath):
+        with open(mpath, mode = "rt", encoding = "utf-8") as fObj:
+            manifest = json.load(fObj)
+
+    # Create dictionary of the PNGs which need making ...
+    todo = {}
 
     # Loop over territories ...
     for territory in territories.keys():
-        # Make file path and create map (if needed) ...
+        # Make file path and skip it if it already exists and is up to date ...
         fpath = f"{dirOut}/{territory}.png"
-        if not os.path.exists(fpath):
-            create_map(
-                territory,
-                territories[territory],
-                fpath,
-                    debug = debug,
-                    nIter = nIter,
-                onlyValid = onlyValid,
-                   repair = repair,
-                  timeout = timeout,
+        fingerprint = territories[territory].get("fingerprint")
+        if os.path.exists(fpath) and (fingerprint is None or manifest.get(territory) == fingerprint):
+            summary["skipped"].append(fpath)
+            continue
+        todo[fpath] = territory
+
+    # Check if a process pool is required ...
+    if pool is not None or workers > 1:
+        # Create process pool (if one was not given) ...
+        # NOTE: A process pool which was given is not shut down.
+        if pool is None:
+            ctx = concurrent.futures.ProcessPoolExecutor(max_workers = workers)
+        else:
+            ctx = contextlib.nullcontext(pool)
+        with ctx as pool:
+            # Submit a task for each PNG ...
+            futures = {}
+            for fpath, territory in todo.items():
+                futures[fpath] = pool.submit(
+                    create_map,
+                    territory,
+                    territories[territory],
+                    fpath,
+                     cacheDir = cacheDir,
+                        debug = debug,
+                        nIter = nIter,
+                    onlyValid = onlyValid,
+                     optimise = len(_queue) == 0,
+                       repair = repair,
+                        reuse = True,
+                      timeout = timeout,
+                )
+
+            # Loop over tasks ...
+            for fpath, future in futures.items():
+                # Wait for the task and record its outcome ...
+                try:
+                    summary["stats"][fpath] = future.result()
+                except Exception as err:
+                    print(f"WARNING: Failed to create \"{fpath}\" ({err}).")
+                    summary["failed"][fpath] = f"{type(err).__name__}: {err}"
+                    continue
+                summary["made"].append(fpath)
+                manifest[todo[fpath]] = territories[todo[fpath]].get("fingerprint")
+
+                # Queue the PNG to be optimised in the background by this
+                # process (if the queue of this process has been started) ...
+                if len(_queue) > 0:
+                    queue_optimisation(
+                        fpath,
+                          debug = debug,
+                        timeout = timeout,
+                    )
+    else:
+        # Loop over PNGs ...
+        for fpath, territory in todo.items():
+            # Create map and record its outcome ...
+            stage = start_stage(f"create_map/{territory}")
+            try:
+                summary["stats"][fpath] = create_map(
+                    territory,
+                    territories[territory],
+                    fpath,
+                     cacheDir = cacheDir,
+                        debug = debug,
+                        nIter = nIter,
+                    onlyValid = onlyValid,
+                       repair = repair,
+                        reuse = True,
+                      timeout = timeout,
+                )
+            except Exception as err:
+                print(f"WARNING: Failed to create \"{fpath}\" ({err}).")
+                summary["failed"][fpath] = f"{type(err).__name__}: {err}"
+                continue
+            finally:
+                stop_stage(stage)
+            summary["made"].append(fpath)
+            manifest[territory] = territories[territory].get("fingerprint")
+
+    # Close the figure of this process (if there is one) ...
+    for fg in _figures.values():
+        matplotlib.pyplot.close(fg)
+    _figures.clear()
+
+    # Report the time taken to make each PNG and the peak memory ...
+    if debug:
+        for fpath, stats in summary["stats"].items():
+            print(f"INFO: Made \"{fpath}\" in {stats['time']:.1f} s (the peak memory of the process so far is {stats['peakMemory'] / 1048576.0:.1f} MiB).")
+
+    # Save the fingerprints (if any PNGs were made) ...
+    if len(summary["made"]) > 0:
+        tpath = f"{mpath}.{os.getpid():d}.tmp"
+        with open(tpath, mode = "wt", encoding = "utf-8") as fObj:
+            json.dump(
+                manifest,
+                fObj,
+                ensure_ascii = False,
+                      indent = 4,
+                   sort_keys = True,
             )
+        os.replace(tpath, mpath)
+
+    # Return answer ...
+    return summary
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def create_synthetic_shapefile(
+    dirOut,
+    /,
+    *,
+         nPoints = 64,
+    nTerritories = 4,
+):
+    """Create a synthetic Natural Earth shapefile
+
+    This function creates a small synthetic version of the Natural Earth 10m
+    admin_0 shapefile, containing one circular country per territory, along
+    with GSHHG coastline shapefiles of the same countries, in a directory which
+    can be used as the "pre_existing_data_dir" of cartopy, so that BOTS can be
+    run (and benchmarked, see :func:`run_benchmarks`) without any downloads.
+
+    Parameters
+    ----------
+    dirOut : str
+        the directory to create the shapefiles in (under
+        "shapefiles/natural_earth/cultural" and "shapefiles/gshhs")
+    nPoints : int, optional
+        the number of points in the coastline of each country
+    nTerritories : int, optional
+        the number of territories (and countries)
+
+    Returns
+    -------
+    territories : dict
+        the definitions of the territories (see :func:`create_db`)
+
+    Notes
+    -----
+    The countries are spread around the world, with a radius of half a degree,
+    so that their sunrises and sunsets are all different. The countries are
+    the land (level 1) of the GSHHG coastlines at every resolution, which are
+    drawn by :func:`pyguymer3.geo.add_axis` (see :func:`create_map`), and there
+    are no Antarctic ice fronts or grounding lines (levels 5 and 6). The
+    shapefiles are deterministic, so the same arguments always create the same
+    shapefiles.
+    """
+
+    # Import standard modules ...
+    import os
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+    try:
+        import shapefile
+    except:
+        raise Exception("\"shapefile\" is not installed; run \"pip install --user pyshp\"") from None
+
+    # Create short-hand ...
+    sdir = f"{dirOut}/shapefiles/natural_earth/cultural"
+
+    # Make output directory ...
+    if not os.path.exists(sdir):
+        os.makedirs(sdir)
+
+    # Find the angles of the points in the coastline of each country ...
+    # NOTE: The exterior ring of a Polygon in a shapefile is clockwise.
+    angs = numpy.linspace(2.0 * numpy.pi, 0.0, num = nPoints + 1)               # [rad]
+
+    # Create dictionary of territories and list of coastlines ...
+    territories = {}
+    rings = []
+
+    # Create shapefile ...
+    with shapefile.Writer(f"{sdir}/ne_10m_admin_0_countries", shapeType = shapefile.POLYGON) as sObj:
+        sObj.field("NAME", "C", size = 64)
+
+        # Loop over territories ...
+        for i in range(nTerritories):
+            # Find the middle of the country ...
+            lon = -170.0 + 340.0 * (i + 0.5) / nTerritories                     # [°]
+            lat = 60.0 * numpy.sin(2.4 * i + 1.0)                               # [°]
+
+            # Add the country to the shapefile ...
+            name = f"Synthetic {i:03d}"
+            ring = numpy.stack(
+                (
+                    lon + 0.5 * numpy.cos(angs) / numpy.cos(numpy.radians(lat)),
+                    lat + 0.5 * numpy.sin(angs),
+                ),
+                axis = 1,
+            )                                                                   # [°]
+            ring[-1, :] = ring[0, :]                                            # [°]
+            sObj.poly([ring.tolist()])
+            sObj.record(name)
+            rings.append(ring.tolist())
+
+            # Add the territory to the dictionary ...
+            territories[name] = {
+                "countries" : [name],
+            }
+
+    # Loop over resolutions and levels ...
+    for resolution in ["c", "l", "i", "h", "f"]:
+        for level in [1, 5, 6]:
+            # Make output directory ...
+            gdir = f"{dirOut}/shapefiles/gshhs/{resolution}"
+            if not os.path.exists(gdir):
+                os.makedirs(gdir)
+
+            # Create shapefile (with the countries as the land) ...
+            with shapefile.Writer(f"{gdir}/GSHHS_{resolution}_L{level:d}", shapeType = shapefile.POLYGON) as sObj:
+                sObj.field("level", "N", size = 2)
+                if level == 1:
+                    for ring in rings:
+                        sObj.poly([ring])
+                        sObj.record(level)
+
+    # Return answer ...
+    return territories
@@ -6,9 +6,21 @@ def create_timeline(
     territories,
     /,
     *,
-      debug = __debug__,
-          n = 10,
-    timeout = 60.0,
+      cacheDir = None,
+     cacheSize = 67108864,
+     chunkDays = None,
+         debug = __debug__,
+           dip = True,
+        engine = "ephem",
+      horizons = None,
+    includeBAT = True,
+       maxBars = 1000,
+             n = 10,
+      optimise = True,
+         prune = True,
+         start = None,
+       timeout = 60.0,
+       workers = 1,
 ):
     """Create a timeline
 
@@ -21,22 +33,63 @@ def create_timeline(
         the path to save the PNGs in
     territories : dict
         the database
+    cacheDir : str, optional
+        the directory to keep a persistent sunrise/sunset cache in (if None then
+        every day is calculated from scratch)
+    cacheSize : int, optional
+        the maximum total size of the sunrise/sunset cache (in bytes)
+    chunkDays : int, optional
+        the number of days in each task given to the process pool (the default
+        is one task per territory per block of days)
     debug : bool, optional
         print debug messages
+    dip : bool, optional
+        allow for the dip of the horizon of each point (if the database
+        contains their elevations, see :func:`create_db`)
+    engine : str, optional
+        the engine used to calculate the sunrises and sunsets (either "ephem",
+        "numpy" or "terminator", see :func:`calc_sun_territories`)
+    horizons : list of floats, optional
+        the altitudes of the centre of the Sun at sunrise and sunset (in
+        degrees), where None means the default horizon (see
+        :func:`calc_sun_territories`), which are all calculated in the same
+        pass and each drawn as its own band within the row of each territory,
+        from the top of the row to the bottom (if None then just the default
+        horizon is calculated and drawn)
+    includeBAT : bool, optional
+        include the British Antarctic Territory (which has dominated the
+        sunrise/sunset coverage of the BOT since 1962)
+    maxBars : int, optional
+        the maximum number of days to plot as individual bars for each
+        territory, beyond which consecutive bars which are less than a pixel
+        apart are merged
     n : int, optional
         the number of days to survey
+    optimise : bool, optional
+        optimise the PNG (see :func:`queue_optimisation`)
+    prune : bool, optional
+        only survey the points which can set the extreme sunrises and sunsets
+        (if the database contains them)
+    start : datetime.datetime, optional
+        the start of the survey (if it is naïve then it is assumed to be in
+        UTC, the default is 14/Oct/2016)
     timeout : float, optional
         the timeout for any requests/subprocess calls
+    workers : int, optional
+        the number of processes to use to find the sunrises and sunsets (the
+        results are identical to those found in serial)
+
+    Notes
+    -----
+    The sunrises and sunsets are found a block of days at a time by
+    :func:`iter_sun_events` (see :func:`calc_sun_territories`) and stored in
+    preallocated arrays.
     """
 
     # Import standard modules ...
     import datetime
 
     # Import special modules ...
-    try:
-        import ephem
-    except:
-        raise Exception("\"ephem\" is not installed; run \"pip install --user ephem\"") from None
     try:
         import matplotlib
         matplotlib.rcParams.update(
@@ -59,12 +112,64 @@ def create_timeline(
     except:
         raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
 
-    # Import my modules ...
-    try:
-        import pyguymer3
-        import pyguymer3.image
-    except:
-        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+    # Import sub-functions ...
+    from .find_start_date import find_start_date
+    from .iter_sun_events import iter_sun_events
+    from .queue_optimisation import queue_optimisation
+
+    # Create start date ...
+    d0 = find_start_date(start)
+
+    # Remove the BAT (if needed) ...
+    if not includeBAT:
+        territories = {
+            territory : info
+            for territory, info in territories.items()
+            if territory != "British Antarctic Territory"
+        }
+
+    # Find out how many horizons there are ...
+    nHorizons = 1 if horizons is None else len(horizons)                        # [#]
+
+    # Create arrays of the earliest and latest sunrises and sunsets of each day
+    # of each territory for each horizon ...
+    # NOTE: The days on which no points are valid keep the initial values of
+    #       the counters, just like in "calc_sun_ephem()".
+    results = {}
+    for territory in territories.keys():
+        results[territory] = numpy.zeros((n, nHorizons, 4), dtype = numpy.int64)   # [s]
+        results[territory][:, :, 0] = pow(2, 62)                                # [s]
+        results[territory][:, :, 2] = pow(2, 62)                                # [s]
+
+    # Loop over records ...
+    # NOTE: The records are in day order, then in the order of the territories
+    #       in the database and then in the order of the horizons.
+    for i, record in enumerate(
+        iter_sun_events(
+            territories,
+            d0,
+            n,
+             cacheDir = cacheDir,
+            cacheSize = cacheSize,
+            chunkDays = chunkDays,
+                  dip = dip,
+               engine = engine,
+             horizons = horizons,
+                prune = prune,
+              workers = workers,
+        )
+    ):
+        # Skip days on which no points are valid ...
+        if record["risMin"] is None:
+            continue
+
+        # Store record ...
+        results[record["territory"]][i // (len(territories) * nHorizons), i % nHorizons, :] = (
+            record["risMin"],
+            record["risMax"],
+            record["setMin"],
+            record["setMax"],
+        )                                                                       # [s]
 
     # Create figure ...
     fg = matplotlib.pyplot.figure()
@@ -76,159 +181,96 @@ def create_timeline(
     ax.xaxis_date()
     ax.xaxis.grid(True)
 
-    # Create observer ...
-    obs = ephem.Observer()
+    # Find the width of a pixel ...
+    # NOTE: This is the width of a pixel across the whole figure, which is a
+    #       lower bound on the width of a pixel across the axis.
+    pixel = (n - 3) / (fg.get_figwidth() * fg.dpi)                              # [day]
+
+    # Create short-hand function to merge the consecutive bars whose gap is
+    # less than a pixel ...
+    def merge_bars(lefts, widths):
+        rights = lefts + widths                                                 # [day]
+        starts = numpy.concatenate(([True], lefts[1:] - rights[:-1] >= pixel))
+        inds = numpy.flatnonzero(starts)
+        ends = numpy.maximum.reduceat(rights, inds)                             # [day]
+        return lefts[inds], ends - lefts[inds]
 
     # Set counter ...
     j = 0                                                                       # [#]
 
     # Loop over territories ...
     for territory in territories.keys():
-        print(f"Finding sunrises and sunsets for \"{territory}\" ...")
-
-        # Create start date ...
-        d0 = ephem.Date((2016, 10, 14, 0, 0, 0))
-
-        # Create empty lists ...
-        risMins = numpy.zeros(n, dtype = numpy.uint64)                          # [s]
-        risMaxs = numpy.zeros(n, dtype = numpy.uint64)                          # [s]
-        setMins = numpy.zeros(n, dtype = numpy.uint64)                          # [s]
-        setMaxs = numpy.zeros(n, dtype = numpy.uint64)                          # [s]
-
-        # Loop over days ...
-        for i in range(n):
-            # Initialize counters ...
-            risMins[i] = pow(2, 62)                                             # [s]
-            setMins[i] = pow(2, 62)                                             # [s]
-
-            # Loop over coordinates ...
-            for coord in territories[territory]["coords"]:
-                # Update observer ...
-                # HACK: Must be a crude string otherwise it does not set it
-                #       correctly.
-                obs.long = str(coord[0])                                        # [°]
-                obs.lat = str(coord[1])                                         # [°]
-
-                # Find sunrise and sunset as 'naïve' datetime objects in UTC ...
-                try:
-                    d1 = obs.next_rising(ephem.Sun(), ephem.Date(d0 + i)).datetime()
-                except ephem.AlwaysUpError:
-                    continue
-                try:
-                    d2 = obs.next_setting(ephem.Sun(), ephem.Date(d1)).datetime()
-                except ephem.AlwaysUpError:
-                    continue
-
-                # Convert sunrise and sunset to 'aware' datetime objects in UTC ...
-                d1 = d1.replace(tzinfo = datetime.UTC)
-                d2 = d2.replace(tzinfo = datetime.UTC)
-
-                # Convert sunrise and sunset to floats since the POSIX epoch ...
-                # NOTE: There used to be many clunky ways of converting a
-                #       datetime object into a number. The neatest way uses
-                #       "strftime()" but this is bad for two reasons:
-                #         1) it is not supported on Windows; and
-                #         2) it ignores the "tzinfo" data.
-                #       This last point took over an hour to identify. The
-                #       following two threads put me out of my misery:
-                #         1) https://stackoverflow.com/a/19801863; and
-                #         2) https://bugs.python.org/issue12750#msg142245
-                #       Then Python 3.3 came along and added the ".timestamp()"
-                #       method.
-                t1 = d1.timestamp()                                             # [s]
-                t2 = d2.timestamp()                                             # [s]
-
-                # Overwrite counters if needed ...
-                risMins[i] = min(t1, risMins[i])                                # [s]
-                risMaxs[i] = max(t1, risMaxs[i])                                # [s]
-                setMins[i] = min(t2, setMins[i])                                # [s]
-                setMaxs[i] = max(t2, setMaxs[i])                                # [s]
-
-        # Convert floats since the POSIX epoch to MatPlotLib dates ...
-        # NOTE: Just count how many different kinds the same date is represented
-        #       with in this script and try to tell me with a straight face that
-        #       it is convenient and efficient.
-        x1 = []
-        x2 = []
-        dx1 = []
-        dx2 = []
-        for i in range(n):
-            x1.append(
-                matplotlib.dates.date2num(
-                    datetime.datetime.fromtimestamp(
-                        risMins[i],
-                        tz = datetime.UTC,
-                    )
-                )
-            )
-            x2.append(
-                matplotlib.dates.date2num(
-                    datetime.datetime.fromtimestamp(
-                        risMaxs[i],
-                        tz = datetime.UTC,
-                    )
-                )
-            )
-            dx1.append(
-                matplotlib.dates.date2num(
-                    datetime.datetime.fromtimestamp(
-                        setMaxs[i],
-                        tz = datetime.UTC,
-                    )
-                ) -
-                matplotlib.dates.date2num(
-                    datetime.datetime.fromtimestamp(
-                        risMins[i],
-                        tz = datetime.UTC,
-                    )
-                )
+        # Loop over horizons ...
+        for k in range(nHorizons):
+            # Create short-hands ...
+            # NOTE: The days on which no points are valid (or on which no
+            #       point sees the Sun rise or set for this horizon) keep the
+            #       initial values of the counters, so they are dropped rather
+            #       than drawn as bars with huge negative widths.
+            risMins, risMaxs, setMins, setMaxs = results[territory][:, k, :].T  # [s], [s], [s], [s]
+            valid = (risMins < pow(2, 62)) & (setMins < pow(2, 62))
+            risMins = risMins[valid]                                            # [s]
+            risMaxs = risMaxs[valid]                                            # [s]
+            setMins = setMins[valid]                                            # [s]
+            setMaxs = setMaxs[valid]                                            # [s]
+
+            # Convert floats since the POSIX epoch to MatPlotLib dates ...
+            # NOTE: Just count how many different kinds the same date is
+            #       represented with in this script and try to tell me with a
+            #       straight face that it is convenient and efficient.
+            x1 = matplotlib.dates.date2num(risMins.astype(numpy.int64).astype("datetime64[s]"))
+            x2 = matplotlib.dates.date2num(risMaxs.astype(numpy.int64).astype("datetime64[s]"))
+            dx1 = matplotlib.dates.date2num(setMaxs.astype(numpy.int64).astype("datetime64[s]")) - x1
+            dx2 = matplotlib.dates.date2num(setMins.astype(numpy.int64).astype("datetime64[s]")) - x2
+
+            # Merge consecutive bars which are less than a pixel apart (if
+            # there are too many to plot individually) ...
+            if n > maxBars and x1.size > 0:
+                x1, dx1 = merge_bars(x1, dx1)
+                x2, dx2 = merge_bars(x2, dx2)
+
+            # Find the centre and the height of the band of this horizon ...
+            height = 0.8 / nHorizons
+            y = 0.9 + j - height * (k + 0.5)
+
+            # Plot data ...
+            ax.barh(
+                numpy.zeros(x1.size, dtype = numpy.float64) + y,
+                dx1,
+                   height = height,
+                     left = x1,
+                    align = "center",
+                    alpha = 0.5,
+                    color = matplotlib.colormaps["turbo"](float(j) / float(max(1, len(territories) - 1))),
+                linewidth = 0.1,
             )
-            dx2.append(
-                matplotlib.dates.date2num(
-                    datetime.datetime.fromtimestamp(
-                        setMins[i],
-                        tz = datetime.UTC,
-                    )
-                ) -
-                matplotlib.dates.date2num(
-                    datetime.datetime.fromtimestamp(
-                        risMaxs[i],
-                        tz = datetime.UTC,
-                    )
-                )
+            ax.barh(
+                numpy.zeros(x2.size, dtype = numpy.float64) + y,
+                dx2,
+                   height = height,
+                     left = x2,
+                    align = "center",
+                    color = matplotlib.colormaps["turbo"](float(j) / float(max(1, len(territories) - 1))),
+                    label = territory if k == 0 else None,
+                linewidth = 0.1,
             )
 
-        # Plot data ...
-        ax.barh(
-            numpy.zeros(n, dtype = numpy.float64) + 0.5 + j,
-            dx1,
-               height = 0.8,
-                 left = x1,
-                align = "center",
-                alpha = 0.5,
-                color = matplotlib.colormaps["turbo"](float(j) / float(len(territories) - 1)),
-            linewidth = 0.1,
-        )
-        ax.barh(
-            numpy.zeros(n, dtype = numpy.float64) + 0.5 + j,
-            dx2,
-               height = 0.8,
-                 left = x2,
-                align = "center",
-                color = matplotlib.colormaps["turbo"](float(j) / float(len(territories) - 1)),
-                label = territory,
-            linewidth = 0.1,
-        )
-
         # Increment counter ...
         j += 1                                                                  # [#]
 
     # Configure axis ...
     ax.legend(loc = "upper center")
-    ax.set_title("Sunrises and sunsets in the BOT")
+    if horizons is None:
+        ax.set_title("Sunrises and sunsets in the BOT")
+    else:
+        ax.set_title(
+            "Sunrises and sunsets in the BOT (bands from top to bottom: " + ", ".join(
+                "default horizon" if horizon is None else f"{horizon:+.1f}°" for horizon in horizons
+            ) + ")"
+        )
     ax.set_xlim(
-        matplotlib.dates.date2num(ephem.Date(d0 + 1).datetime()),
-        matplotlib.dates.date2num(ephem.Date(d0 + n - 2).datetime())
+        matplotlib.dates.date2num(d0 + datetime.timedelta(days = 1)),
+        matplotlib.dates.date2num(d0 + datetime.timedelta(days = n - 2)),
     )
     ax.set_ylim(0, len(territories))
     ax.set_yticks([], [])
@@ -240,10 +282,10 @@ def create_timeline(
     fg.savefig(f"{dirOut}/plot.png")
     matplotlib.pyplot.close(fg)
 
-    # Optimize PNG ...
-    pyguymer3.image.optimise_image(
-        f"{dirOut}/plot.png",
-          debug = debug,
-          strip = True,
-        timeout = timeout,
-    )
+    # Optimize PNG (or queue it to be optimised in the background) ...
+    if optimise:
+        queue_optimisation(
+            f"{dirOut}/plot.png",
+              debug = debug,
+            timeout = timeout,
+        )
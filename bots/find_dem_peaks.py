@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def find_dem_peaks(
+    dem,
+    polys,
+    /,
+    *,
+           chunk = 1024,
+        lonRange = None,
+    minElevation = 100.0,
+):
+    """Find the peaks in a territory which can see past its coastline
+
+    This function finds the peaks of a Digital Elevation Model (see
+    :func:`load_dem`) within the Polygons of a territory whose horizon reaches
+    beyond the coastline, which are the only inland points which can change
+    the extreme sunrises and sunsets of the territory.
+
+    Parameters
+    ----------
+    dem : dict
+        the DEM
+    polys : list of shapely.geometry.polygon.Polygon
+        the Polygons of the territory
+    chunk : int, optional
+        the number of rows of the DEM to search at once
+    lonRange : tuple of floats, optional
+        the range of longitudes of the territory (in degrees), if only some of
+        the Polygons are in the territory
+    minElevation : float, optional
+        the minimum elevation of a peak (in metres)
+
+    Returns
+    -------
+    peaks : numpy.ndarray
+        the (longitude, latitude, elevation) of each peak (in degrees, degrees
+        and metres) as a (M, 3) array
+
+    Notes
+    -----
+    An observer at elevation "h" sees the Sun rise (or set) when it rises (or
+    sets) at sea level a distance equal to the dip of the horizon (see
+    :func:`calc_horizon_dip`) away, so each point can be thought of as a cap
+    whose radius is its dip. A peak only matters if its cap reaches beyond the
+    coastline (which is at sea level) and is not inside the cap of another
+    peak. The DEM is searched a chunk of rows at a time for cells which are
+    higher than their eight neighbours, which are then filtered with these two
+    tests; the distance to the coastline is measured in degrees of longitude
+    and latitude, allowing for the convergence of the meridians, so the first
+    test keeps a few too many peaks rather than too few.
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+    try:
+        import shapely
+        import shapely.geometry
+    except:
+        raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+    # Import sub-functions ...
+    from .calc_horizon_dip import calc_horizon_dip
+
+    # Create short-hands ...
+    elev = dem["elev"]                                                          # [m]
+    ny, nx = elev.shape                                                         # [#], [#]
+
+    # Check that there are some Polygons ...
+    if len(polys) == 0:
+        return numpy.zeros((0, 3), dtype = numpy.float64)
+
+    # Find the rows and columns of the DEM which cover the Polygons ...
+    lonMin, latMin, lonMax, latMax = shapely.total_bounds(polys)                # [°]
+    cols = sorted([(lonMin - dem["lon0"]) / dem["dlon"], (lonMax - dem["lon0"]) / dem["dlon"]])
+    rows = sorted([(latMin - dem["lat0"]) / dem["dlat"], (latMax - dem["lat0"]) / dem["dlat"]])
+    c0 = max(0, int(numpy.floor(cols[0])))                                      # [#]
+    c1 = min(nx, int(numpy.ceil(cols[1])) + 1)                                  # [#]
+    r0 = max(0, int(numpy.floor(rows[0])))                                      # [#]
+    r1 = min(ny, int(numpy.ceil(rows[1])) + 1)                                  # [#]
+
+    # Loop over chunks of rows ...
+    peaks = []
+    for i0 in range(r0, r1, chunk):
+        i1 = min(r1, i0 + chunk)
+
+        # Load the chunk with a border of one cell (treating missing data and
+        # cells outside of the DEM as infinitely low) ...
+        block = numpy.full((i1 - i0 + 2, c1 - c0 + 2), -numpy.inf, dtype = numpy.float32)  # [m]
+        j0 = max(0, i0 - 1)
+        j1 = min(ny, i1 + 1)
+        k0 = max(0, c0 - 1)
+        k1 = min(nx, c1 + 1)
+        block[j0 - i0 + 1:j1 - i0 + 1, k0 - c0 + 1:k1 - c0 + 1] = elev[j0:j1, k0:k1]   # [m]
+        block[numpy.isnan(block)] = -numpy.inf                                  # [m]
+
+        # Find the cells which are high enough and at least as high as their
+        # eight neighbours ...
+        centre = block[1:-1, 1:-1]                                              # [m]
+        isPeak = centre >= minElevation
+        for dy in [-1, 0, 1]:
+            for dx in [-1, 0, 1]:
+                if dy == 0 and dx == 0:
+                    continue
+                isPeak &= centre >= block[1 + dy:block.shape[0] - 1 + dy, 1 + dx:block.shape[1] - 1 + dx]
+
+        # Add the peaks to the list ...
+        iy, ix = numpy.nonzero(isPeak)
+        peaks.append(
+            numpy.stack(
+                (
+                    dem["lon0"] + dem["dlon"] * (ix + c0),
+                    dem["lat0"] + dem["dlat"] * (iy + i0),
+                    centre[iy, ix].astype(numpy.float64),
+                ),
+                axis = 1,
+            )
+        )                                                                       # [°], [°], [m]
+    peaks = numpy.concatenate([numpy.zeros((0, 3), dtype = numpy.float64)] + peaks)
+
+    # Keep the peaks which are in the territory ...
+    keep = numpy.zeros(peaks.shape[0], dtype = bool)
+    for poly in polys:
+        keep |= shapely.contains_xy(poly, peaks[:, 0], peaks[:, 1])
+    if lonRange is not None:
+        keep &= (peaks[:, 0] >= lonRange[0]) & (peaks[:, 0] <= lonRange[1])
+    peaks = peaks[keep, :]                                                      # [°], [°], [m]
+
+    # Keep the peaks whose horizon reaches beyond the coastline ...
+    dips = calc_horizon_dip(peaks[:, 2])                                        # [°]
+    coast = shapely.geometry.MultiLineString(
+        [ring.coords for poly in polys for ring in [poly.exterior] + list(poly.interiors)]
+    )
+    shapely.prepare(coast)
+    keep = shapely.dwithin(
+        coast,
+        shapely.points(peaks[:, 0], peaks[:, 1]),
+        dips / numpy.maximum(numpy.cos(numpy.radians(peaks[:, 1])), 1.0e-3),
+    )
+    peaks = peaks[keep, :]                                                      # [°], [°], [m]
+    dips = dips[keep]                                                           # [°]
+
+    # Convert the peaks to unit vectors ...
+    lons = numpy.radians(peaks[:, 0])                                           # [rad]
+    lats = numpy.radians(peaks[:, 1])                                           # [rad]
+    xyz = numpy.stack(
+        (
+            numpy.cos(lats) * numpy.cos(lons),
+            numpy.cos(lats) * numpy.sin(lons),
+            numpy.sin(lats),
+        ),
+        axis = 1,
+    )
+
+    # Remove the peaks which are inside the cap of another peak ...
+    keep = numpy.ones(peaks.shape[0], dtype = bool)
+    step = max(1, 1048576 // max(1, peaks.shape[0]))                            # [#]
+    for i0 in range(0, peaks.shape[0], step):
+        i1 = min(peaks.shape[0], i0 + step)
+        dist = numpy.degrees(numpy.arccos(numpy.clip(xyz[i0:i1, :] @ xyz.T, -1.0, 1.0)))  # [°]
+        inside = dist + dips[i0:i1].reshape(-1, 1) < dips.reshape(1, -1)
+        keep[i0:i1] = ~inside.any(axis = 1)
+
+    # Return answer ...
+    return peaks[keep, :]                                                       # [°], [°], [m]
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def find_start_date(
+    start,
+    /,
+):
+    """Find the start date of a survey
+
+    This function converts the start of a survey into an 'aware' datetime
+    object in UTC.
+
+    Parameters
+    ----------
+    start : datetime.datetime
+        the start of the survey (if it is naïve then it is assumed to be in
+        UTC, if it is None then it is 14/Oct/2016)
+
+    Returns
+    -------
+    d0 : datetime.datetime
+        the start of the survey (in UTC)
+    """
+
+    # Import standard modules ...
+    import datetime
+
+    # Return answer ...
+    if start is None:
+        return datetime.datetime(2016, 10, 14, 0, 0, 0, tzinfo = datetime.UTC)
+    if start.tzinfo is None:
+        return start.replace(tzinfo = datetime.UTC)
+    return start.astimezone(datetime.UTC)
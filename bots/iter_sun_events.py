@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def iter_sun_events(
+    territories,
+    start,
+    n,
+    /,
+    *,
+    blockDays = 366,
+     cacheDir = None,
+    cacheSize = 67108864,
+    chunkDays = None,
+          dip = True,
+       engine = "ephem",
+     horizons = None,
+        prune = True,
+      workers = 1,
+):
+    """Iterate over the extreme sunrises and sunsets of all of the territories
+
+    This generator yields the earliest and latest sunrises and sunsets of each
+    territory on each day of a survey, one record at a time, calculating a
+    block of days at a time (see :func:`calc_sun_territories`) so that the
+    memory does not grow with the length of the survey.
+
+    Parameters
+    ----------
+    territories : dict
+        the database
+    start : datetime.datetime
+        the start of the survey (see :func:`find_start_date`)
+    n : int
+        the number of days to survey (if None then the survey never ends)
+    blockDays : int, optional
+        the number of days to calculate at once
+    cacheDir : str, optional
+        the directory to keep a persistent sunrise/sunset cache in (if None then
+        every day is calculated from scratch)
+    cacheSize : int, optional
+        the maximum total size of the sunrise/sunset cache (in bytes)
+    chunkDays : int, optional
+        the number of days in each task given to the process pool (the default
+        is one task per territory per block)
+    dip : bool, optional
+        allow for the dip of the horizon of each point (if the database
+        contains their elevations, see :func:`create_db`)
+    engine : str, optional
+        the engine used to calculate the sunrises and sunsets (either "ephem",
+        "numpy" or "terminator", see :func:`calc_sun_territories`)
+    horizons : list of floats, optional
+        the altitudes of the centre of the Sun at sunrise and sunset (in
+        degrees), where None means the default horizon (see
+        :func:`calc_sun_territories`), which are all calculated in the same
+        pass (if None then just the default horizon is calculated)
+    prune : bool, optional
+        only survey the points which can set the extreme sunrises and sunsets
+        (if the database contains them)
+    workers : int, optional
+        the number of processes to use to find the sunrises and sunsets
+
+    Yields
+    ------
+    record : dict
+        the name of the territory ("territory"), the start of the day ("day",
+        as an ISO 8601 string) and the earliest sunrise ("risMin"), the latest
+        sunrise ("risMax"), the earliest sunset ("setMin") and the latest sunset
+        ("setMax") of the territory on the day (in seconds since the POSIX
+        epoch, or None if the Sun does not rise or set for any of the points),
+        along with the horizon ("horizon") if "horizons" is not None
+
+    Notes
+    -----
+    The records are in day order, then in the order of the territories in the
+    database and then (if "horizons" is not None) in the order of the
+    horizons.
+    """
+
+    # Import standard modules ...
+    import datetime
+    import itertools
+
+    # Import sub-functions ...
+    from .calc_sun_territories import calc_sun_territories
+    from .find_start_date import find_start_date
+
+    # Create start date ...
+    d0 = find_start_date(start)
+
+    # Loop over blocks of days ...
+    for i0 in itertools.count(0, blockDays):
+        if n is not None and i0 >= n:
+            return
+        nBlock = blockDays if n is None else min(blockDays, n - i0)             # [#]
+
+        # Find the earliest and latest sunrises and sunsets of each day of each
+        # territory in this block of days ...
+        results = calc_sun_territories(
+            territories,
+            d0 + datetime.timedelta(days = i0),
+            nBlock,
+             cacheDir = cacheDir,
+            cacheSize = cacheSize,
+            chunkDays = chunkDays,
+                  dip = dip,
+               engine = engine,
+             horizons = horizons,
+                prune = prune,
+              workers = workers,
+        )                                                                       # [s]
+
+        # Loop over days ...
+        for i in range(nBlock):
+            day = (d0 + datetime.timedelta(days = i0 + i)).isoformat()
+
+            # Loop over territories ...
+            for territory, arr in results.items():
+                # Loop over horizons ...
+                for k, horizon in enumerate([None] if horizons is None else horizons):
+                    # Create short-hand ...
+                    vals = arr[i, :] if horizons is None else arr[i, :, k]      # [s]
+
+                    # Create record ...
+                    # NOTE: The days on which no points are valid keep the
+                    #       initial values of the counters (see
+                    #       "calc_sun_ephem()").
+                    valid = int(vals[0]) < pow(2, 62)
+                    record = {
+                        "territory" : territory,
+                              "day" : day,
+                           "risMin" : int(vals[0]) if valid else None,
+                           "risMax" : int(vals[1]) if valid else None,
+                           "setMin" : int(vals[2]) if valid else None,
+                           "setMax" : int(vals[3]) if valid else None,
+                    }
+                    if horizons is not None:
+                        record["horizon"] = horizon
+
+                    # Yield record ...
+                    yield record
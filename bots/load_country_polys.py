@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+
+# Create caches ...
+# NOTE: These are per-process caches, so that the shapefile is only scanned
+#       once and the Polygons of each country are only extracted once, no
+#       matter how many territories ask for them.
+_records = {}
+_polys = {}
+
+# Define function ...
+def load_country_polys(
+    countries,
+    /,
+    *,
+     cacheDir = None,
+    onlyValid = False,
+       repair = False,
+):
+    """Load the Polygons of some countries
+
+    This function loads the Polygons of some countries from the Natural Earth
+    10m admin_0 shapefile. The first call scans the shapefile once and indexes
+    every record by its "NAME"; subsequent calls re-use the index.
+
+    Parameters
+    ----------
+    countries : list of str
+        the Natural Earth names of the countries
+    cacheDir : str, optional
+        the directory to keep a persistent geometry cache in (if None then the
+        shapefile is parsed by every process)
+    onlyValid : bool, optional
+        only return valid Polygons (checks for validity can take a while, if
+        being called often)
+    repair : bool, optional
+        attempt to repair invalid Polygons
+
+    Returns
+    -------
+    polys : list of shapely.geometry.polygon.Polygon
+        the Polygons, in the order that they appear in the shapefile
+
+    Notes
+    -----
+    The persistent geometry cache stores the already-extracted (and
+    already-repaired) Polygons of every country which has been asked for as
+    WKB. It is keyed on the path, size and modification time of the shapefile
+    and on "onlyValid" and "repair". If every country is in the cache then the
+    cache is memory-mapped and the shapefile is not parsed at all.
+    """
+
+    # Import standard modules ...
+    import os
+    import pathlib
+
+    # Import special modules ...
+    try:
+        import cartopy
+        cartopy.config.update(
+            {
+                "cache_dir" : pathlib.PosixPath("~/.local/share/cartopy").expanduser(),
+            }
+        )
+    except:
+        raise Exception("\"cartopy\" is not installed; run \"pip install --user Cartopy\"") from None
+    try:
+        import shapely
+    except:
+        raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+        import pyguymer3.geo
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # Import sub-functions ...
+    from .load_geometry_cache import load_geometry_cache
+    from .record_count import record_count
+    from .save_geometry_cache import save_geometry_cache
+
+    # Find file containing all the country shapes ...
+    sfile = cartopy.io.shapereader.natural_earth(
+          category = "cultural",
+              name = "admin_0_countries",
+        resolution = "10m",
+    )
+
+    # Create set of the countries which have been found ...
+    found = set()
+
+    # Create list of the indices of the records which are wanted ...
+    inds = []
+
+    # Check if there is a persistent geometry cache ...
+    if cacheDir is not None:
+        # Create short-hands ...
+        cpath = f"{cacheDir}/geometry-cache_onlyValid={onlyValid}_repair={repair}.bin"
+        stat = os.stat(sfile)
+        key = {
+                "sfile" : str(sfile),
+                 "size" : stat.st_size,
+                "mtime" : stat.st_mtime_ns,
+            "onlyValid" : onlyValid,
+               "repair" : repair,
+        }
+
+        # Load the geometry cache ...
+        header, buf = load_geometry_cache(cpath, key)
+        if header is not None:
+            # Loop over records ...
+            for name, i, spans in header["records"]:
+                # Skip this record if it is not for a country in the list ...
+                if name not in countries:
+                    continue
+
+                # Decode the Polygons of this record (if needed) ...
+                if (sfile, i, onlyValid, repair) not in _polys:
+                    _polys[(sfile, i, onlyValid, repair)] = [
+                        shapely.from_wkb(buf[header["base"] + offset:header["base"] + offset + size])
+                        for offset, size in spans
+                    ]
+                inds.append(i)
+
+            # Note which countries were found ...
+            found.update(set(header["names"]) & set(countries))
+
+    # Check if any countries were not found ...
+    if not found.issuperset(countries):
+        # Check if the shapefile needs indexing ...
+        if sfile not in _records:
+            # Create list of (name, geometry) tuples ...
+            _records[sfile] = []
+
+            # Loop over records ...
+            for record in cartopy.io.shapereader.Reader(sfile).records():
+                # Add record to list ...
+                _records[sfile].append(
+                    (
+                        pyguymer3.geo.getRecordAttribute(record, "NAME"),
+                        record.geometry,
+                    )
+                )
+            record_count("shapefileRecords", len(_records[sfile]))
+
+        # Loop over records ...
+        newInds = []
+        for i, (neName, geometry) in enumerate(_records[sfile]):
+            # Skip this record if it is not for a country in the list or if it
+            # has already been found ...
+            if neName not in countries or neName in found:
+                continue
+
+            # Extract the Polygons of this record (if needed) ...
+            if (sfile, i, onlyValid, repair) not in _polys:
+                _polys[(sfile, i, onlyValid, repair)] = pyguymer3.geo.extract_polys(
+                    geometry,
+                    onlyValid = onlyValid,
+                       repair = repair,
+                )
+                record_count("polygonsExtracted", len(_polys[(sfile, i, onlyValid, repair)]))
+            newInds.append(i)
+
+        # Check if there is a persistent geometry cache ...
+        if cacheDir is not None:
+            # Create list of the records in the cache ...
+            records = []
+            if header is not None:
+                for name, i, spans in header["records"]:
+                    records.append((name, i, [buf[header["base"] + offset:header["base"] + offset + size] for offset, size in spans]))
+            for i in newInds:
+                records.append((_records[sfile][i][0], i, [shapely.to_wkb(poly) for poly in _polys[(sfile, i, onlyValid, repair)]]))
+
+            # Save the geometry cache ...
+            save_geometry_cache(
+                cpath,
+                key,
+                list(found | set(countries)) + ([] if header is None else header["names"]),
+                records,
+            )
+
+        # Note which records were found ...
+        inds += newInds
+
+    # Close the geometry cache ...
+    if cacheDir is not None and buf is not None:
+        buf.close()
+
+    # Create empty list ...
+    polys = []
+
+    # Loop over records ...
+    for i in sorted(inds):
+        # Add Polygons to list ...
+        polys += _polys[(sfile, i, onlyValid, repair)]
+
+    # Return answer ...
+    return polys
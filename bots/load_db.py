@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def load_db(
+    dbpath,
+    /,
+):
+    """Load the database of points
+
+    This function loads the database of points, automatically detecting whether
+    it is a JSON file or a compact binary file (see :func:`save_db`).
+
+    Parameters
+    ----------
+    dbpath : str
+        the path to the database
+
+    Returns
+    -------
+    territories : dict
+        the database
+
+    Notes
+    -----
+    If the database is a binary file then the "coords" and "extremalCoords" of
+    each territory are read-only (N, 2) views of a single memory-mapped float64
+    array, which can be handed straight to :func:`calc_sun_numpy`, and so are
+    the "elevations" and "extremalElevations" (if any) as (N,) views.
+    """
+
+    # Import standard modules ...
+    import json
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Read the magic string ...
+    with open(dbpath, mode = "rb") as fObj:
+        magic = fObj.read(8)
+
+        # Check if the database is JSON ...
+        if magic != b"BOTSDB01":
+            fObj.seek(0)
+            return json.loads(fObj.read().decode("utf-8"))
+
+        # Parse the header ...
+        size = int.from_bytes(fObj.read(8), byteorder = "little")
+        header = json.loads(fObj.read(size).decode("utf-8"))
+
+    # Create dictionary of the keys which are saved in the buffer, along with
+    # the number of columns of each one ...
+    nCols = {
+                    "coords" : 2,
+                "elevations" : 1,
+            "extremalCoords" : 2,
+        "extremalElevations" : 1,
+    }
+
+    # Find the offset of the buffer ...
+    base = 16 + size + (-size % 8)                                              # [B]
+
+    # Memory-map the buffer ...
+    # NOTE: "numpy.memmap()" refuses to map zero bytes.
+    nItems = max(
+        [0] + [
+            value[0] + nCols[key] * value[1]
+            for info in header.values()
+            for key, value in info.items()
+            if key in nCols
+        ]
+    )                                                                           # [#]
+    if nItems > 0:
+        buf = numpy.memmap(dbpath, dtype = "<f8", mode = "r", offset = base, shape = (nItems,))
+    else:
+        buf = numpy.zeros(0, dtype = "<f8")
+
+    # Replace the (offset, number of rows) of each array with a view ...
+    for info in header.values():
+        for key, nCol in nCols.items():
+            if key not in info:
+                continue
+            offset, nRows = info[key]
+            info[key] = buf[offset:offset + nCol * nRows]
+            if nCol > 1:
+                info[key] = info[key].reshape(nRows, nCol)
+
+    # Return answer ...
+    return header
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def load_dem(
+    fpath,
+    /,
+    *,
+    cacheDir = None,
+):
+    """Load a Digital Elevation Model
+
+    This function loads a Digital Elevation Model (DEM) on a regular longitude
+    and latitude grid from either a GeoTIFF (if the path ends with ".tif" or
+    ".tiff") or an ESRI ASCII grid (otherwise). The grid is converted to a
+    float32 NumPy array once and saved in a persistent DEM cache, so that later
+    runs only have to memory-map it.
+
+    Parameters
+    ----------
+    fpath : str
+        the path to the DEM
+    cacheDir : str, optional
+        the directory to keep a persistent DEM cache in (if None then the DEM
+        is converted in memory every time)
+
+    Returns
+    -------
+    dem : dict
+        the elevations ("elev", an (ny, nx) array in metres, with NaN where
+        there is no data), the longitude and latitude of the centre of the
+        first cell ("lon0" and "lat0", in degrees) and the spacing of the cells
+        ("dlon" and "dlat", in degrees, where "dlat" is negative if the first
+        row is the northernmost)
+
+    Notes
+    -----
+    GeoTIFFs are read with Pillow, so they must have a single band and be in
+    geographic coordinates, with their georeferencing given by the
+    "ModelPixelScale" and "ModelTiepoint" tags (and their missing value, if
+    any, by the "GDAL_NODATA" tag).
+
+    The DEM cache is keyed by the path, the size and the modification time of
+    the DEM.
+    """
+
+    # Import standard modules ...
+    import hashlib
+    import json
+    import os
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Find the paths to the cache (if there is one) and check if it exists ...
+    stat = os.stat(fpath)
+    if cacheDir is not None:
+        key = f"{os.path.abspath(fpath)}:{stat.st_size:d}:{stat.st_mtime_ns:d}"
+        sha = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        cpath = f"{cacheDir}/dem-cache/{sha}.npy"
+        jpath = f"{cacheDir}/dem-cache/{sha}.json"
+        if os.path.exists(cpath) and os.path.exists(jpath):
+            with open(jpath, mode = "rt", encoding = "utf-8") as fObj:
+                dem = json.load(fObj)
+            dem["elev"] = numpy.load(cpath, mmap_mode = "r")                    # [m]
+            return dem
+
+    # Check what sort of DEM it is ...
+    if fpath.lower().endswith((".tif", ".tiff")):
+        # Import special modules ...
+        try:
+            import PIL
+            import PIL.Image
+        except:
+            raise Exception("\"PIL\" is not installed; run \"pip install --user Pillow\"") from None
+
+        # Load the GeoTIFF and its georeferencing ...
+        with PIL.Image.open(fpath) as im:
+            elev = numpy.asarray(im, dtype = numpy.float32)                     # [m]
+            scale = im.tag_v2.get(33550)
+            tiepoint = im.tag_v2.get(33922)
+            nodata = im.tag_v2.get(42113)
+        if scale is None or tiepoint is None:
+            raise Exception(f"\"{fpath}\" is not georeferenced") from None
+
+        # Find the centre of the first cell ...
+        # NOTE: The tiepoint is the corner of the cell which it refers to.
+        dlon = float(scale[0])                                                  # [°]
+        dlat = -float(scale[1])                                                 # [°]
+        lon0 = float(tiepoint[3]) + dlon * (0.5 - float(tiepoint[0]))           # [°]
+        lat0 = float(tiepoint[4]) + dlat * (0.5 - float(tiepoint[1]))           # [°]
+        if nodata is not None:
+            nodata = float(str(nodata).strip("\x00 "))                          # [m]
+    else:
+        # Load the header of the ESRI ASCII grid ...
+        header = {}
+        with open(fpath, mode = "rt", encoding = "utf-8") as fObj:
+            for line in fObj:
+                parts = line.split()
+                if len(parts) != 2 or not parts[0][0].isalpha():
+                    break
+                header[parts[0].lower()] = float(parts[1])
+        nx = int(header["ncols"])                                               # [#]
+        ny = int(header["nrows"])                                               # [#]
+
+        # Load the ESRI ASCII grid ...
+        elev = numpy.loadtxt(
+            fpath,
+               dtype = numpy.float32,
+            skiprows = len(header),
+        ).reshape(ny, nx)                                                       # [m]
+
+        # Find the centre of the first cell ...
+        # NOTE: The first row is the northernmost.
+        dlon = header["cellsize"]                                               # [°]
+        dlat = -header["cellsize"]                                              # [°]
+        if "xllcenter" in header:
+            lon0 = header["xllcenter"]                                          # [°]
+        else:
+            lon0 = header["xllcorner"] + 0.5 * dlon                             # [°]
+        if "yllcenter" in header:
+            lat0 = header["yllcenter"] - dlat * (ny - 1)                        # [°]
+        else:
+            lat0 = header["yllcorner"] - dlat * (ny - 0.5)                      # [°]
+        nodata = header.get("nodata_value")                                     # [m]
+
+    # Replace the missing values with NaN ...
+    elev = numpy.array(elev, dtype = numpy.float32)                             # [m]
+    if nodata is not None:
+        elev[elev == numpy.float32(nodata)] = numpy.nan                         # [m]
+
+    # Create dictionary ...
+    dem = {
+        "lon0" : lon0,
+        "lat0" : lat0,
+        "dlon" : dlon,
+        "dlat" : dlat,
+    }
+
+    # Save the cache (if there is one) ...
+    if cacheDir is not None:
+        if not os.path.exists(os.path.dirname(cpath)):
+            os.makedirs(os.path.dirname(cpath))
+        tpath = f"{cpath}.{os.getpid():d}.tmp"
+        with open(tpath, mode = "wb") as fObj:
+            numpy.save(fObj, elev)
+        os.replace(tpath, cpath)
+        tpath = f"{jpath}.{os.getpid():d}.tmp"
+        with open(tpath, mode = "wt", encoding = "utf-8") as fObj:
+            json.dump(dem, fObj, indent = 4, sort_keys = True)
+        os.replace(tpath, jpath)
+
+    # Return answer ...
+    dem["elev"] = elev                                                          # [m]
+    return dem
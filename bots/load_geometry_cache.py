@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def load_geometry_cache(
+    cpath,
+    key,
+    /,
+):
+    """Load a geometry cache
+
+    This function memory-maps a geometry cache (see
+    :func:`save_geometry_cache`) and checks that it was made from the same
+    shapefile with the same settings.
+
+    Parameters
+    ----------
+    cpath : str
+        the path to the geometry cache
+    key : dict
+        the description of the shapefile and the settings
+
+    Returns
+    -------
+    header : dict
+        the header of the geometry cache, with the offset of the first WKB
+        added as "base" (or None if the cache does not exist or is stale)
+    buf : mmap.mmap
+        the memory-mapped geometry cache, which the caller must close (or None
+        if the cache does not exist or is stale)
+    """
+
+    # Import standard modules ...
+    import json
+    import mmap
+    import os
+
+    # Check that the cache exists ...
+    if not os.path.exists(cpath):
+        return None, None
+
+    # Memory-map the cache ...
+    with open(cpath, mode = "rb") as fObj:
+        if os.fstat(fObj.fileno()).st_size < 8:
+            return None, None
+        buf = mmap.mmap(fObj.fileno(), 0, access = mmap.ACCESS_READ)
+
+    # Parse the header ...
+    try:
+        size = int.from_bytes(buf[:8], byteorder = "little")
+        header = json.loads(buf[8:8 + size].decode("utf-8"))
+    except:
+        buf.close()
+        return None, None
+
+    # Check that the cache is for this shapefile and these settings ...
+    if header.get("key") != key:
+        buf.close()
+        return None, None
+
+    # Add the offset of the first WKB to the header ...
+    header["base"] = 8 + size                                                   # [B]
+
+    # Return answers ...
+    return header, buf
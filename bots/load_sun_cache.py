@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def load_sun_cache(
+    cpath,
+    t0s,
+    /,
+    *,
+    nVals = 4,
+):
+    """Load some days from a sunrise/sunset cache
+
+    This function looks up the earliest and latest sunrises and sunsets of some
+    days in a sunrise/sunset cache (see :func:`save_sun_cache`).
+
+    Parameters
+    ----------
+    cpath : str
+        the path to the sunrise/sunset cache
+    t0s : numpy.ndarray
+        the start of each day (in seconds since the POSIX epoch)
+    nVals : int, optional
+        the number of values of each day (four for each horizon)
+
+    Returns
+    -------
+    hits : numpy.ndarray
+        whether each day is in the cache
+    vals : numpy.ndarray
+        the earliest sunrise, the latest sunrise, the earliest sunset and the
+        latest sunset of each day, as an (N, nVals) array (in seconds since the
+        POSIX epoch, or zero if the day is not in the cache)
+
+    Notes
+    -----
+    A cache hit updates the modification time of the cache, which is what
+    :func:`save_sun_cache` evicts the least recently used caches by.
+    """
+
+    # Import standard modules ...
+    import os
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Create empty arrays ...
+    hits = numpy.zeros(t0s.size, dtype = bool)
+    vals = numpy.zeros((t0s.size, nVals), dtype = numpy.int64)                  # [s]
+
+    # Check that the cache exists ...
+    if not os.path.exists(cpath):
+        return hits, vals
+
+    # Load the cache ...
+    try:
+        arr = numpy.load(cpath, mmap_mode = "r")
+    except:
+        return hits, vals
+    if arr.ndim != 2 or arr.shape[1] != nVals + 1:
+        return hits, vals
+
+    # Find the days which are in the cache ...
+    # NOTE: The cache is sorted by the start of the day.
+    inds = numpy.clip(numpy.searchsorted(arr[:, 0], t0s), 0, max(0, arr.shape[0] - 1))
+    if arr.shape[0] > 0:
+        hits = arr[inds, 0] == t0s
+        vals[hits, :] = arr[inds[hits], 1:]                                     # [s]
+
+    # Mark the cache as recently used ...
+    if hits.any():
+        os.utime(cpath)
+
+    # Return answers ...
+    return hits, vals
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def load_territory_coords(
+    territory,
+    /,
+    *,
+     cacheDir = None,
+    onlyValid = False,
+       repair = False,
+):
+    """Load the coordinates of a territory
+
+    This function loads the coordinates of the exterior rings of the Polygons
+    of all of the countries in a territory, followed by the locations in the
+    territory, as a single contiguous array.
+
+    Parameters
+    ----------
+    territory : dict
+        the database entry (or definition) for the territory
+    cacheDir : str, optional
+        the directory to keep a persistent geometry cache in (see
+        :func:`load_country_polys`)
+    onlyValid : bool, optional
+        only return valid Polygons (checks for validity can take a while, if
+        being called often)
+    repair : bool, optional
+        attempt to repair invalid Polygons
+
+    Returns
+    -------
+    coords : numpy.ndarray
+        the (longitude, latitude) coordinates (in degrees) as a (N, 2) array
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import sub-functions ...
+    from .load_country_polys import load_country_polys
+
+    # Create empty list ...
+    parts = []
+
+    # Check if countries are defined ...
+    if "countries" in territory:
+        # Loop over Polygons ...
+        for poly in load_country_polys(
+            territory["countries"],
+             cacheDir = cacheDir,
+            onlyValid = onlyValid,
+               repair = repair,
+        ):
+            # Convert the CoordinateSequence of the exterior LinearRing to a
+            # NumPy array and add it to the list ...
+            parts.append(numpy.array(poly.exterior.coords, dtype = numpy.float64).reshape(-1, 2))  # [°]
+
+    # Check if locations are defined ...
+    if "locations" in territory:
+        # Convert the locations to a NumPy array and add it to the list ...
+        parts.append(numpy.array(territory["locations"], dtype = numpy.float64).reshape(-1, 2))    # [°]
+
+    # Check that there are some parts ...
+    if len(parts) == 0:
+        return numpy.empty((0, 2), dtype = numpy.float64)
+
+    # Return answer ...
+    return numpy.concatenate(parts)
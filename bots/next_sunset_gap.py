@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def next_sunset_gap(
+    index,
+    /,
+    *,
+    after = None,
+):
+    """Find the next gap when the Sun has set on the BOT
+
+    This function uses an index (see :func:`build_sun_index`) to find the next
+    gap when none of the territories are sunlit, with one binary search.
+
+    Parameters
+    ----------
+    index : dict
+        the index
+    after : float, optional
+        the time to search from (in seconds since the POSIX epoch, the default
+        is the start of the survey)
+
+    Returns
+    -------
+    gap : tuple of floats
+        the (start, end) of the gap (in seconds since the POSIX epoch), or None
+        if there are no more gaps in the survey
+
+    Notes
+    -----
+    If the time to search from is within a gap then the returned gap starts at
+    the time to search from.
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Check input ...
+    if after is None:
+        after = index["tStart"]                                                 # [s]
+
+    # Find the first gap which ends after the time ...
+    i = numpy.searchsorted(index["BOT"]["gapEnds"], after, side = "right")
+    if i >= index["BOT"]["gapEnds"].size:
+        return None
+
+    # Return answer ...
+    return max(after, index["BOT"]["gapStarts"][i].item()), index["BOT"]["gapEnds"][i].item()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def optimise_png(
+    fpath,
+    /,
+    *,
+     cacheDir = None,
+    cacheSize = 67108864,
+        debug = __debug__,
+      timeout = 60.0,
+):
+    """Optimise a PNG
+
+    This function optimises a PNG in place, unless the same rendering has been
+    optimised before, in which case the previously optimised PNG is copied
+    into place instead.
+
+    Parameters
+    ----------
+    fpath : str
+        the path to the PNG
+    cacheDir : str, optional
+        the directory to keep the optimised PNGs in (if None then every PNG is
+        optimised)
+    cacheSize : int, optional
+        the maximum total size of the optimised PNGs in the cache (in bytes),
+        the PNG which has just been optimised is never evicted
+    debug : bool, optional
+        print debug messages
+    timeout : float, optional
+        the timeout for any requests/subprocess calls
+
+    Returns
+    -------
+    stats : dict
+        the size of the PNG before ("before", in bytes) and after ("after", in
+        bytes) it was optimised and whether the optimised PNG came from the
+        cache ("cached")
+
+    Notes
+    -----
+    The optimised PNGs are kept in "optimised-pngs" in the cache directory and
+    are named after the SHA-256 hash of the PNG as it was rendered, so a PNG
+    which is re-rendered without any changes is not optimised again. An
+    optimised PNG is touched each time that it is used, so the least recently
+    used ones are evicted first when the cache is too big (as in
+    :func:`save_sun_cache`).
+    """
+
+    # Import standard modules ...
+    import glob
+    import hashlib
+    import os
+    import shutil
+    import threading
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+        import pyguymer3.image
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # Find the size and the hash of the PNG as it was rendered ...
+    with open(fpath, mode = "rb") as fObj:
+        src = fObj.read()
+    before = len(src)                                                           # [B]
+
+    # Check if there is a cache ...
+    if cacheDir is not None:
+        # Create short-hand ...
+        cpath = f"{cacheDir}/optimised-pngs/{hashlib.sha256(src).hexdigest()}.png"
+
+        # Check if this rendering has been optimised before ...
+        # NOTE: The optimised PNG may be evicted by another thread (or
+        #       process) at any time, in which case it is optimised again.
+        if os.path.exists(cpath):
+            try:
+                # Mark the optimised PNG as used and copy it into place ...
+                tpath = f"{fpath}.{os.getpid():d}.tmp"
+                os.utime(cpath)
+                shutil.copyfile(cpath, tpath)
+                os.replace(tpath, fpath)
+            except FileNotFoundError:
+                pass
+            else:
+                # Return answer ...
+                return {
+                     "after" : os.path.getsize(fpath),                          # [B]
+                    "before" : before,                                          # [B]
+                    "cached" : True,
+                }
+
+    # Optimize PNG ...
+    pyguymer3.image.optimise_image(
+        fpath,
+          debug = debug,
+          strip = True,
+        timeout = timeout,
+    )
+
+    # Check if there is a cache ...
+    if cacheDir is not None:
+        # Save the optimised PNG in the cache ...
+        # NOTE: The PNGs may be optimised by a pool of threads, so the
+        #       temporary path is unique to this thread too.
+        os.makedirs(os.path.dirname(cpath), exist_ok = True)
+        tpath = f"{cpath}.{os.getpid():d}.{threading.get_native_id():d}.tmp"
+        shutil.copyfile(fpath, tpath)
+        os.replace(tpath, cpath)
+
+        # Find the sizes and the modification times of all of the optimised
+        # PNGs in the cache, the one which has just been saved first and then
+        # the most recently used ...
+        pngs = []
+        for gpath in glob.glob(f"{os.path.dirname(cpath)}/*.png"):
+            try:
+                stat = os.stat(gpath)
+            except FileNotFoundError:
+                continue
+            pngs.append((gpath == cpath, stat.st_mtime_ns, stat.st_size, gpath))
+        pngs.sort(reverse = True)
+
+        # Evict the least recently used optimised PNGs which do not fit ...
+        total = 0                                                               # [B]
+        for isNew, _, size, gpath in pngs:
+            if not isNew and total + size > cacheSize:
+                try:
+                    os.remove(gpath)
+                except FileNotFoundError:
+                    pass
+                continue
+            total += size                                                       # [B]
+
+    # Return answer ...
+    return {
+         "after" : os.path.getsize(fpath),                                      # [B]
+        "before" : before,                                                      # [B]
+        "cached" : False,
+    }
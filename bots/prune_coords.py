@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def prune_coords(
+    coords,
+    /,
+    *,
+        dLat = 0.5,
+        dips = None,
+      dipTol = 0.1,
+    polarLat = 65.0,
+):
+    """Prune some coordinates down to the ones which can set the extreme
+    sunrises and sunsets
+
+    This function finds the subset of a set of coordinates which can be either
+    the earliest or the latest sunrise or sunset on any day.
+
+    Parameters
+    ----------
+    coords : list of tuples of floats
+        the (longitude, latitude) coordinates (in degrees)
+    dLat : float, optional
+        the height of the latitude bands (in degrees)
+    dips : list of floats, optional
+        the dip of the horizon of each coordinate (in degrees, see
+        :func:`calc_horizon_dip`)
+    dipTol : float, optional
+        the dip of the horizon beyond which a coordinate is always kept (in
+        degrees)
+    polarLat : float, optional
+        the absolute latitude beyond which the Sun may not rise or set on some
+        days (in degrees)
+
+    Returns
+    -------
+    extremalCoords : list of tuples of floats
+        the (longitude, latitude) coordinates (in degrees), in the same order as
+        they were in the original list
+
+    Notes
+    -----
+    Away from the poles the sunrise of a coordinate is the sunrise at the
+    Prime Meridian, less the longitude, less the hour angle, which only depends
+    on the latitude. On any given day the hour angle either increases or
+    decreases with latitude, hence the earliest sunrise is at a coordinate which
+    no other coordinate is both east of and north (or south) of. The same
+    argument holds for the latest sunrise and for the sunsets. Therefore, the
+    subset contains:
+
+    * the coordinates on the four "staircases" (Pareto fronts) formed by the
+      easternmost (or westernmost) and northernmost (or southernmost)
+      coordinates;
+    * the westernmost and the easternmost coordinates in each latitude band
+      (which covers the days around the equinoxes when the hour angle is not
+      monotonic in latitude);
+    * the northernmost and the southernmost coordinates;
+    * every polar coordinate; and
+    * every coordinate whose horizon dips by more than "dipTol".
+
+    The argument does not hold for polar coordinates because whether the Sun
+    rises or sets at all on a given day depends on the latitude: a coordinate
+    can only be dominated by one at exactly the same latitude. A coordinate
+    which is no further from the equator does see the Sun rise and set
+    whenever a polar coordinate does, but on the days around the end of polar
+    day (or polar night) the first sunrise after the start of the day at a
+    polar coordinate can be a whole day later than at such a coordinate (see
+    :func:`calc_sun_times`), which then sets the latest sunrise and sunset of
+    the day. The latitude where this happens sweeps across every polar
+    coordinate each year, hence they are all kept. Pruning them numerically (by
+    keeping the ones which are close to the extremes on every day of a
+    reference year) is not exact either, as the coordinates which graze the
+    horizon shift from year to year. For example, the 9,461 coordinates of the
+    British Antarctic Territory are pruned down to 7,186, of which 7,042 are
+    polar; keeping only the polar coordinates which are not dominated, allowing
+    for the hour angle, prunes it down to 5,595 but misses the latest sunrise
+    and sunset by up to 3 hours on a few days each year.
+
+    The argument assumes that every coordinate has the same horizon, so the
+    coordinates whose horizon dips by no more than "dipTol" are pruned as
+    though they were at sea level, which can move their sunrises and sunsets by
+    up to about "dipTol / 15" hours (divided by the cosine of the latitude).
+
+    Similarly, below a twilight horizon the Sun may not rise or set on some
+    days well away from "polarLat", where the subset is not exact (see
+    :func:`calc_sun_territories`).
+
+    Longitudes are not unwrapped, so a territory which straddles the
+    anti-meridian is pruned less aggressively but still correctly.
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Convert list of coordinates to array ...
+    arr = numpy.array(coords, dtype = numpy.float64).reshape(-1, 2)            # [°]
+
+    # Check that there are enough coordinates to prune ...
+    if arr.shape[0] <= 2:
+        return [(coord[0], coord[1]) for coord in coords]
+
+    # Create short-hands ...
+    lons = arr[:, 0]                                                            # [°]
+    lats = arr[:, 1]                                                            # [°]
+
+    # Create mask ...
+    keep = numpy.zeros(arr.shape[0], dtype = bool)
+
+    # Keep the coordinates on the four staircases ...
+    for xSign in [-1.0, 1.0]:
+        for ySign in [-1.0, 1.0]:
+            x = xSign * lons                                                    # [°]
+            y = ySign * lats                                                    # [°]
+            order = numpy.lexsort((-y, -x))
+            yOrdered = y[order]                                                 # [°]
+            yPrev = numpy.concatenate(([-numpy.inf], numpy.maximum.accumulate(yOrdered)[:-1]))  # [°]
+            keep[order[yOrdered > yPrev]] = True
+
+    # Keep the westernmost and the easternmost coordinates in each latitude
+    # band ...
+    bands = numpy.floor(lats / dLat).astype(numpy.int64)
+    order = numpy.lexsort((lons, bands))
+    edges = numpy.flatnonzero(numpy.diff(bands[order])) + 1
+    keep[order[numpy.concatenate(([0], edges))]] = True
+    keep[order[numpy.concatenate((edges - 1, [order.size - 1]))]] = True
+
+    # Keep all of the polar coordinates ...
+    keep[numpy.abs(lats) >= polarLat] = True
+
+    # Keep the polar-most coordinates ...
+    keep[numpy.argmin(lats)] = True
+    keep[numpy.argmax(lats)] = True
+
+    # Keep all of the coordinates whose horizon dips significantly ...
+    if dips is not None:
+        keep[numpy.asarray(dips, dtype = numpy.float64) > dipTol] = True
+
+    # Return answer ...
+    return [(coord[0], coord[1]) for coord, k in zip(coords, keep, strict = True) if k]
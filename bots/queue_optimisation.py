@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def queue_optimisation(
+    fpath,
+    /,
+    *,
+      debug = __debug__,
+    timeout = 60.0,
+):
+    """Queue a PNG to be optimised
+
+    This function queues a PNG to be optimised in the background, if the queue
+    of this process has been started (see :func:`start_optimisations`), or
+    optimises it straight away if it has not.
+
+    Parameters
+    ----------
+    fpath : str
+        the path to the PNG
+    debug : bool, optional
+        print debug messages
+    timeout : float, optional
+        the timeout for any requests/subprocess calls
+
+    Returns
+    -------
+    stats : dict
+        the size of the PNG before and after it was optimised (see
+        :func:`optimise_png`), or None if it was queued
+
+    Notes
+    -----
+    The PNG must not be saved again until the queue has been stopped (see
+    :func:`stop_optimisations`).
+    """
+
+    # Import standard modules ...
+    import os
+
+    # Import sub-functions ...
+    from .optimise_png import optimise_png
+    from .record_count import record_count
+    from .start_optimisations import _queue
+
+    # Check if the queue of this process has been started ...
+    if len(_queue) > 0 and _queue["pid"] == os.getpid():
+        # Queue the PNG ...
+        _queue["futures"][fpath] = _queue["pool"].submit(
+            optimise_png,
+            fpath,
+             cacheDir = _queue["cacheDir"],
+            cacheSize = _queue["cacheSize"],
+                debug = debug,
+              timeout = timeout,
+        )
+
+        # Return answer ...
+        return None
+
+    # Optimize PNG ...
+    stats = optimise_png(
+        fpath,
+          debug = debug,
+        timeout = timeout,
+    )
+    record_count("pngBytesBeforeOptimisation", stats["before"])
+    record_count("pngBytesAfterOptimisation", stats["after"])
+
+    # Return answer ...
+    return stats
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def record_count(
+    key,
+    value = 1,
+    /,
+):
+    """Add to a counter of BOTS
+
+    This function adds to a counter in the report, if a report has been
+    started (see :func:`start_report`).
+
+    Parameters
+    ----------
+    key : str
+        the name of the counter
+    value : int, optional
+        the amount to add to the counter
+    """
+
+    # Import sub-functions ...
+    from .start_report import _report
+
+    # Check that a report has been started ...
+    if len(_report) == 0:
+        return
+
+    # Add to the counter ...
+    _report["counters"][key] = _report["counters"].get(key, 0) + value
@@ -5,24 +5,74 @@ def run(
     dirOut,
     /,
     *,
-        debug = __debug__,
-            n = 10,
-        nIter = 100,
-    onlyValid = False,
-       repair = False,
-      timeout = 60.0,
+        binary = False,
+         debug = __debug__,
+           dem = None,
+        engine = "ephem",
+      horizons = None,
+    includeBAT = True,
+    instrument = False,
+             n = 10,
+         nIter = 100,
+     onlyValid = False,
+       profile = False,
+         prune = True,
+        repair = False,
+         start = None,
+       targets = None,
+       timeout = 60.0,
+       workers = 1,
 ):
     """Run BOTS
 
     This is a wrapper function to call all of the functions in BOTS to create
-    the JSON database, the PNG maps and the PNG timeline.
+    the JSON database, the PNG maps and the PNG timeline, and then to report
+    the gaps when the Sun has set on the BOT (with and without the BAT) in a
+    JSON file.
+
+    The outputs are made by a small scheduler (see :func:`run_stages`): the
+    PNG maps are made at the same time as the PNG timeline and the gaps (which
+    are made in another process), and the PNG timeline and the gaps are only
+    re-made if the database or the settings that they depend on have changed.
+    If the database exists then it is only updated if it is explicitly one of
+    the targets, so that re-making the timeline or the gaps does not need
+    cartopy (or the Natural Earth shapefiles). BOTS can also be run from the
+    command line, with the outputs to make given by "--only" (see
+    "python -m bots --help").
+
+    The PNGs are optimised in the background while the rest of BOTS carries
+    on (see :func:`start_optimisations`) and this function only returns once
+    they have all been optimised. The bytes saved for each PNG are reported in
+    "optimisations.json".
 
     Parameters
     ----------
     dirOut : str
         the path to save the database and PNGs in
+    binary : bool, optional
+        create the database as a compact binary file ("db.bin") rather than as
+        a JSON file ("db.json"), if neither exists already
     debug : bool, optional
         print debug messages
+    dem : str, optional
+        the path to a Digital Elevation Model, to survey the elevation of each
+        point (and the peaks which can see past the coastline) so that the dip
+        of the horizon is allowed for (see :func:`create_db`)
+    engine : str, optional
+        the engine used to calculate the sunrises and sunsets (either "ephem",
+        "numpy" or "terminator", see :func:`calc_sun_territories`)
+    horizons : list of floats, optional
+        the altitudes of the centre of the Sun at sunrise and sunset (in
+        degrees) to draw in the PNG timeline, where None means the default
+        horizon (see :func:`create_timeline`) (the gaps are always reported for
+        the default horizon)
+    includeBAT : bool, optional
+        include the BAT in the PNG timeline (the gaps are always reported both
+        with and without it)
+    instrument : bool, optional
+        record the wall time and the CPU time of each stage (and of each
+        territory within each stage) and the counters (see
+        :func:`start_report`), and save them in "report.json"
     n : int, optional
         the number of days to survey
     nIter : int, optional
@@ -30,54 +80,256 @@ def run(
     onlyValid : bool, optional
         only return valid Polygons (checks for validity can take a while, if
         being called often)
+    profile : bool, optional
+        profile each stage with cProfile and save the profiles in "profiles"
+        (this implies "instrument")
+    prune : bool, optional
+        only survey the points which can set the extreme sunrises and sunsets
     repair : bool, optional
         attempt to repair invalid Polygons
+    start : datetime.datetime, optional
+        the start of the survey (see :func:`create_timeline`)
+    targets : list of str, optional
+        the outputs to make (if they are out of date), out of: "db" (the
+        database); "maps" (all of the PNG maps), or "maps/" followed by the
+        name of a territory (just that PNG map); "timeline" (the PNG timeline);
+        and "gaps" (the JSON of the gaps) (if None then all of them are made,
+        except that the database is only made if it does not exist)
     timeout : float, optional
         the timeout for any requests/subprocess calls
+    workers : int, optional
+        the number of processes to use to create the PNG maps and to find the
+        sunrises and sunsets (and the number of PNGs to optimise at the same
+        time)
+
+    Returns
+    -------
+    report : dict
+        the report (see :func:`stop_report`), if "instrument" or "profile"
+        are True
     """
 
     # Import standard modules ...
-    import json
+    import concurrent.futures
+    import hashlib
     import os
 
     # Import sub-functions ...
     from .create_db import create_db
     from .create_maps import create_maps
     from .create_timeline import create_timeline
+    from .find_start_date import find_start_date
+    from .load_db import load_db
+    from .queue_optimisation import queue_optimisation
+    from .run_stages import run_stages
+    from .save_sunless_gaps import save_sunless_gaps
+    from .start_optimisations import start_optimisations
+    from .start_report import start_report
+    from .start_stage import start_stage
+    from .stop_optimisations import stop_optimisations
+    from .stop_report import stop_report
+    from .stop_stage import stop_stage
+
+    # Create start date ...
+    d0 = find_start_date(start)
+
+    # Check the targets ...
+    if targets is None:
+        targets = ["maps", "timeline", "gaps"]
+    for target in targets:
+        if target not in ["db", "maps", "timeline", "gaps"] and not target.startswith("maps/"):
+            raise Exception(f"\"{target}\" is not a target") from None
 
     # Make output directory ...
     if not os.path.exists(dirOut):
         os.makedirs(dirOut)
 
-    # Make database path and create database (if needed) ...
-    dbpath = f"{dirOut}/db.json"
-    if not os.path.exists(dbpath):
-        create_db(
-            dbpath,
-            onlyValid = onlyValid,
-               repair = repair,
-        )
+    # Start the report (if needed) ...
+    if instrument or profile:
+        start_report(profileDir = f"{dirOut}/profiles" if profile else None)
 
-    # Load database ...
-    with open(dbpath, mode = "rt", encoding = "utf-8") as fObj:
-        territories = json.load(fObj)
+    # Find the database (in either format) ...
+    for dbname in ["db.bin", "db.json"]:
+        dbpath = f"{dirOut}/{dbname}"
+        if os.path.exists(dbpath):
+            break
+    else:
+        dbpath = f"{dirOut}/db.bin" if binary else f"{dirOut}/db.json"
 
-    # Create BOT maps ...
-    create_maps(
-        dirOut,
-        territories,
-            debug = debug,
-            nIter = nIter,
-        onlyValid = onlyValid,
-           repair = repair,
-          timeout = timeout,
-    )
+    # Create short-hand function to find the hash of the database ...
+    def hash_db():
+        with open(dbpath, mode = "rb") as fObj:
+            return hashlib.sha256(fObj.read()).hexdigest()
+
+    # Create short-hand function to find the territories to make maps of ...
+    def find_map_territories(results):
+        names = [target.removeprefix("maps/") for target in targets if target.startswith("maps/")]
+        for name in names:
+            if name not in results["load_db"]:
+                raise Exception(f"\"{name}\" is not a territory in the database") from None
+        if "maps" in targets:
+            return results["load_db"]
+        return {name : results["load_db"][name] for name in names}
+
+    # Create dictionary of stages ...
+    # NOTE: The database is only created (or updated) if it is explicitly a
+    #       target or if it does not exist, so that refreshing the timeline (or
+    #       the gaps) never needs cartopy (or the Natural Earth shapefiles).
+    stages = {}
+    if "db" in targets or not os.path.exists(dbpath):
+        stages["create_db"] = {
+               "deps" : [],
+               "func" : create_db,
+               "args" : (dbpath,),
+             "kwargs" : {
+                 "cacheDir" : dirOut,
+                      "dem" : dem,
+                    "nIter" : nIter,
+                "onlyValid" : onlyValid,
+                   "repair" : repair,
+                  "workers" : workers,
+            },
+            "process" : False,
+        }
+    if any(target != "db" for target in targets):
+        stages["load_db"] = {
+               "deps" : ["create_db"],
+               "func" : load_db,
+               "args" : (dbpath,),
+            "process" : False,
+        }
+    if "timeline" in targets:
+        stages["create_timeline"] = {
+               "deps" : ["load_db"],
+               "func" : create_timeline,
+               "args" : lambda results: (dirOut, results["load_db"]),
+             "kwargs" : {
+                  "cacheDir" : dirOut,
+                     "debug" : debug,
+                    "engine" : engine,
+                  "horizons" : horizons,
+                "includeBAT" : includeBAT,
+                         "n" : n,
+                  "optimise" : False,
+                     "prune" : prune,
+                     "start" : d0,
+                   "timeout" : timeout,
+                   "workers" : workers,
+            },
+            "process" : True,
+             "output" : f"{dirOut}/plot.png",
+               "desc" : lambda results: {
+                        "db" : hash_db(),
+                    "engine" : engine,
+                  "horizons" : None if horizons is None else list(horizons),
+                "includeBAT" : includeBAT,
+                         "n" : n,
+                     "prune" : prune,
+                     "start" : d0.isoformat(),
+            },
+        }
+    if "gaps" in targets:
+        # NOTE: The sunrises and sunsets are saved to the cache when the
+        #       timeline is created and, if there is only one worker, both
+        #       stages run in it, one after the other, so they are not
+        #       calculated again.
+        stages["calc_sunless_gaps"] = {
+               "deps" : ["load_db"],
+               "func" : save_sunless_gaps,
+               "args" : lambda results: (dirOut, results["load_db"], d0, n),
+             "kwargs" : {
+                "cacheDir" : dirOut,
+                  "engine" : engine,
+                   "prune" : prune,
+                 "workers" : workers,
+            },
+            "process" : True,
+             "output" : f"{dirOut}/gaps.json",
+               "desc" : lambda results: {
+                    "db" : hash_db(),
+                "engine" : engine,
+                     "n" : n,
+                 "prune" : prune,
+                 "start" : d0.isoformat(),
+            },
+        }
+    if "maps" in targets or any(target.startswith("maps/") for target in targets):
+        stages["create_maps"] = {
+               "deps" : ["load_db"],
+               "func" : create_maps,
+               "args" : lambda results: (dirOut, find_map_territories(results)),
+             "kwargs" : {
+                 "cacheDir" : dirOut,
+                    "debug" : debug,
+                    "nIter" : nIter,
+                "onlyValid" : onlyValid,
+                   "repair" : repair,
+                  "timeout" : timeout,
+                  "workers" : workers,
+            },
+            "process" : False,
+        }
 
-    # Create timeline ...
-    create_timeline(
-        dirOut,
-        territories,
-          debug = debug,
-              n = n,
-        timeout = timeout,
+    # Start the process pool (if needed) ...
+    # NOTE: A process pool forks all of its workers when the first task is
+    #       submitted to it (on Linux) and forking a process which has other
+    #       threads running can deadlock the workers, so the workers are
+    #       started (by giving them a trivial task) before the threads which
+    #       optimise the PNGs are. The same process pool is used for the
+    #       stages which run in another process and by the stages which run in
+    #       this process (for the framings of the maps and for the maps), so
+    #       that nothing is forked once any thread has started.
+    local = [name for name in ["create_db", "create_maps"] if name in stages and workers > 1]
+    pool = None
+    if any(stage["process"] for stage in stages.values()) or len(local) > 0:
+        pool = concurrent.futures.ProcessPoolExecutor(max_workers = workers)
+        pool.submit(os.getpid).result()
+    for name in local:
+        stages[name]["kwargs"]["pool"] = pool
+
+    # Start optimising the PNGs in the background ...
+    start_optimisations(
+        cacheDir = dirOut,
+         workers = workers,
     )
+
+    try:
+        # Run the stages ...
+        summary = run_stages(
+            stages,
+            mpath = f"{dirOut}/stages.json",
+             pool = pool,
+        )
+
+        # Queue the timeline to be optimised in the background (if it was
+        # made) ...
+        # NOTE: The timeline was made by the worker of "run_stages()", so it
+        #       was not queued by "create_timeline()".
+        if "create_timeline" in summary["made"]:
+            queue_optimisation(
+                f"{dirOut}/plot.png",
+                  debug = debug,
+                timeout = timeout,
+            )
+    finally:
+        # Wait for the PNGs to be optimised ...
+        stage = start_stage("optimise_pngs")
+        stop_optimisations(
+            debug = debug,
+            jpath = f"{dirOut}/optimisations.json",
+        )
+        stop_stage(stage)
+
+        # Stop the process pool (if there is one) ...
+        if pool is not None:
+            pool.shutdown(wait = True)
+
+    # Stop the report ...
+    report = stop_report(jpath = f"{dirOut}/report.json")
+
+    # Check that all of the stages worked ...
+    if len(summary["failed"]) > 0:
+        raise Exception(f"some stages failed ({summary['failed']})") from None
+
+    # Return the report (if there is one) ...
+    return report
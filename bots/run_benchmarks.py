@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def run_benchmarks(
+    dirOut,
+    /,
+    *,
+           debug = __debug__,
+           nDays = (10, 30, 100),
+           nIter = 100,
+         nPoints = (16, 64, 256),
+    nTerritories = (1, 4, 16),
+          repeat = 3,
+         timeout = 60.0,
+):
+    """Run the benchmarks
+
+    This function times the hot paths of BOTS against synthetic territories
+    (see :func:`create_synthetic_shapefile`), without any downloads, and saves
+    the times in "benchmarks.json" in the output directory so that they can be
+    compared across releases.
+
+    Parameters
+    ----------
+    dirOut : str
+        the path to save the synthetic shapefiles, the databases, the PNGs and
+        the JSON in
+    debug : bool, optional
+        print debug messages
+    nDays : tuple of ints, optional
+        the numbers of days to survey
+    nIter : int, optional
+        the maximum number of iterations (particularly the Vincenty formula)
+    nPoints : tuple of ints, optional
+        the numbers of points in the coastline of each territory
+    nTerritories : tuple of ints, optional
+        the numbers of territories
+    repeat : int, optional
+        the number of times to time each benchmark
+    timeout : float, optional
+        the timeout for any requests/subprocess calls
+
+    Returns
+    -------
+    report : dict
+        the times (in seconds) of each benchmark, along with the versions of
+        the modules which BOTS uses
+
+    Notes
+    -----
+    There are seven benchmarks, each of which is a list of measurements:
+
+    * "create_db" creates the database (see :func:`create_db`) for every
+      number of territories and every number of points, which includes
+      finding the framings of the maps;
+    * "calc_territory_framings" finds the framings of the maps of that
+      database from scratch (see :func:`calc_territory_framings`), so that
+      "create_db" can be compared with releases which did not store them;
+    * "find_middle_of_locs" finds the middle of the points of a territory, in
+      the same way as :func:`create_map`, for every number of points;
+    * "calc_sun_ephem" finds the sunrises and sunsets of the points of a
+      territory one point at a time, in the same way as
+      :func:`create_timeline`, for every number of points and every number of
+      days;
+    * "create_map" creates the PNG map of a territory of that database (see
+      :func:`create_map`), without optimising it, for every number of points;
+    * "create_timeline" creates the PNG timeline of that database (see
+      :func:`create_timeline`), without optimising it, for every number of
+      territories and every number of days (with the smallest number of
+      points); and
+    * "optimise_image" optimises that PNG.
+
+    Each measurement records the time of every repeat ("times") and the
+    fastest of them ("best"). The first repeat of "create_db" (and of
+    "create_map") includes parsing the shapefile whereas the later repeats use
+    the per-process caches of :func:`load_country_polys`. A benchmark which
+    fails records its error rather than its times. The report also has a note
+    about what each benchmark includes ("notes").
+    """
+
+    # Import standard modules ...
+    import datetime
+    import json
+    import os
+    import pathlib
+    import platform
+    import shutil
+    import time
+
+    # Import special modules ...
+    try:
+        import cartopy
+        cartopy.config.update(
+            {
+                "cache_dir" : pathlib.PosixPath("~/.local/share/cartopy").expanduser(),
+            }
+        )
+    except:
+        raise Exception("\"cartopy\" is not installed; run \"pip install --user Cartopy\"") from None
+    try:
+        import ephem
+    except:
+        raise Exception("\"ephem\" is not installed; run \"pip install --user ephem\"") from None
+    try:
+        import matplotlib
+    except:
+        raise Exception("\"matplotlib\" is not installed; run \"pip install --user matplotlib\"") from None
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+        import pyguymer3.geo
+        import pyguymer3.image
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # Import sub-functions ...
+    from .calc_sun_ephem import calc_sun_ephem
+    from .calc_territory_framings import calc_territory_framings
+    from .create_db import create_db
+    from .create_map import create_map
+    from .create_synthetic_shapefile import create_synthetic_shapefile
+    from .create_timeline import create_timeline
+    from .load_db import load_db
+    from .load_territory_coords import load_territory_coords
+
+    # Create short-hands ...
+    d0 = datetime.datetime(2016, 10, 14, tzinfo = datetime.UTC)
+    bdir = f"{dirOut}/benchmarks"
+
+    # Make output directory ...
+    if not os.path.exists(bdir):
+        os.makedirs(bdir)
+
+    # Create report ...
+    report = {
+                      "created" : datetime.datetime.now(tz = datetime.UTC).isoformat(),
+                        "notes" : {
+            "calc_territory_framings" : "finds the framings of the maps of the database made by \"create_db\" from scratch",
+                          "create_db" : "includes finding the framings of the maps (see \"calc_territory_framings\")",
+                    "create_timeline" : "includes finding the sunrises and sunsets (with the \"numpy\" engine and without a cache)",
+        },
+                     "platform" : platform.platform(),
+                       "python" : platform.python_version(),
+                     "versions" : {},
+                    "create_db" : [],
+      "calc_territory_framings" : [],
+          "find_middle_of_locs" : [],
+               "calc_sun_ephem" : [],
+                   "create_map" : [],
+              "create_timeline" : [],
+               "optimise_image" : [],
+    }
+    for module in [cartopy, ephem, matplotlib, numpy]:
+        report["versions"][module.__name__] = getattr(module, "__version__", None)
+
+    # Create short-hand function to time a benchmark ...
+    def time_it(key, params, func):
+        if debug:
+            print(f"Benchmarking \"{key}\" with {params} ...")
+        times = []                                                              # [s]
+        try:
+            for _ in range(repeat):
+                tic = time.perf_counter()                                       # [s]
+                func()
+                times.append(time.perf_counter() - tic)                         # [s]
+        except Exception as err:
+            report[key].append(params | {"error" : f"{type(err).__name__}: {err}"})
+            return
+        report[key].append(params | {"times" : times, "best" : min(times)})
+
+    # Remember the existing directory of pre-existing data ...
+    oldDir = cartopy.config["pre_existing_data_dir"]
+
+    try:
+        # Loop over numbers of territories and numbers of points ...
+        for nTerr in nTerritories:
+            for nPts in nPoints:
+                # Create the synthetic shapefile and use it instead of the
+                # real one ...
+                sdir = f"{bdir}/nTerritories={nTerr:d}_nPoints={nPts:d}"
+                territories = create_synthetic_shapefile(
+                    sdir,
+                         nPoints = nPts,
+                    nTerritories = nTerr,
+                )
+                cartopy.config["pre_existing_data_dir"] = pathlib.PosixPath(sdir)
+
+                # Create short-hand function to create a new database ...
+                def bench_create_db():
+                    if os.path.exists(f"{sdir}/db.json"):
+                        os.remove(f"{sdir}/db.json")
+                    create_db(
+                        f"{sdir}/db.json",
+                        territories = territories,
+                    )
+
+                # Time the creation of the database ...
+                time_it(
+                    "create_db",
+                    {"nPoints" : nPts, "nTerritories" : nTerr},
+                    bench_create_db,
+                )
+
+                # Create short-hand function to find the framings of the maps
+                # of the database from scratch ...
+                def bench_calc_territory_framings():
+                    db = load_db(f"{sdir}/db.json")
+                    for info in db.values():
+                        info.pop("framing", None)
+                    calc_territory_framings(db)
+
+                # Time finding the framings of the maps ...
+                # NOTE: Loading the database is included in the time, but it
+                #       is negligible compared to finding the framings.
+                time_it(
+                    "calc_territory_framings",
+                    {"nPoints" : nPts, "nTerritories" : nTerr},
+                    bench_calc_territory_framings,
+                )
+
+                # Load the database ...
+                db = load_db(f"{sdir}/db.json")
+
+                # Check if this is the smallest number of points ...
+                if nPts == nPoints[0]:
+                    # Loop over numbers of days ...
+                    for n in nDays:
+                        # Make output directory ...
+                        tdir = f"{sdir}/nDays={n:d}"
+                        if not os.path.exists(tdir):
+                            os.makedirs(tdir)
+
+                        # Time creating the PNG timeline ...
+                        time_it(
+                            "create_timeline",
+                            {"nDays" : n, "nPoints" : nPts, "nTerritories" : nTerr},
+                            lambda: create_timeline(
+                                tdir,
+                                db,
+                                   debug = debug,
+                                  engine = "numpy",
+                                       n = n,
+                                optimise = False,
+                                   start = d0,
+                                 timeout = timeout,
+                            ),
+                        )
+
+                        # Create short-hand function to optimise a fresh copy
+                        # of the PNG timeline ...
+                        def bench_optimise_image():
+                            shutil.copyfile(f"{tdir}/plot.png", f"{tdir}/plot.opt.png")
+                            pyguymer3.image.optimise_image(
+                                f"{tdir}/plot.opt.png",
+                                  debug = debug,
+                                  strip = True,
+                                timeout = timeout,
+                            )
+
+                        # Time optimising the PNG timeline ...
+                        # NOTE: Copying the PNG is included in the time, but it
+                        #       is negligible compared to running the
+                        #       optimisers.
+                        time_it(
+                            "optimise_image",
+                            {"nDays" : n, "nPoints" : nPts, "nTerritories" : nTerr},
+                            bench_optimise_image,
+                        )
+
+                # Skip the benchmarks which only depend on the number of
+                # points (if they have already been run) ...
+                if nTerr != nTerritories[0]:
+                    continue
+
+                # Time creating the PNG map of the first territory ...
+                name = sorted(db.keys())[0]
+                time_it(
+                    "create_map",
+                    {"nPoints" : nPts},
+                    lambda: create_map(
+                        name,
+                        db[name],
+                        f"{sdir}/map.png",
+                           debug = debug,
+                           nIter = nIter,
+                        optimise = False,
+                         timeout = timeout,
+                    ),
+                )
+
+                # Load the coordinates of the first territory ...
+                coords = load_territory_coords(territories[sorted(territories.keys())[0]])   # [°]
+
+                # Time finding the middle of the points ...
+                time_it(
+                    "find_middle_of_locs",
+                    {"nPoints" : nPts},
+                    lambda: pyguymer3.geo.find_middle_of_locs(
+                        coords[:, 0],
+                        coords[:, 1],
+                         angConv = 0.1,
+                            conv = 10000.0,                                     # 10 km
+                           debug = False,
+                          method = "GeodesicCircle",
+                            nAng = 9,
+                           nIter = nIter,
+                         nRefine = 6,                                           # 156.25 m
+                             pad = 12.0 * 1852.0,
+                        useSciPy = False,
+                    ),
+                )
+
+                # Loop over numbers of days and time finding the sunrises and
+                # sunsets ...
+                for n in nDays:
+                    time_it(
+                        "calc_sun_ephem",
+                        {"nDays" : n, "nPoints" : nPts},
+                        lambda: calc_sun_ephem(coords, d0, n),
+                    )
+    finally:
+        # Restore the existing directory of pre-existing data ...
+        cartopy.config["pre_existing_data_dir"] = oldDir
+
+    # Save report ...
+    jpath = f"{dirOut}/benchmarks.json"
+    tpath = f"{jpath}.{os.getpid():d}.tmp"
+    with open(tpath, mode = "wt", encoding = "utf-8") as fObj:
+        json.dump(
+            report,
+            fObj,
+            ensure_ascii = False,
+                  indent = 4,
+               sort_keys = True,
+        )
+    os.replace(tpath, jpath)
+
+    # Return answer ...
+    return report
@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def _run_stage(
+    name,
+    func,
+    args,
+    kwargs,
+    profileDir,
+    instrument,
+    /,
+):
+    """Run a stage of BOTS in another process
+
+    This function runs a stage in a worker of the process pool of
+    :func:`run_stages` and returns its result along with its own report (see
+    :func:`stop_report`), so that its times and counters can be added to the
+    report of the parent process.
+    """
+
+    # Import sub-functions ...
+    from .start_report import start_report
+    from .start_stage import start_stage
+    from .stop_report import stop_report
+    from .stop_stage import stop_stage
+
+    # Start the report of this process (if needed) ...
+    if instrument:
+        start_report(profileDir = profileDir)
+
+    # Run the stage ...
+    stage = start_stage(name)
+    result = func(*args, **kwargs)
+    stop_stage(stage)
+
+    # Return answer ...
+    return result, stop_report()
+
+# Define function ...
+def run_stages(
+    stages,
+    /,
+    *,
+    mpath = None,
+     pool = None,
+):
+    """Run some stages of BOTS in the order of their dependencies
+
+    This function runs some stages, each of which only starts once all of the
+    stages that it depends on have finished. Stages which do not depend on each
+    other run at the same time: the stages which run in another process are
+    started first, then the stages which run in this process are run one at a
+    time. A stage whose output is up to date is skipped.
+
+    Parameters
+    ----------
+    stages : dict
+        the stages, keyed by their names, each of which is a dict of: the names
+        of the stages which it depends on ("deps"); the function to call
+        ("func"); its positional arguments ("args") and keyword arguments
+        ("kwargs"); whether to run it in another process ("process"); and,
+        optionally, the path to its output ("output") and a description of
+        everything that its output depends on ("desc")
+    mpath : str, optional
+        the path to keep the descriptions of the outputs in (if None then every
+        stage is run)
+    pool : concurrent.futures.ProcessPoolExecutor, optional
+        the process pool to run the stages which run in another process in (if
+        None then one with one worker is made)
+
+    Returns
+    -------
+    summary : dict
+        the names of the stages which were made, the names of the stages which
+        were skipped (because they are up to date) and the names of the stages
+        which failed (along with the reason why), along with the result of each
+        stage which was made
+
+    Notes
+    -----
+    A dependency which is not one of the stages is assumed to be up to date.
+    The positional arguments and the description of a stage may be functions
+    of the results of the stages so far, so that they can use the results of
+    the stages that it depends on. A stage is up to date if its output exists
+    and its description is the same as when it was last made (as in "make",
+    but with a description rather than a modification time). A stage whose
+    dependency failed fails too, but the other stages carry on.
+
+    The stages which run in another process share one worker (unless a process
+    pool with more workers is given), so they run one at a time, in the order
+    that they are given. The times and counters of a stage which runs in
+    another process are added to the report (see :func:`start_report`), but not
+    those of any process pool which it uses.
+    """
+
+    # Import standard modules ...
+    import concurrent.futures
+    import contextlib
+    import json
+    import os
+
+    # Import sub-functions ...
+    from .record_count import record_count
+    from .start_report import _report
+    from .start_stage import start_stage
+    from .stop_stage import stop_stage
+
+    # Check the dependencies ...
+    for name, stage in stages.items():
+        if name in stage["deps"]:
+            raise Exception(f"the stage \"{name}\" depends on itself") from None
+
+    # Create summary ...
+    summary = {
+           "made" : [],
+        "skipped" : [],
+         "failed" : {},
+        "results" : {},
+    }
+
+    # Load the descriptions of the outputs which have been made before (if
+    # there are any) ...
+    manifest = {}
+    if mpath is not None and os.path.exists(mpath):
+        with open(mpath, mode = "rt", encoding = "utf-8") as fObj:
+            manifest = json.load(fObj)
+
+    # Create short-hand function to find the state of the dependencies of a
+    # stage ...
+    def find_state(name):
+        deps = [dep for dep in stages[name]["deps"] if dep in stages]
+        if any(dep in summary["failed"] for dep in deps):
+            return "failed"
+        if all(dep in summary["made"] or dep in summary["skipped"] for dep in deps):
+            return "ready"
+        return "waiting"
+
+    # Create short-hand function to evaluate something which may be a
+    # function of the results of the stages so far ...
+    def evaluate(value):
+        if callable(value):
+            return value(summary["results"])
+        return value
+
+    # Create short-hand function to record the outcome of a stage ...
+    def record(name, desc, err = None):
+        if err is not None:
+            print(f"WARNING: Failed to run \"{name}\" ({err}).")
+            summary["failed"][name] = f"{type(err).__name__}: {err}"
+            return
+        summary["made"].append(name)
+        if desc is not None:
+            manifest[name] = desc
+
+    # Create process pool and dictionaries of the stages which are running in
+    # it (and their descriptions) ...
+    # NOTE: The worker is only started when the first stage is submitted to
+    #       it. A process pool which was given is not shut down.
+    pending = list(stages.keys())
+    futures = {}
+    descs = {}
+    if pool is None:
+        ctx = concurrent.futures.ProcessPoolExecutor(max_workers = 1)
+    else:
+        ctx = contextlib.nullcontext(pool)
+    with ctx as pool:
+        # Loop until all stages have finished ...
+        while len(pending) > 0 or len(futures) > 0:
+            # Loop over stages which are running in the process pool and
+            # record the outcomes of the ones which have finished ...
+            for name, future in list(futures.items()):
+                if not future.done():
+                    continue
+                del futures[name]
+                try:
+                    summary["results"][name], report = future.result()
+                except Exception as err:
+                    record(name, descs[name], err)
+                    continue
+                record(name, descs[name])
+
+                # Add the report of the other process to the report of this
+                # process ...
+                if report is not None:
+                    for key, value in report["counters"].items():
+                        record_count(key, value)
+                    for key, value in report["stages"].items():
+                        if key not in _report["stages"]:
+                            _report["stages"][key] = {"calls" : 0, "cpu" : 0.0, "wall" : 0.0}
+                        for subKey in ["calls", "cpu", "wall"]:
+                            _report["stages"][key][subKey] += value[subKey]
+                        if "profile" in value:
+                            _report["stages"][key]["profile"] = value["profile"]
+
+            # Loop over stages which have not started ...
+            local = None
+            progress = False
+            for name in list(pending):
+                # Skip this stage if it is waiting for a dependency (or fail
+                # it if a dependency failed) ...
+                state = find_state(name)
+                if state == "waiting":
+                    continue
+                if state == "failed":
+                    pending.remove(name)
+                    summary["failed"][name] = "a dependency failed"
+                    progress = True
+                    continue
+
+                # Skip this stage if its output is up to date ...
+                # NOTE: The description is converted to and from JSON so that
+                #       it can be compared with the one in the manifest.
+                desc = evaluate(stages[name].get("desc"))
+                if desc is not None:
+                    desc = json.loads(json.dumps(desc, sort_keys = True))
+                    if mpath is not None and os.path.exists(stages[name]["output"]) and manifest.get(name) == desc:
+                        pending.remove(name)
+                        summary["skipped"].append(name)
+                        progress = True
+                        continue
+
+                # Start this stage in the process pool (or note it as the
+                # next stage to run in this process) ...
+                if stages[name]["process"]:
+                    pending.remove(name)
+                    progress = True
+                    descs[name] = desc
+                    futures[name] = pool.submit(
+                        _run_stage,
+                        name,
+                        stages[name]["func"],
+                        evaluate(stages[name].get("args", ())),
+                        stages[name].get("kwargs", {}),
+                        _report.get("profileDir"),
+                        len(_report) > 0,
+                    )
+                elif local is None:
+                    local = (name, desc)
+
+            # Check if there is a stage to run in this process ...
+            if local is not None:
+                # Run the stage and record its outcome ...
+                name, desc = local
+                pending.remove(name)
+                stage = start_stage(name)
+                try:
+                    summary["results"][name] = stages[name]["func"](
+                        *evaluate(stages[name].get("args", ())),
+                        **stages[name].get("kwargs", {}),
+                    )
+                except Exception as err:
+                    record(name, desc, err)
+                    continue
+                finally:
+                    stop_stage(stage)
+                record(name, desc)
+                continue
+
+            # Check if there are stages in the process pool ...
+            if len(futures) > 0:
+                # Wait for one of them to finish ...
+                concurrent.futures.wait(
+                    futures.values(),
+                    return_when = concurrent.futures.FIRST_COMPLETED,
+                )
+                continue
+
+            # Check if no stage can start ...
+            if len(pending) > 0 and not progress:
+                raise Exception(f"the stages {pending} have circular dependencies") from None
+
+    # Save the descriptions (if needed) ...
+    if mpath is not None:
+        tpath = f"{mpath}.{os.getpid():d}.tmp"
+        with open(tpath, mode = "wt", encoding = "utf-8") as fObj:
+            json.dump(
+                manifest,
+                fObj,
+                ensure_ascii = False,
+                      indent = 4,
+                   sort_keys = True,
+            )
+        os.replace(tpath, mpath)
+
+    # Return answer ...
+    return summary
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def sample_dem(
+    dem,
+    lons,
+    lats,
+    /,
+):
+    """Sample a Digital Elevation Model at some coordinates
+
+    This function bilinearly interpolates the elevations of a Digital Elevation
+    Model (see :func:`load_dem`) at some coordinates, all at once.
+
+    Parameters
+    ----------
+    dem : dict
+        the DEM
+    lons : numpy.ndarray
+        the longitudes (in degrees)
+    lats : numpy.ndarray
+        the latitudes (in degrees)
+
+    Returns
+    -------
+    elevs : numpy.ndarray
+        the elevations (in metres, or NaN if a coordinate is outside of the DEM
+        or next to a cell without any data)
+
+    Notes
+    -----
+    Only the four cells around each coordinate are read, so a memory-mapped DEM
+    is never read in full.
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Create short-hands ...
+    ny, nx = dem["elev"].shape                                                  # [#], [#]
+
+    # Find the fractional position of each coordinate in the grid ...
+    fx = (numpy.asarray(lons, dtype = numpy.float64) - dem["lon0"]) / dem["dlon"]
+    fy = (numpy.asarray(lats, dtype = numpy.float64) - dem["lat0"]) / dem["dlat"]
+
+    # Find which coordinates are inside the grid ...
+    inside = (fx >= 0.0) & (fx <= nx - 1) & (fy >= 0.0) & (fy <= ny - 1)
+
+    # Find the four cells around each coordinate and their weights ...
+    ix = numpy.clip(numpy.floor(fx), 0, max(0, nx - 2)).astype(numpy.int64)
+    iy = numpy.clip(numpy.floor(fy), 0, max(0, ny - 2)).astype(numpy.int64)
+    wx = numpy.clip(fx - ix, 0.0, 1.0)
+    wy = numpy.clip(fy - iy, 0.0, 1.0)
+    ix1 = numpy.minimum(ix + 1, nx - 1)
+    iy1 = numpy.minimum(iy + 1, ny - 1)
+
+    # Interpolate the elevations ...
+    elevs = (
+        dem["elev"][iy, ix] * (1.0 - wx) * (1.0 - wy) +
+        dem["elev"][iy, ix1] * wx * (1.0 - wy) +
+        dem["elev"][iy1, ix] * (1.0 - wx) * wy +
+        dem["elev"][iy1, ix1] * wx * wy
+    )                                                                           # [m]
+
+    # Return answer ...
+    return numpy.where(inside, elevs, numpy.nan)                                # [m]
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def save_db(
+    dbpath,
+    territories,
+    /,
+):
+    """Save the database of points
+
+    This function saves the database of points either as an indented JSON file
+    (if the path ends with ".json") or as a compact binary file (otherwise).
+
+    Parameters
+    ----------
+    dbpath : str
+        the path to save the database
+    territories : dict
+        the database
+
+    Notes
+    -----
+    The binary file is the 8-byte magic string "BOTSDB01", followed by an 8-byte
+    little-endian header length, followed by a JSON header, followed by zero
+    padding up to the next multiple of 8 bytes, followed by a single
+    little-endian float64 buffer. The header contains everything in the database
+    apart from the "coords" and "extremalCoords" (and the "elevations" and
+    "extremalElevations", if any) of each territory, which are replaced by the
+    (offset, number of rows) of a contiguous (N, 2) (or (N,)) array in the
+    buffer. See :func:`load_db`.
+    """
+
+    # Import standard modules ...
+    import json
+    import os
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Check if the database should be saved as JSON ...
+    if dbpath.endswith(".json"):
+        # Convert the arrays (if any) to lists ...
+        territories = {
+            territory : {
+                key : (value.tolist() if value.ndim == 1 else [(lon, lat) for lon, lat in value.tolist()]) if isinstance(value, numpy.ndarray) else value
+                for key, value in info.items()
+            }
+            for territory, info in territories.items()
+        }
+
+        # Save database ...
+        tpath = f"{dbpath}.{os.getpid():d}.tmp"
+        with open(tpath, mode = "wt", encoding = "utf-8") as fObj:
+            json.dump(
+                territories,
+                fObj,
+                ensure_ascii = False,
+                      indent = 4,
+                   sort_keys = True,
+            )
+        os.replace(tpath, dbpath)
+        return
+
+    # Create dictionary of the keys which are saved in the buffer, along with
+    # the number of columns of each one ...
+    nCols = {
+                    "coords" : 2,
+                "elevations" : 1,
+            "extremalCoords" : 2,
+        "extremalElevations" : 1,
+    }
+
+    # Create header and list of arrays ...
+    header = {}
+    arrs = []
+    offset = 0                                                                  # [#]
+    for territory in sorted(list(territories.keys())):
+        header[territory] = {}
+        for key, value in territories[territory].items():
+            if key not in nCols:
+                header[territory][key] = value
+                continue
+            arr = numpy.array(value, dtype = "<f8").reshape(-1, nCols[key])
+            header[territory][key] = (offset, arr.shape[0])
+            arrs.append(arr)
+            offset += arr.size                                                  # [#]
+    header = json.dumps(header, ensure_ascii = False, sort_keys = True).encode("utf-8")
+
+    # Save database ...
+    tpath = f"{dbpath}.{os.getpid():d}.tmp"
+    with open(tpath, mode = "wb") as fObj:
+        fObj.write(b"BOTSDB01")
+        fObj.write(len(header).to_bytes(8, byteorder = "little"))
+        fObj.write(header)
+        fObj.write(bytes(-len(header) % 8))
+        for arr in arrs:
+            fObj.write(arr.tobytes())
+    os.replace(tpath, dbpath)
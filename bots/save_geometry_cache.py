@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def save_geometry_cache(
+    cpath,
+    key,
+    names,
+    records,
+    /,
+):
+    """Save a geometry cache
+
+    This function saves a geometry cache of the Polygons extracted from some
+    records of a shapefile. The file is an 8-byte little-endian header length,
+    followed by a JSON header, followed by the WKB of every Polygon. The header
+    lists the offset (relative to the end of the header) and the length of the
+    WKB of each Polygon of each record.
+
+    Parameters
+    ----------
+    cpath : str
+        the path to the geometry cache
+    key : dict
+        the description of the shapefile and the settings
+    names : list of str
+        the names of the countries which have been cached (including the ones
+        which do not have any records in the shapefile)
+    records : list of tuples
+        the (name, index, list of WKB bytes) of each record
+
+    Notes
+    -----
+    The file is written to a temporary path and then moved into place, so that
+    readers (such as other processes in a pool) never see a partial file.
+    """
+
+    # Import standard modules ...
+    import json
+    import os
+
+    # Create header and list of WKBs ...
+    header = {
+            "key" : key,
+          "names" : sorted(set(names)),
+        "records" : [],
+    }
+    blobs = []
+    offset = 0                                                                  # [B]
+    for name, index, wkbs in records:
+        spans = []
+        for wkb in wkbs:
+            spans.append((offset, len(wkb)))
+            blobs.append(wkb)
+            offset += len(wkb)                                                  # [B]
+        header["records"].append((name, index, spans))
+    header = json.dumps(header, ensure_ascii = False).encode("utf-8")
+
+    # Save cache ...
+    tpath = f"{cpath}.{os.getpid():d}.tmp"
+    with open(tpath, mode = "wb") as fObj:
+        fObj.write(len(header).to_bytes(8, byteorder = "little"))
+        fObj.write(header)
+        for blob in blobs:
+            fObj.write(blob)
+    os.replace(tpath, cpath)
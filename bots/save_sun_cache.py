@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def save_sun_cache(
+    cpath,
+    t0s,
+    vals,
+    /,
+    *,
+    maxSize = 67108864,
+):
+    """Save some days to a sunrise/sunset cache
+
+    This function merges the earliest and latest sunrises and sunsets of some
+    days into a sunrise/sunset cache and then evicts the least recently used
+    caches in the same directory until they fit in the size limit.
+
+    Parameters
+    ----------
+    cpath : str
+        the path to the sunrise/sunset cache
+    t0s : numpy.ndarray
+        the start of each day (in seconds since the POSIX epoch)
+    vals : numpy.ndarray
+        the earliest sunrise, the latest sunrise, the earliest sunset and the
+        latest sunset of each day for each of the H horizons, as an (N, 4 × H)
+        array (in seconds since the POSIX epoch)
+    maxSize : int, optional
+        the maximum total size of all of the caches in the directory (in bytes),
+        the cache which has just been saved is never evicted
+
+    Notes
+    -----
+    Each cache is a NumPy array with one row per day, sorted by the start of
+    the day, containing the start of the day and then the values. It is
+    saved as int64 so that days before the POSIX epoch can be cached.
+    """
+
+    # Import standard modules ...
+    import glob
+    import os
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Make cache directory ...
+    if not os.path.exists(os.path.dirname(cpath)):
+        os.makedirs(os.path.dirname(cpath))
+
+    # Create the new rows ...
+    arr = numpy.zeros((t0s.size, 1 + vals.shape[1]), dtype = numpy.int64)       # [s]
+    arr[:, 0] = t0s                                                             # [s]
+    arr[:, 1:] = vals                                                           # [s]
+
+    # Merge the existing rows (if there are any) ...
+    # NOTE: The new rows take precedence over the existing rows.
+    if os.path.exists(cpath):
+        try:
+            old = numpy.load(cpath)
+        except:
+            old = numpy.zeros((0, arr.shape[1]), dtype = numpy.int64)           # [s]
+        if old.ndim != 2 or old.shape[1] != arr.shape[1]:
+            old = numpy.zeros((0, arr.shape[1]), dtype = numpy.int64)           # [s]
+        old = old[~numpy.isin(old[:, 0], arr[:, 0]), :]                         # [s]
+        arr = numpy.concatenate((old, arr))                                     # [s]
+    arr = arr[numpy.argsort(arr[:, 0], kind = "stable"), :]                     # [s]
+
+    # Save cache ...
+    tpath = f"{cpath}.{os.getpid():d}.tmp"
+    with open(tpath, mode = "wb") as fObj:
+        numpy.save(fObj, arr)
+    os.replace(tpath, cpath)
+
+    # Find the sizes and the modification times of all of the caches in the
+    # directory, the cache which has just been saved first and then the most
+    # recently used ...
+    caches = []
+    for fpath in glob.glob(f"{os.path.dirname(cpath)}/*.npy"):
+        try:
+            stat = os.stat(fpath)
+        except FileNotFoundError:
+            continue
+        caches.append((fpath == cpath, stat.st_mtime_ns, stat.st_size, fpath))
+    caches.sort(reverse = True)
+
+    # Evict the least recently used caches which do not fit ...
+    total = 0                                                                   # [B]
+    for isNew, _, size, fpath in caches:
+        if not isNew and total + size > maxSize:
+            try:
+                os.remove(fpath)
+            except FileNotFoundError:
+                pass
+            continue
+        total += size                                                           # [B]
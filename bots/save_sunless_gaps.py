@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def save_sunless_gaps(
+    dirOut,
+    territories,
+    d0,
+    n,
+    /,
+    *,
+    cacheDir = None,
+      engine = "ephem",
+       prune = True,
+     workers = 1,
+):
+    """Save the gaps when the Sun has set on the BOT
+
+    This function finds the gaps when the Sun has set on the BOT (with and
+    without the BAT, see :func:`calc_sunless_gaps`), prints how many there were
+    and saves them in "gaps.json" in the output directory.
+
+    Parameters
+    ----------
+    dirOut : str
+        the path to save the JSON in
+    territories : dict
+        the database
+    d0 : datetime.datetime
+        the start of the survey (in UTC)
+    n : int
+        the number of days to survey
+    cacheDir : str, optional
+        the directory to keep a persistent cache of the sunrises and sunsets in
+        (see :func:`calc_sun_territories`)
+    engine : str, optional
+        the engine used to calculate the sunrises and sunsets (see
+        :func:`calc_sun_territories`)
+    prune : bool, optional
+        only survey the points which can set the extreme sunrises and sunsets
+    workers : int, optional
+        the number of processes to use to find the sunrises and sunsets
+
+    Returns
+    -------
+    gaps : dict
+        the gaps (see :func:`calc_sunless_gaps`)
+    """
+
+    # Import standard modules ...
+    import datetime
+    import json
+    import os
+
+    # Import sub-functions ...
+    from .calc_sun_territories import calc_sun_territories
+    from .calc_sunless_gaps import calc_sunless_gaps
+
+    # Find the gaps when the Sun has set on the BOT ...
+    gaps = calc_sunless_gaps(
+        calc_sun_territories(
+            territories,
+            d0,
+            n,
+            cacheDir = cacheDir,
+              engine = engine,
+               prune = prune,
+             workers = workers,
+        ),
+        d0,
+        n,
+    )
+
+    # Print summary ...
+    for key, title in [("withBAT", "with"), ("withoutBAT", "without")]:
+        print(f"The Sun set on the BOT {len(gaps[key]):d} times {title} the BAT.")
+
+    # Save gaps ...
+    tpath = f"{dirOut}/gaps.json.{os.getpid():d}.tmp"
+    with open(tpath, mode = "wt", encoding = "utf-8") as fObj:
+        json.dump(
+            {
+                key : [
+                    (
+                        datetime.datetime.fromtimestamp(t1, tz = datetime.UTC).isoformat(),
+                        datetime.datetime.fromtimestamp(t2, tz = datetime.UTC).isoformat(),
+                    )
+                    for t1, t2 in value
+                ]
+                for key, value in gaps.items()
+            },
+            fObj,
+            ensure_ascii = False,
+                  indent = 4,
+               sort_keys = True,
+        )
+    os.replace(tpath, f"{dirOut}/gaps.json")
+
+    # Return answer ...
+    return gaps
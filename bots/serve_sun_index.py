@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def serve_sun_index(
+    index,
+    /,
+    *,
+    debug = __debug__,
+     host = "127.0.0.1",
+     path = None,
+     port = 8000,
+):
+    """Serve queries of an index of the sunlit intervals over HTTP
+
+    This function answers HTTP GET requests using an index (see
+    :func:`build_sun_index`), either on a TCP port or on a Unix socket, until it
+    is interrupted. It only needs NumPy, so other processes can query the
+    sunrise and sunset data without importing cartopy or matplotlib.
+
+    Parameters
+    ----------
+    index : dict
+        the index
+    debug : bool, optional
+        print debug messages
+    host : str, optional
+        the address to listen on (if not using a Unix socket)
+    path : str, optional
+        the path of a Unix socket to listen on (if None then a TCP port is
+        used)
+    port : int, optional
+        the port to listen on (if not using a Unix socket)
+
+    Notes
+    -----
+    The endpoints return JSON and take times as either seconds since the POSIX
+    epoch or ISO 8601 strings (which are assumed to be in UTC if they are
+    naïve):
+
+    * "/sunlit_at?t=..." (see :func:`sunlit_at`);
+    * "/coverage_between?t1=...&t2=..." (see :func:`coverage_between`); and
+    * "/next_sunset_gap?after=..." (see :func:`next_sunset_gap`).
+    """
+
+    # Import standard modules ...
+    import datetime
+    import http.server
+    import json
+    import os
+    import socketserver
+    import urllib.parse
+
+    # Import sub-functions ...
+    from .coverage_between import coverage_between
+    from .next_sunset_gap import next_sunset_gap
+    from .sunlit_at import sunlit_at
+
+    # Create short-hand function to parse a time ...
+    def parse_time(value):
+        try:
+            return float(value)                                                 # [s]
+        except ValueError:
+            pass
+        d = datetime.datetime.fromisoformat(value)
+        if d.tzinfo is None:
+            d = d.replace(tzinfo = datetime.UTC)
+        return d.timestamp()                                                    # [s]
+
+    # Define the request handler ...
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urllib.parse.urlsplit(self.path)
+            args = {key : value[-1] for key, value in urllib.parse.parse_qs(url.query).items()}
+            try:
+                match url.path:
+                    case "/sunlit_at":
+                        ans = sunlit_at(index, parse_time(args["t"]))
+                    case "/coverage_between":
+                        ans = coverage_between(index, parse_time(args["t1"]), parse_time(args["t2"]))
+                    case "/next_sunset_gap":
+                        ans = next_sunset_gap(
+                            index,
+                            after = parse_time(args["after"]) if "after" in args else None,
+                        )
+                    case _:
+                        self.send_error(404)
+                        return
+            except (KeyError, ValueError) as err:
+                self.send_error(400, explain = f"{type(err).__name__}: {err}")
+                return
+            body = json.dumps(ans).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, fmt, *args):
+            if debug:
+                print(f"DEBUG: {fmt % args}")
+
+    # Check if a Unix socket is required ...
+    if path is not None:
+        # Remove any stale socket ...
+        if os.path.exists(path):
+            os.remove(path)
+
+        # Define the server ...
+        # NOTE: The address of a client of a Unix socket is an empty string,
+        #       which "http.server.BaseHTTPRequestHandler" expects to be a
+        #       (host, port) tuple.
+        class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+            daemon_threads = True
+
+            def get_request(self):
+                request, _ = super().get_request()
+                return request, ("local", 0)
+
+        server = Server(path, Handler)
+    else:
+        server = http.server.ThreadingHTTPServer((host, port), Handler)
+
+    # Serve requests until interrupted ...
+    with server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+    # Remove the socket ...
+    if path is not None and os.path.exists(path):
+        os.remove(path)
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+
+# Create cache ...
+# NOTE: This is a per-process cache, so that the Polygons of each territory are
+#       only simplified once for each level of detail, no matter how many
+#       times they are drawn.
+_simplified = {}
+
+# Define function ...
+def simplify_country_polys(
+    polys,
+    tolerance,
+    /,
+    *,
+     cacheDir = None,
+    cacheSize = 67108864,
+):
+    """Simplify the Polygons of some countries to a level of detail
+
+    This function simplifies the Polygons of some countries (see
+    :func:`load_country_polys`) so that they are only as detailed as the axis
+    that they are drawn on, which makes drawing the whole globe much faster
+    without changing how it looks.
+
+    Parameters
+    ----------
+    polys : list of shapely.geometry.polygon.Polygon
+        the Polygons
+    tolerance : float
+        the largest distance that a simplified Polygon may be from the original
+        Polygon (in degrees)
+    cacheDir : str, optional
+        the directory to keep a persistent cache of the simplified Polygons in
+        (if None then the Polygons are simplified by every process)
+    cacheSize : int, optional
+        the maximum total size of the simplified Polygons in the persistent
+        cache (in bytes), the simplified Polygons which have just been added
+        are never evicted
+
+    Returns
+    -------
+    polys : list of shapely.geometry.polygon.Polygon
+        the simplified Polygons
+
+    Notes
+    -----
+    The tolerance is rounded down to a power of two (the level of detail), so
+    that axes of similar extents share the same simplified Polygons. The caches
+    are keyed on the SHA-256 hash of the WKB of the Polygons and on the level of
+    detail, so they never return the simplified Polygons of an out-of-date
+    shapefile. The topology is preserved, so no Polygon (however small) is
+    simplified away and no simplified Polygon is invalid.
+
+    The records in the persistent cache are kept in the order that they were
+    last used, so the least recently used ones are evicted first when the cache
+    is too big. A record is only marked as used when the cache is saved (i.e.,
+    when a process adds a record), so that a process which only reads from the
+    cache never rewrites it.
+    """
+
+    # Import standard modules ...
+    import hashlib
+    import math
+
+    # Import special modules ...
+    try:
+        import shapely
+    except:
+        raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+    # Import sub-functions ...
+    from .load_geometry_cache import load_geometry_cache
+    from .record_count import record_count
+    from .save_geometry_cache import save_geometry_cache
+
+    # Check that there are some Polygons to simplify ...
+    if len(polys) == 0 or tolerance <= 0.0:
+        return polys
+
+    # Find the level of detail and the hash of the Polygons ...
+    level = math.floor(math.log2(tolerance))
+    hObj = hashlib.sha256()
+    for poly in polys:
+        hObj.update(shapely.to_wkb(poly))
+    digest = hObj.hexdigest()
+
+    # Check if the simplified Polygons are in the per-process cache ...
+    if (digest, level) in _simplified:
+        return _simplified[(digest, level)]
+
+    # Check if there is a persistent cache ...
+    if cacheDir is not None:
+        # Create short-hands ...
+        cpath = f"{cacheDir}/lod-cache.bin"
+        key = {
+            "version" : 1,
+        }
+
+        # Load the cache and check if the simplified Polygons are in it ...
+        header, buf = load_geometry_cache(cpath, key)
+        if header is not None:
+            for name, i, spans in header["records"]:
+                if name == digest and i == level:
+                    _simplified[(digest, level)] = [
+                        shapely.from_wkb(buf[header["base"] + offset:header["base"] + offset + size])
+                        for offset, size in spans
+                    ]
+                    break
+            if (digest, level) in _simplified:
+                buf.close()
+                return _simplified[(digest, level)]
+
+    # Simplify the Polygons ...
+    _simplified[(digest, level)] = shapely.simplify(
+        polys,
+        2.0 ** level,
+        preserve_topology = True,
+    ).tolist()
+    record_count("verticesBeforeSimplification", int(shapely.get_num_coordinates(polys).sum()))
+    record_count("verticesAfterSimplification", int(shapely.get_num_coordinates(_simplified[(digest, level)]).sum()))
+
+    # Check if there is a persistent cache ...
+    if cacheDir is not None:
+        # Create list of the records in the cache, the least recently used
+        # first (the ones which this process has used are moved to the end) ...
+        records = []
+        if header is not None:
+            for name, i, spans in header["records"]:
+                records.append((name, i, [buf[header["base"] + offset:header["base"] + offset + size] for offset, size in spans]))
+            buf.close()
+        records.sort(key = lambda record: (record[0], record[1]) in _simplified)
+        records.append((digest, level, [shapely.to_wkb(poly) for poly in _simplified[(digest, level)]]))
+
+        # Evict the least recently used records which do not fit ...
+        total = sum(len(wkb) for _, _, wkbs in records for wkb in wkbs)         # [B]
+        while len(records) > 1 and total > cacheSize:
+            total -= sum(len(wkb) for wkb in records[0][2])                     # [B]
+            del records[0]
+            record_count("simplifiedPolygonsEvicted")
+
+        # Save the cache ...
+        save_geometry_cache(
+            cpath,
+            key,
+            [name for name, _, _ in records],
+            records,
+        )
+
+    # Return answer ...
+    return _simplified[(digest, level)]
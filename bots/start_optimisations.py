@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+
+# Create queue ...
+# NOTE: This is a per-process queue, which stays empty (so that PNGs are
+#       optimised straight away, see "queue_optimisation()") unless it has been
+#       started.
+_queue = {}
+
+# Define function ...
+def start_optimisations(
+    *,
+     cacheDir = None,
+    cacheSize = 67108864,
+      workers = 1,
+):
+    """Start optimising PNGs in the background
+
+    This function starts a pool of threads which optimise the PNGs which are
+    queued (see :func:`queue_optimisation`) while the rest of BOTS carries on,
+    until :func:`stop_optimisations` is called.
+
+    Parameters
+    ----------
+    cacheDir : str, optional
+        the directory to keep the optimised PNGs in (see :func:`optimise_png`)
+    cacheSize : int, optional
+        the maximum total size of the optimised PNGs in the cache (in bytes)
+    workers : int, optional
+        the number of PNGs to optimise at the same time
+
+    Notes
+    -----
+    The optimisers are separate programs, so a pool of threads is enough to
+    run them at the same time as matplotlib is rendering the next PNG. The
+    queue belongs to the process which started it, so the workers of a process
+    pool optimise their PNGs straight away.
+    """
+
+    # Import standard modules ...
+    import concurrent.futures
+    import os
+
+    # Check that the queue has not already been started ...
+    if len(_queue) > 0:
+        raise Exception("the optimisation queue has already been started") from None
+
+    # Start the queue ...
+    _queue.update(
+        {
+             "cacheDir" : cacheDir,
+            "cacheSize" : cacheSize,                                            # [B]
+              "futures" : {},
+                  "pid" : os.getpid(),
+                 "pool" : concurrent.futures.ThreadPoolExecutor(max_workers = workers),
+        }
+    )
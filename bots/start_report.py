@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+
+# Create report ...
+# NOTE: This is a per-process report, which stays empty (so that recording
+#       stages and counters costs next to nothing) unless it has been started.
+_report = {}
+
+# Define function ...
+def start_report(
+    *,
+    profileDir = None,
+):
+    """Start recording the stages and counters of BOTS
+
+    This function starts recording the wall time and the CPU time of each
+    stage (see :func:`start_stage` and :func:`stop_stage`) and the counters
+    (see :func:`record_count`) of this process, until :func:`stop_report` is
+    called.
+
+    Parameters
+    ----------
+    profileDir : str, optional
+        the directory to save a cProfile profile of each stage in (if None then
+        the stages are not profiled)
+
+    Notes
+    -----
+    Only one stage is profiled at a time, so a stage which starts while
+    another stage is being profiled (such as each territory within
+    :func:`calc_sun_territories`) is only timed. The stages and counters of
+    the workers of a process pool are not recorded.
+    """
+
+    # Reset the report ...
+    _report.clear()
+    _report.update(
+        {
+              "counters" : {},
+            "profileDir" : profileDir,
+             "profilers" : {},
+             "profiling" : False,
+                "stages" : {},
+        }
+    )
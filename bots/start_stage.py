@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def start_stage(
+    name,
+    /,
+):
+    """Start timing a stage of BOTS
+
+    This function starts timing (and profiling, if requested) a stage, if a
+    report has been started (see :func:`start_report`).
+
+    Parameters
+    ----------
+    name : str
+        the name of the stage (where a "/" separates a stage from the stage
+        which it is part of, e.g., "calc_sun_territories/Gibraltar")
+
+    Returns
+    -------
+    stage : tuple
+        the stage, to give to :func:`stop_stage`, or None if a report has not
+        been started
+    """
+
+    # Import standard modules ...
+    import time
+
+    # Import sub-functions ...
+    from .start_report import _report
+
+    # Check that a report has been started ...
+    if len(_report) == 0:
+        return None
+
+    # Start profiling the stage (if needed and if no other stage is being
+    # profiled) ...
+    profiler = None
+    if _report["profileDir"] is not None and not _report["profiling"]:
+        # Import standard modules ...
+        import cProfile
+
+        if name not in _report["profilers"]:
+            _report["profilers"][name] = cProfile.Profile()
+        profiler = _report["profilers"][name]
+        _report["profiling"] = True
+        profiler.enable()
+
+    # Return answer ...
+    return name, time.perf_counter(), time.process_time(), profiler
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def stop_optimisations(
+    *,
+    debug = __debug__,
+    jpath = None,
+):
+    """Stop optimising PNGs in the background
+
+    This function waits for every PNG which was queued (see
+    :func:`queue_optimisation`) to be optimised, stops the queue which was
+    started by :func:`start_optimisations` and returns how many bytes were
+    saved.
+
+    Parameters
+    ----------
+    debug : bool, optional
+        print debug messages
+    jpath : str, optional
+        the path to save the summary as JSON (if None then it is not saved)
+
+    Returns
+    -------
+    summary : dict
+        the size of each PNG before ("before", in bytes) and after ("after", in
+        bytes) it was optimised, the bytes which were saved ("saved") and
+        whether the optimised PNG came from the cache ("cached") (or the reason
+        why it failed, "error"), or None if the queue was not started
+
+    Notes
+    -----
+    A failure to optimise one PNG does not stop the other PNGs from being
+    optimised; the PNG is left as it was rendered.
+    """
+
+    # Import standard modules ...
+    import json
+    import os
+
+    # Import sub-functions ...
+    from .record_count import record_count
+    from .start_optimisations import _queue
+
+    # Check that the queue was started ...
+    if len(_queue) == 0:
+        return None
+
+    # Create summary ...
+    summary = {}
+
+    # Loop over PNGs ...
+    for fpath, future in _queue["futures"].items():
+        # Wait for the PNG and record its outcome ...
+        try:
+            stats = future.result()
+        except Exception as err:
+            print(f"WARNING: Failed to optimise \"{fpath}\" ({err}).")
+            summary[fpath] = {
+                "error" : f"{type(err).__name__}: {err}",
+            }
+            continue
+        summary[fpath] = stats | {"saved" : stats["before"] - stats["after"]}   # [B]
+        record_count("pngBytesBeforeOptimisation", stats["before"])
+        record_count("pngBytesAfterOptimisation", stats["after"])
+        if stats["cached"]:
+            record_count("pngsOptimisedFromCache")
+
+        # Report the bytes which were saved ...
+        if debug:
+            print(f"INFO: Optimised \"{fpath}\" from {stats['before']:,d} bytes to {stats['after']:,d} bytes{' (cached)' if stats['cached'] else ''}.")
+
+    # Stop the queue ...
+    _queue["pool"].shutdown(wait = True)
+    _queue.clear()
+
+    # Save the summary (if needed) ...
+    if jpath is not None:
+        tpath = f"{jpath}.{os.getpid():d}.tmp"
+        with open(tpath, mode = "wt", encoding = "utf-8") as fObj:
+            json.dump(
+                summary,
+                fObj,
+                ensure_ascii = False,
+                      indent = 4,
+                   sort_keys = True,
+            )
+        os.replace(tpath, jpath)
+
+    # Return answer ...
+    return summary
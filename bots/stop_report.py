@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def stop_report(
+    *,
+    jpath = None,
+):
+    """Stop recording the stages and counters of BOTS
+
+    This function stops recording the stages and counters which were started
+    by :func:`start_report`, saves the profile of each stage (if they were
+    profiled) and returns the report.
+
+    Parameters
+    ----------
+    jpath : str, optional
+        the path to save the report as JSON (if None then it is not saved)
+
+    Returns
+    -------
+    report : dict
+        the counters ("counters") and the number of calls, the wall time and
+        the CPU time (in seconds) of each stage ("stages"), along with the path
+        of the profile of each stage (if they were profiled), or None if the
+        report was not started
+    """
+
+    # Import standard modules ...
+    import json
+    import os
+
+    # Import sub-functions ...
+    from .start_report import _report
+
+    # Check that the report was started ...
+    if len(_report) == 0:
+        return None
+
+    # Create report ...
+    report = {
+        "counters" : dict(sorted(_report["counters"].items())),
+          "stages" : {name : dict(stage) for name, stage in _report["stages"].items()},
+    }
+
+    # Save the profile of each stage (if there are any) ...
+    if len(_report["profilers"]) > 0:
+        if not os.path.exists(_report["profileDir"]):
+            os.makedirs(_report["profileDir"])
+        for name, profiler in _report["profilers"].items():
+            ppath = f"{_report['profileDir']}/{name.replace('/', '_')}.pstats"
+            profiler.dump_stats(ppath)
+            report["stages"][name]["profile"] = ppath
+
+    # Reset the report ...
+    _report.clear()
+
+    # Save the report (if needed) ...
+    if jpath is not None:
+        tpath = f"{jpath}.{os.getpid():d}.tmp"
+        with open(tpath, mode = "wt", encoding = "utf-8") as fObj:
+            json.dump(
+                report,
+                fObj,
+                ensure_ascii = False,
+                      indent = 4,
+                   sort_keys = True,
+            )
+        os.replace(tpath, jpath)
+
+    # Return answer ...
+    return report
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def stop_stage(
+    stage,
+    /,
+):
+    """Stop timing a stage of BOTS
+
+    This function stops timing (and profiling) a stage which was started by
+    :func:`start_stage` and adds its wall time and CPU time to the report (a
+    stage which is started more than once accumulates).
+
+    Parameters
+    ----------
+    stage : tuple
+        the stage (or None, if a report has not been started)
+    """
+
+    # Import standard modules ...
+    import time
+
+    # Import sub-functions ...
+    from .start_report import _report
+
+    # Check that a report has been started ...
+    if stage is None or len(_report) == 0:
+        return
+
+    # Find the times ...
+    name, wall0, cpu0, profiler = stage
+    wall = time.perf_counter() - wall0                                          # [s]
+    cpu = time.process_time() - cpu0                                            # [s]
+
+    # Stop profiling the stage (if needed) ...
+    if profiler is not None:
+        profiler.disable()
+        _report["profiling"] = False
+
+    # Add the times to the report ...
+    if name not in _report["stages"]:
+        _report["stages"][name] = {"calls" : 0, "cpu" : 0.0, "wall" : 0.0}
+    _report["stages"][name]["calls"] += 1
+    _report["stages"][name]["cpu"] += cpu                                       # [s]
+    _report["stages"][name]["wall"] += wall                                     # [s]
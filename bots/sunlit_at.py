@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def sunlit_at(
+    index,
+    t,
+    /,
+):
+    """Find the territories which are sunlit at a time
+
+    This function uses an index (see :func:`build_sun_index`) to find the
+    territories which are sunlit at a time, with one binary search for each
+    territory.
+
+    Parameters
+    ----------
+    index : dict
+        the index
+    t : float
+        the time (in seconds since the POSIX epoch)
+
+    Returns
+    -------
+    territories : list of str
+        the names of the territories which are sunlit, sorted alphabetically
+    """
+
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Create empty list ...
+    territories = []
+
+    # Loop over territories ...
+    for territory, intervals in index["territories"].items():
+        # Find the last interval which starts at or before the time and check if
+        # the time is within it ...
+        i = numpy.searchsorted(intervals["starts"], t, side = "right") - 1
+        if i >= 0 and t < intervals["ends"][i]:
+            territories.append(territory)
+
+    # Return answer ...
+    return sorted(territories)
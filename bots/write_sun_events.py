@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def write_sun_events(
+    fpath,
+    records,
+    /,
+):
+    """Write the extreme sunrises and sunsets of all of the territories
+
+    This function streams some records (see :func:`iter_sun_events`) to either
+    a CSV file (if the path ends with ".csv") or a newline-delimited JSON file
+    (otherwise), one record at a time.
+
+    Parameters
+    ----------
+    fpath : str
+        the path to save the records
+    records : iterable of dict
+        the records
+
+    Returns
+    -------
+    nRecords : int
+        the number of records which were written
+
+    Notes
+    -----
+    In the CSV file, the values which are None are written as empty fields and
+    the columns are the keys of the first record (which include "horizon" if
+    the records were made for some horizons).
+    """
+
+    # Import standard modules ...
+    import csv
+    import itertools
+    import json
+
+    # Create counter ...
+    nRecords = 0                                                                # [#]
+
+    # Check if the records should be saved as CSV ...
+    if fpath.endswith(".csv"):
+        # Find the columns from the first record ...
+        records = iter(records)
+        first = next(records, None)
+        if first is None:
+            fieldnames = ["territory", "day", "risMin", "risMax", "setMin", "setMax"]
+        else:
+            fieldnames = list(first.keys())
+            records = itertools.chain([first], records)
+
+        # Save records ...
+        with open(fpath, mode = "wt", encoding = "utf-8", newline = "") as fObj:
+            writer = csv.DictWriter(
+                fObj,
+                fieldnames = fieldnames,
+            )
+            writer.writeheader()
+            for record in records:
+                writer.writerow(record)
+                nRecords += 1                                                   # [#]
+    else:
+        # Save records ...
+        with open(fpath, mode = "wt", encoding = "utf-8") as fObj:
+            for record in records:
+                fObj.write(json.dumps(record, ensure_ascii = False) + "\n")
+                nRecords += 1                                                   # [#]
+
+    # Return answer ...
+    return nRecords
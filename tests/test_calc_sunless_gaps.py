@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+
+# Import standard modules ...
+import datetime
+import unittest
+
+# Import special modules ...
+import numpy
+
+# Import my modules ...
+import bots
+
+# Define class ...
+class TestCalcSunlessGaps(unittest.TestCase):
+    """Check the gaps when the Sun has set on the BOT (see
+    :func:`bots.calc_sunless_gaps`)
+    """
+
+    def test_polar_day(self):
+        # Find the sunrises and sunsets of a point in the BAT during the polar
+        # day and of a point in the UK (which has nights) ...
+        d0 = datetime.datetime(2024, 12, 10, tzinfo = datetime.UTC)
+        n = 5                                                                   # [#]
+        results = {
+            "British Antarctic Territory" : numpy.column_stack(bots.calc_sun_numpy([[-60.0, -75.0]], d0, n)),   # [s]
+                         "United Kingdom" : numpy.column_stack(bots.calc_sun_numpy([[-1.5, 52.0]], d0, n)),     # [s]
+        }
+
+        # Check that the BAT is in polar day ...
+        t0s = int(d0.timestamp()) + 86400 * numpy.arange(n, dtype = numpy.int64)    # [s]
+        numpy.testing.assert_array_equal(results["British Antarctic Territory"][:, 0], t0s)
+        numpy.testing.assert_array_equal(results["British Antarctic Territory"][:, 3], t0s + 86400)
+
+        # Find the gaps ...
+        gaps = bots.calc_sunless_gaps(results, d0, n)
+
+        # Check that the BAT closes every gap (and that there are gaps without
+        # it, one per night which overlaps the scanned days) ...
+        self.assertEqual(gaps["withBAT"], [])
+        self.assertEqual(len(gaps["withoutBAT"]), n - 1)
+
+# Run the tests ...
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+
+# Import standard modules ...
+import datetime
+import json
+import math
+import os
+import unittest
+
+# Import special modules ...
+import numpy
+
+# Import my modules ...
+import bots
+
+# Define class ...
+class TestPruneCoords(unittest.TestCase):
+    """Check that the pruned points of a territory set the same extreme sunrises
+    and sunsets as all of its points, on every day of a whole year, with both
+    the "ephem" and the "numpy" engines (see :func:`bots.prune_coords`)
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        # Load the points of a real territory ...
+        # NOTE: These are the points of the Falkland Islands from the Natural
+        #       Earth 10m countries shapefile (see "create_db()").
+        with open(f"{os.path.dirname(__file__)}/data/falkland-islands.json", mode = "rt", encoding = "utf-8") as fObj:
+            cls.coords = numpy.array(json.load(fObj), dtype = numpy.float64)    # [°]
+
+        # Find the start of the (leap) year ...
+        cls.d0 = datetime.datetime(2024, 1, 1, tzinfo = datetime.UTC)
+        cls.n = 366                                                             # [#]
+
+    def prune(self, dips = None):
+        # Find the pruned points (and the indices of them) ...
+        extremalCoords = bots.prune_coords(
+            [(lon, lat) for lon, lat in self.coords.tolist()],
+            dips = dips,
+        )
+        inds = {(lon, lat) : i for i, (lon, lat) in enumerate(self.coords.tolist())}
+        return numpy.array([inds[coord] for coord in extremalCoords], dtype = numpy.int64)
+
+    def survey(self, func, engine, /, *, step = 7):
+        # Find the extreme sunrises and sunsets on the days of the year ...
+        # NOTE: The "ephem" engine is too slow to survey every day of the year,
+        #       so it surveys every "step"-th day.
+        if engine == "numpy":
+            return func(self.d0, self.n)
+        return numpy.concatenate(
+            [
+                func(self.d0 + datetime.timedelta(days = i), 1)
+                for i in range(0, self.n, step)
+            ]
+        )
+
+    def test_default_horizon(self):
+        # Find the pruned points ...
+        inds = self.prune()
+        self.assertLess(inds.size, self.coords.shape[0] // 4)
+
+        # Loop over engines ...
+        for engine, calc_sun in [("ephem", bots.calc_sun_ephem), ("numpy", bots.calc_sun_numpy)]:
+            # Find the extreme sunrises and sunsets of all of the points and of
+            # the pruned points ...
+            full = self.survey(lambda d0, n: numpy.column_stack(calc_sun(self.coords, d0, n)), engine)  # [s]
+            pruned = self.survey(lambda d0, n: numpy.column_stack(calc_sun(self.coords[inds, :], d0, n)), engine)   # [s]
+
+            # Check that they are identical on every day ...
+            # NOTE: The pruning is exact (see "prune_coords()"), so there is no
+            #       tolerance.
+            for i, key in enumerate(["risMin", "risMax", "setMin", "setMax"]):
+                with self.subTest(engine = engine, key = key):
+                    numpy.testing.assert_array_equal(pruned[:, i], full[:, i])
+
+    def test_dips(self):
+        # Give the points some elevations, some of which dip the horizon by
+        # more than the tolerance and some of which do not ...
+        dipTol = 0.1                                                            # [°]
+        rng = numpy.random.default_rng(0)
+        elevs = rng.uniform(0.0, 20.0, self.coords.shape[0])                    # [m]
+        dips = bots.calc_horizon_dip(elevs)                                     # [°]
+        self.assertTrue((dips <= dipTol).any() and (dips > dipTol).any())
+
+        # Find the pruned points ...
+        inds = self.prune(dips = dips.tolist())
+        coords = numpy.column_stack((self.coords, elevs))                       # [°], [°], [m]
+
+        # Find the tolerance ...
+        # NOTE: A pruned point was pruned as though it were at sea level, so
+        #       its sunrises and sunsets may be earlier (or later) than those
+        #       of the point which replaced it by as much as the Sun takes to
+        #       move its dip in altitude, which is "dipTol / 15" hours divided
+        #       by "cos(lat) × cos(dec) × sin(hour angle)". The worst case is
+        #       at the most polar point at a solstice.
+        lat = math.radians(numpy.abs(self.coords[:, 1]).max())                  # [rad]
+        dec = math.radians(23.44)                                               # [rad]
+        alt = math.radians(-(37.25 + 16.0) / 60.0 - dipTol)                     # [rad]
+        cosHa = (math.sin(alt) + math.sin(lat) * math.sin(dec)) / (math.cos(lat) * math.cos(dec))
+        tol = 3600.0 * (dipTol / 15.0) / (math.cos(lat) * math.cos(dec) * math.sqrt(1.0 - cosHa ** 2)) # [s]
+
+        # Loop over engines ...
+        for engine, calc_sun in [("ephem", bots.calc_sun_ephem), ("numpy", bots.calc_sun_numpy)]:
+            # Find the extreme sunrises and sunsets of all of the points and of
+            # the pruned points ...
+            full = self.survey(lambda d0, n: numpy.column_stack(calc_sun(coords, d0, n)), engine)   # [s]
+            pruned = self.survey(lambda d0, n: numpy.column_stack(calc_sun(coords[inds, :], d0, n)), engine)    # [s]
+
+            # Check that they agree on every day ...
+            for i, key in enumerate(["risMin", "risMax", "setMin", "setMax"]):
+                with self.subTest(engine = engine, key = key):
+                    self.assertLessEqual(numpy.abs(pruned[:, i] - full[:, i]).max(), tol)
+
+    def test_twilight_horizons(self):
+        # Create a database of just this territory (along with its pruned
+        # points) ...
+        inds = self.prune()
+        territories = {
+            "Falkland Islands" : {
+                        "coords" : self.coords.tolist(),
+                "extremalCoords" : self.coords[inds, :].tolist(),
+                     "countries" : ["Falkland Is."],
+            },
+        }
+
+        # Loop over engines ...
+        # NOTE: Astronomical twilight does not end on some summer nights in
+        #       the Falkland Islands, so the pruned points are not exact for
+        #       it (see "calc_sun_territories()").
+        horizons = [None, 0.0, -6.0, -18.0]
+        for engine in ["ephem", "numpy"]:
+            # Find the extreme sunrises and sunsets, and twilights, of all of
+            # the points and of the pruned points ...
+            full = self.survey(lambda d0, n: bots.calc_sun_territories(territories, d0, n, engine = engine, horizons = horizons, prune = False)["Falkland Islands"], engine, step = 28)   # [s]
+            pruned = self.survey(lambda d0, n: bots.calc_sun_territories(territories, d0, n, engine = engine, horizons = horizons, prune = True)["Falkland Islands"], engine, step = 28)  # [s]
+
+            # Check that they are identical on every day ...
+            for j, horizon in enumerate(horizons):
+                for i, key in enumerate(["risMin", "risMax", "setMin", "setMax"]):
+                    with self.subTest(engine = engine, horizon = horizon, key = key):
+                        numpy.testing.assert_array_equal(pruned[:, i, j], full[:, i, j])
+
+# Run the tests ...
+if __name__ == "__main__":
+    unittest.main()